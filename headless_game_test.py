@@ -19,8 +19,6 @@ from typing import List, Dict, Optional
 # Mock Ursina components for headless testing
 class MockEntity:
     def __init__(self, **kwargs):
-        for k, v in kwargs.items():
-            setattr(self, k, v)
         self.enabled = True
         self.position = MockVec3(0, 0, 0)
         self.rotation = MockVec3(0, 0, 0)
@@ -28,7 +26,19 @@ class MockEntity:
         self.color = None
         self.model = None
         self.parent = None
+        # Constructor arguments win over the defaults above (Entity(position=...) etc.)
+        for k, v in kwargs.items():
+            setattr(self, k, v)
         
+    def __setattr__(self, name, value):
+        # Mirror Ursina: scale/position/rotation accept numbers and tuples
+        if name in ('position', 'rotation', 'scale') and not isinstance(value, MockVec3):
+            if isinstance(value, (int, float)):
+                value = MockVec3(value, value, value) if name == 'scale' else MockVec3(value, 0, 0)
+            elif isinstance(value, (tuple, list)):
+                value = MockVec3(*(list(value) + [0, 0, 0])[:3])
+        object.__setattr__(self, name, value)
+
     def update(self): 
         pass
         
@@ -75,6 +85,16 @@ class MockVec3:
     def __str__(self):
         return f'Vec3({self.x:.1f}, {self.y:.1f}, {self.z:.1f})'
 
+class MockMesh:
+    def __init__(self, vertices=None, mode='triangle', thickness=1, static=True, **kwargs):
+        self.vertices = list(vertices or [])
+        self.mode = mode
+        self.thickness = thickness
+        self.static = static
+        
+    def generate(self):
+        pass
+
 class MockTime:
     def __init__(self):
         self.dt = 0.016  # 60 FPS
@@ -92,25 +112,44 @@ class MockApp:
     def run(self):
         pass
 
+class MockColorValue(str):
+    """Named colour that supports the Ursina colour helpers used by the game."""
+    def tint(self, amount):
+        return MockColorValue(f"{self}_tinted")
+
 class MockColor:
     def __init__(self):
-        self.red = "red"
-        self.green = "green"
-        self.blue = "blue"
-        self.white = "white"
-        self.yellow = "yellow"
-        self.orange = "orange"
-        self.cyan = "cyan"
-        self.light_gray = "light_gray"
-        self.dark_gray = "dark_gray"
-        self.gray = "gray"
-        self.black = "black"
-        self.black66 = "black66"
-        self.azure = MockAzure()
-
-class MockAzure:
-    def tint(self, amount):
-        return "azure_tinted"
+        self.red = MockColorValue("red")
+        self.green = MockColorValue("green")
+        self.blue = MockColorValue("blue")
+        self.white = MockColorValue("white")
+        self.yellow = MockColorValue("yellow")
+        self.orange = MockColorValue("orange")
+        self.cyan = MockColorValue("cyan")
+        self.light_gray = MockColorValue("light_gray")
+        self.dark_gray = MockColorValue("dark_gray")
+        self.gray = MockColorValue("gray")
+        self.black = MockColorValue("black")
+        self.black66 = MockColorValue("black66")
+        self.azure = MockAzure("azure")
+
+    def __getattr__(self, name):
+        # Any other named colour (gold, lime, violet, ...) resolves to a tintable value
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return MockColorValue(name)
+
+    def rgb(self, *args):
+        return MockColorValue("rgb")
+
+    def rgba(self, *args):
+        return MockColorValue("rgba")
+
+    def random_color(self):
+        return MockColorValue("random")
+
+class MockAzure(MockColorValue):
+    pass
 
 class MockCamera:
     def __init__(self):
@@ -123,6 +123,12 @@ if HEADLESS_MODE:
         # 2D vector class (using Vec3 as mock since 2D is just 3D with Z=0)
         Vec2 = headless_game_test.MockVec3  # Use Vec3 as Vec2 mock
         
+        # 4D vector class (only used for light/colour values, which mocks ignore)
+        Vec4 = lambda *args: tuple(args)
+        
+        # Procedural mesh (ship trails are drawn as one dynamic point mesh)
+        Mesh = headless_game_test.MockMesh
+        
         # Time management system for game timing and updates
         time = headless_game_test.MockTime()
         
@@ -817,8 +823,8 @@ if HEADLESS_MODE:
         app = MockApp()
         
         # Add missing color attributes to avoid runtime errors
-        color.dark_gray = "dark_gray"
-        color.gray = "gray"
+        color.dark_gray = headless_game_test.MockColorValue("dark_gray")
+        color.gray = headless_game_test.MockColorValue("gray")
         
         logger.info("Headless components loaded successfully")
         GRAPHICS_AVAILABLE = False
@@ -914,7 +920,18 @@ import random
 import math
 import json
 import pickle
+import copy
+import struct
+import zlib
+from array import array
+import threading
 from datetime import datetime
+from time import perf_counter
+import heapq
+import re
+import weakref
+from collections import deque
+from itertools import islice
 
 # Make numpy optional for headless mode demo
 try:
@@ -930,6 +947,336 @@ from typing import List, Dict, Optional
 
 # App will be created in the appropriate section based on mode
 
+# ===== SIMULATION CLOCK =====
+
+class SimClock:
+    """Fixed-timestep simulation clock.
+
+    Real frame time is fed into an accumulator and released as fixed ticks, so
+    economy/transport/military updates see the same dt regardless of frame rate
+    or hitches. Simulation code reads `sim_clock.now` and `sim_clock.dt` instead
+    of `time.time()` and `time.dt`. Outside of a tick `dt` is 0, so entity hooks
+    the engine calls once per frame do not advance the simulation on their own.
+    """
+
+    MIN_TIME_SCALE = 0.0
+    MAX_TIME_SCALE = 1000.0
+
+    def __init__(self, tick_seconds=1.0 / 30.0, time_scale=1.0, max_ticks_per_frame=None):
+        self.tick_seconds = float(tick_seconds)
+        self.time_scale = float(time_scale)
+        self.max_ticks_per_frame = int(max_ticks_per_frame or self.ticks_for_max_scale())
+        self.capped = False  # Last advance() hit max_ticks_per_frame and dropped sim time
+        # Seeded from wall time so timestamps stored before the clock existed stay comparable
+        self.now = time.time()
+        self.dt = 0.0
+        self.tick_count = 0
+        self.accumulator = 0.0
+        self.dropped_seconds = 0.0  # Sim time discarded when a frame wanted more than max ticks
+
+    def set_time_scale(self, scale):
+        scale = float(scale)
+        if scale != scale:  # NaN guard
+            return
+        self.time_scale = max(self.MIN_TIME_SCALE, min(self.MAX_TIME_SCALE, scale))
+
+    def ticks_for_max_scale(self, fps=60.0) -> int:
+        """Ticks per frame needed to run MAX_TIME_SCALE at `fps` without dropping time"""
+        return max(1, int(math.ceil(self.MAX_TIME_SCALE / (self.tick_seconds * fps))))
+
+    def get_scale_label(self) -> str:
+        label = f"x{self.time_scale:g}"
+        return f"{label} (capped)" if self.capped else label
+
+    def advance(self, real_dt) -> int:
+        """Accumulate real elapsed seconds and return how many ticks are due."""
+        try:
+            real_dt = max(0.0, float(real_dt))
+        except Exception:
+            real_dt = 0.0
+        self.accumulator += real_dt * self.time_scale
+        due = int(self.accumulator / self.tick_seconds)
+        if due > self.max_ticks_per_frame:
+            # Drop the backlog instead of spiralling: the sim slows down rather than stalls
+            self.dropped_seconds += (due - self.max_ticks_per_frame) * self.tick_seconds
+            due = self.max_ticks_per_frame
+            self.accumulator = 0.0
+            self.capped = True
+        else:
+            self.accumulator -= due * self.tick_seconds
+            self.capped = False
+        return due
+
+    def begin_tick(self):
+        self.dt = self.tick_seconds
+        self.now += self.tick_seconds
+        self.tick_count += 1
+
+    def end_frame(self):
+        self.dt = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick left in the accumulator (for render interpolation)."""
+        return self.accumulator / self.tick_seconds if self.tick_seconds > 0 else 0.0
+
+sim_clock = SimClock()
+
+# ===== SCHEDULER =====
+
+class ScheduledJob:
+    """Handle for a job registered with a Scheduler; call cancel() to stop it."""
+
+    __slots__ = ('name', 'callback', 'interval', 'jitter', 'due', 'owner', 'cancelled', 'runs')
+
+    def __init__(self, name, callback, interval, jitter, due, owner):
+        self.name = name
+        self.callback = callback
+        self.interval = interval  # None for one-shot jobs; a number or zero-arg callable otherwise
+        self.jitter = jitter
+        self.due = due
+        self.owner = owner
+        self.cancelled = False
+        self.runs = 0
+
+    def cancel(self):
+        self.cancelled = True
+
+class Scheduler:
+    """Min-heap of timed jobs, so idle timers cost nothing until they are due.
+
+    Recurring jobs are rescheduled with +/- `jitter` (a fraction of the interval)
+    and start at a random offset by default, which spreads periodic work from many
+    planets across frames instead of firing it all on the same tick. Cancelled jobs
+    are dropped lazily when they reach the top of the heap.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock  # Zero-arg callable returning the current time
+        self._heap = []
+        self._seq = 0
+        self.failures = 0
+
+    def __len__(self):
+        return sum(1 for _, _, job in self._heap if not job.cancelled)
+
+    def _push(self, job):
+        self._seq += 1
+        heapq.heappush(self._heap, (job.due, self._seq, job))
+        return job
+
+    @staticmethod
+    def _interval(job):
+        interval = job.interval() if callable(job.interval) else job.interval
+        return max(0.0, float(interval))
+
+    def every(self, interval, callback, jitter=0.1, first_delay=None, name=None, owner=None):
+        """Run `callback` every `interval` seconds; the first run defaults to a random offset."""
+        job = ScheduledJob(name or getattr(callback, '__name__', 'job'), callback,
+                           interval, max(0.0, float(jitter)), 0.0, owner)
+        if first_delay is None:
+            first_delay = random.uniform(0.0, self._interval(job))
+        job.due = self.clock() + max(0.0, float(first_delay))
+        return self._push(job)
+
+    def after(self, delay, callback, name=None, owner=None):
+        """Run `callback` once, `delay` seconds from now."""
+        job = ScheduledJob(name or getattr(callback, '__name__', 'job'), callback,
+                           None, 0.0, self.clock() + max(0.0, float(delay)), owner)
+        return self._push(job)
+
+    def cancel_owner(self, owner):
+        """Cancel every job registered with `owner` (e.g. an economy being replaced)."""
+        for _, _, job in self._heap:
+            if job.owner is owner:
+                job.cancelled = True
+
+    def next_due(self):
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def run_due(self, now=None) -> int:
+        """Run every job due at or before `now`; returns how many ran."""
+        if now is None:
+            now = self.clock()
+        ran = 0
+        heap = self._heap
+        requeue = []  # Pushed after the loop so a zero-interval job runs once per call
+        while heap and heap[0][0] <= now:
+            _, _, job = heapq.heappop(heap)
+            if job.cancelled:
+                continue
+            try:
+                job.callback()
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"Scheduled job {job.name} failed: {e}", exc_info=True)
+            job.runs += 1
+            ran += 1
+            if job.interval is None or job.cancelled:
+                continue
+            interval = self._interval(job)
+            spread = interval * job.jitter
+            next_due = job.due + interval
+            if next_due <= now:
+                # Fell behind (long pause or clock jump): resume from now rather than replaying
+                next_due = now + interval
+            job.due = next_due + (random.uniform(-spread, spread) if spread else 0.0)
+            requeue.append(job)
+        for job in requeue:
+            self._push(job)
+        return ran
+
+# Jobs measured in simulation seconds (driven once per fixed tick) and in wall seconds (once per frame)
+sim_scheduler = Scheduler(lambda: sim_clock.now)
+frame_scheduler = Scheduler(lambda: time.time())
+
+# ===== SPATIAL INDEX =====
+
+class SpatialHashGrid:
+    """Uniform grid over the XZ plane for radius and k-nearest queries on moving objects.
+
+    Objects are keyed by identity and tagged with an optional `kind` so one index can
+    hold several ship lists. `update()` only touches buckets when an object changes cell.
+    """
+
+    def __init__(self, cell_size=100.0):
+        self.cell_size = float(cell_size)
+        self._cells = {}    # (ix, iz) -> {id(obj): obj}
+        self._entries = {}  # id(obj) -> [obj, cell, x, y, z, kind]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self._entries
+
+    def _cell_of(self, x, z):
+        return (int(math.floor(x / self.cell_size)), int(math.floor(z / self.cell_size)))
+
+    def update(self, obj, position, kind=None):
+        """Insert an object or move it to its new position"""
+        try:
+            x, y, z = float(position.x), float(position.y), float(position.z)
+        except Exception:
+            return
+        self.move(obj, x, y, z, kind)
+
+    def move(self, obj, x, y, z, kind=None):
+        """Same as update() but from raw coordinates"""
+        key = id(obj)
+        cell = self._cell_of(x, z)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = [obj, cell, x, y, z, kind]
+            self._cells.setdefault(cell, {})[key] = obj
+            return
+        if entry[1] != cell:
+            self._drop_from_cell(key, entry[1])
+            self._cells.setdefault(cell, {})[key] = obj
+            entry[1] = cell
+        entry[2], entry[3], entry[4] = x, y, z
+        if kind is not None:
+            entry[5] = kind
+
+    def remove(self, obj):
+        entry = self._entries.pop(id(obj), None)
+        if entry is not None:
+            self._drop_from_cell(id(obj), entry[1])
+
+    def retain(self, live_ids):
+        """Drop every object whose id() is not in `live_ids`"""
+        for key in [k for k in self._entries if k not in live_ids]:
+            entry = self._entries.pop(key)
+            self._drop_from_cell(key, entry[1])
+
+    def clear(self):
+        self._cells.clear()
+        self._entries.clear()
+
+    def _drop_from_cell(self, key, cell):
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def _candidates(self, x, z, radius):
+        """Buckets that can hold objects within `radius` of (x, z)"""
+        cs = self.cell_size
+        ix0, iz0 = self._cell_of(x - radius, z - radius)
+        ix1, iz1 = self._cell_of(x + radius, z + radius)
+        if (ix1 - ix0 + 1) * (iz1 - iz0 + 1) > len(self._cells):
+            # Query box covers more cells than are occupied: walk the occupied ones
+            return [b for (ix, iz), b in self._cells.items() if ix0 <= ix <= ix1 and iz0 <= iz <= iz1]
+        buckets = []
+        for ix in range(ix0, ix1 + 1):
+            for iz in range(iz0, iz1 + 1):
+                bucket = self._cells.get((ix, iz))
+                if bucket:
+                    buckets.append(bucket)
+        return buckets
+
+    def query_radius(self, position, radius, kinds=None, nearest_first=False):
+        """Objects within `radius` of `position`, optionally filtered by kind"""
+        try:
+            px, py, pz = float(position.x), float(position.y), float(position.z)
+        except Exception:
+            return []
+        r2 = radius * radius
+        found = []
+        for bucket in self._candidates(px, pz, radius):
+            for key in bucket:
+                _, _, x, y, z, kind = entry = self._entries[key]
+                if kinds is not None and kind not in kinds:
+                    continue
+                d2 = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+                if d2 <= r2:
+                    found.append((d2, entry[0]))
+        if nearest_first:
+            found.sort(key=lambda item: item[0])
+        return [obj for _, obj in found]
+
+    def nearest(self, position, k=1, max_radius=None, kinds=None):
+        """Up to `k` nearest objects, searching outward one ring of cells at a time"""
+        if max_radius is not None:
+            # Bounded search: a single box query is cheaper than walking rings
+            return self.query_radius(position, max_radius, kinds=kinds, nearest_first=True)[:k]
+        try:
+            px, py, pz = float(position.x), float(position.y), float(position.z)
+        except Exception:
+            return []
+        cx, cz = self._cell_of(px, pz)
+        best = []  # (d2, obj)
+        visited = 0
+        ring = 0
+        while visited < len(self._cells):
+            # Everything outside rings 0..ring-1 is at least (ring - 1) cells away
+            reach = max(0, ring - 1) * self.cell_size
+            if max_radius is not None and reach > max_radius:
+                break
+            if len(best) >= k and best[k - 1][0] <= reach * reach:
+                break
+            for ix in range(cx - ring, cx + ring + 1):
+                for iz in range(cz - ring, cz + ring + 1):
+                    if ring and abs(ix - cx) != ring and abs(iz - cz) != ring:
+                        continue  # interior cells were done on earlier rings
+                    bucket = self._cells.get((ix, iz))
+                    if not bucket:
+                        continue
+                    visited += 1
+                    for key in bucket:
+                        _, _, x, y, z, kind = entry = self._entries[key]
+                        if kinds is not None and kind not in kinds:
+                            continue
+                        d2 = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+                        if max_radius is None or d2 <= max_radius * max_radius:
+                            best.append((d2, entry[0]))
+            best.sort(key=lambda item: item[0])
+            ring += 1
+        return [obj for _, obj in best[:k]]
+
 # ===== ENHANCED PIRATES! FEATURES =====
 
 class ShipClass(Enum):
@@ -1730,7 +2077,7 @@ class MarketSystem:
             # Define contraband by faction policy (simplified)
             strict_factions = {'terran_federation', 'mars_republic'}
             contraband = {'weapons', 'narcotics'}
-            planet_faction = getattr(next((p for p in planets if getattr(p, 'name', None) == planet_name), None), 'faction_id', None)
+            planet_faction = getattr(world_registry.planet(planet_name), 'faction_id', None)
             if planet_faction in strict_factions and not is_player_buying and commodity_name in contraband:
                 # Random scan chance influenced by heat
                 base_scan = 0.15
@@ -2408,6 +2755,9 @@ class WeatherEvent:
 class MilitaryShip(Entity):
     """Physical military ships that enforce faction control"""
     
+    # Per-mission attributes callers attach after spawning; cleared when a pooled hull is reused
+    TRANSIENT_ATTRS = ('_despawn_time', 'blockaded_planet')
+    
     def __init__(self, faction_id, ship_type, position, patrol_radius=100):
         super().__init__(
             model='cube',
@@ -2415,7 +2765,26 @@ class MilitaryShip(Entity):
             scale=(1.5, 0.8, 3.0),  # Military ship shape
             color=self.get_faction_color(faction_id)
         )
-        
+        self.reset(faction_id, ship_type, position, patrol_radius)
+        
+    @classmethod
+    def spawn(cls, faction_id, ship_type, position, patrol_radius=100):
+        """New military ship, reusing a pooled hull when one is free"""
+        ship = entity_pool.take('military_ship')
+        if ship is None:
+            ship = cls(faction_id, ship_type, position, patrol_radius)
+            ship._pool_kind = 'military_ship'
+            return ship
+        ship.reset(faction_id, ship_type, position, patrol_radius)
+        return ship
+        
+    def reset(self, faction_id, ship_type, position, patrol_radius=100):
+        """(Re)initialize all per-ship state"""
+        for attr in self.TRANSIENT_ATTRS:
+            if hasattr(self, attr):
+                delattr(self, attr)
+        self.position = position
+        self.color = self.get_faction_color(faction_id)
         self.faction_id = faction_id
         self.ship_type = ship_type
         self.patrol_radius = patrol_radius
@@ -2450,7 +2819,7 @@ class MilitaryShip(Entity):
         
     def update(self):
         if not paused:
-            current_time = time.time()
+            current_time = sim_clock.now
             
             # Patrol behavior
             if self.ship_type == MilitaryShipType.PATROL:
@@ -2463,7 +2832,7 @@ class MilitaryShip(Entity):
             # Move toward target
             if hasattr(self, 'target_position'):
                 direction = (self.target_position - self.position).normalized()
-                self.position += direction * self.speed * time.dt
+                self.position += direction * self.speed * sim_clock.dt
                 
             # Check for hostiles
             self.check_for_hostiles()
@@ -2493,14 +2862,11 @@ class MilitaryShip(Entity):
         if self.follow_player and scene_manager.current_state == GameState.SPACE and scene_manager.space_controller:
             self.target_position = scene_manager.space_controller.position + self._follow_offset
             return
-        # Otherwise, find nearby friendly cargo ships to escort
-        for cargo_ship in unified_transport_system.cargo_ships:
-            if hasattr(cargo_ship, 'position'):
-                distance = (self.position - cargo_ship.position).length()
-                if distance < 150:
-                    follow_pos = getattr(cargo_ship, 'current_target_pos', cargo_ship.position)
-                    self.target_position = follow_pos + Vec3(8, 0, 8)
-                    return
+        # Otherwise, find the nearest cargo ship to escort
+        for cargo_ship in unified_transport_system.spatial_index.nearest(self.position, k=1, max_radius=150, kinds=('cargo',)):
+            follow_pos = getattr(cargo_ship, 'current_target_pos', cargo_ship.position)
+            self.target_position = follow_pos + Vec3(8, 0, 8)
+            return
                     
     def check_for_hostiles(self):
         """Check for hostile ships and player"""
@@ -2515,15 +2881,12 @@ class MilitaryShip(Entity):
                     self.engage_target(player_pos, "Player")
                     
         # Check for hostile faction ships
-        all_ships = (unified_transport_system.cargo_ships + unified_transport_system.raiders + 
-                    unified_transport_system.message_ships)
-        
-        for ship in all_ships:
-            if hasattr(ship, 'position') and hasattr(ship, 'faction_id'):
-                if ship.faction_id in self.hostile_factions:
-                    distance = (self.position - ship.position).length()
-                    if distance < self.engagement_range:
-                        self.engage_target(ship.position, f"{ship.faction_id} ship")
+        nearby = unified_transport_system.spatial_index.query_radius(
+            self.position, self.engagement_range, kinds=('cargo', 'raider', 'message'))
+        
+        for ship in nearby:
+            if hasattr(ship, 'faction_id') and ship.faction_id in self.hostile_factions:
+                self.engage_target(ship.position, f"{ship.faction_id} ship")
                         
     def engage_target(self, target_pos, target_name):
         """Engage hostile target"""
@@ -2540,17 +2903,17 @@ class MilitaryShip(Entity):
                 print(f"💥 Military ship hit player for {damage} damage!")
             else:
                 # Attempt to damage nearby hostile transport ships
-                for cs in unified_transport_system.cargo_ships + unified_transport_system.raiders + unified_transport_system.message_ships:
+                for cs in unified_transport_system.spatial_index.query_radius(
+                        self.position, 25, kinds=('cargo', 'raider', 'message'), nearest_first=True):
                     try:
-                        if (cs.position - self.position).length() < 25:
-                            if hasattr(cs, 'take_damage'):
-                                dmg = random.randint(8, 20)
-                                cs.take_damage(dmg)
-                                # FX: laser beam and impact
-                                LaserFX.spawn_beam(self.position, cs.position, beam_color=color.red)
-                                LaserFX.spawn_impact(cs.position, fx_color=color.yellow)
-                                print(f"💥 {self.faction_id} hit hostile ship for {dmg} damage")
-                                break
+                        if hasattr(cs, 'take_damage'):
+                            dmg = random.randint(8, 20)
+                            cs.take_damage(dmg)
+                            # FX: laser beam and impact
+                            LaserFX.spawn_beam(self.position, cs.position, beam_color=color.red)
+                            LaserFX.spawn_impact(cs.position, fx_color=color.yellow)
+                            print(f"💥 {self.faction_id} hit hostile ship for {dmg} damage")
+                            break
                     except Exception:
                         continue
             
@@ -2559,21 +2922,17 @@ class WeatherSystem:
     
     def __init__(self):
         self.active_weather = []
-        self.last_weather_spawn = 0
         self.weather_spawn_interval = 180  # 3 minutes between weather events
+        # Wide jitter keeps arrivals unpredictable without rolling a chance every tick
+        self._spawn_job = sim_scheduler.every(self.weather_spawn_interval, self.spawn_weather_event,
+                                              jitter=0.25, name='weather_spawn', owner=self)
         
     def update(self):
-        current_time = time.time()
+        current_time = sim_clock.now
         
         # Remove expired weather
         self.active_weather = [w for w in self.active_weather 
                              if current_time - w.start_time < w.duration]
-        
-        # Spawn new weather events
-        if current_time - self.last_weather_spawn > self.weather_spawn_interval:
-            if random.random() < 0.3:  # 30% chance
-                self.spawn_weather_event()
-                self.last_weather_spawn = current_time
                 
         # Update weather effects
         self.apply_weather_effects()
@@ -2602,7 +2961,7 @@ class WeatherSystem:
             radius=radius,
             intensity=intensity,
             duration=duration,
-            start_time=time.time()
+            start_time=sim_clock.now
         )
         
         self.active_weather.append(weather_event)
@@ -2654,6 +3013,8 @@ class FactionMilitaryManager:
     
     def __init__(self):
         self.military_ships = []
+        # Proximity/membership index over military_ships, refreshed each update
+        self.spatial_index = SpatialHashGrid(cell_size=100.0)
         self.territorial_claims = {}  # faction_id -> list of planet names
         self.active_conflicts = []  # list of (faction1, faction2, conflict_type)
         self.blockade_zones = {}  # planet_name -> list of blockading ships
@@ -2674,7 +3035,7 @@ class FactionMilitaryManager:
                     random.uniform(-300, 300)
                 )
                 
-                patrol_ship = MilitaryShip(faction_id, MilitaryShipType.PATROL, position)
+                patrol_ship = MilitaryShip.spawn(faction_id, MilitaryShipType.PATROL, position)
                 self.military_ships.append(patrol_ship)
                 
         # Establish territorial claims
@@ -2733,13 +3094,7 @@ class FactionMilitaryManager:
                     
     def establish_blockade(self, faction_id, planet_name):
         """Establish a physical blockade around a planet"""
-        # Find the planet
-        target_planet = None
-        for planet in planets:
-            if planet.name == planet_name:
-                target_planet = planet
-                break
-                
+        target_planet = world_registry.planet(planet_name)
         if not target_planet:
             return
             
@@ -2757,28 +3112,32 @@ class FactionMilitaryManager:
                 distance * math.sin(angle)
             )
             
-            blockade_ship = MilitaryShip(faction_id, MilitaryShipType.BLOCKADE, position)
+            blockade_ship = MilitaryShip.spawn(faction_id, MilitaryShipType.BLOCKADE, position)
             blockade_ship.blockaded_planet = target_planet
             blockade_ships.append(blockade_ship)
             self.military_ships.append(blockade_ship)
             
         self.blockade_zones[planet_name] = blockade_ships
+        self._notify_blockade(planet_name, True)
         
         print(f"🚫 {faction_id} established blockade around {planet_name} with {num_ships} ships")
         
     def update(self):
         """Update all military operations"""
         # Update all military ships
+        live = set()
         for ship in self.military_ships[:]:
             ship.update()
             # Despawn temporary escorts when timer expires
             try:
-                if hasattr(ship, '_despawn_time') and time.time() > ship._despawn_time:
-                    self.military_ships.remove(ship)
-                    destroy(ship)
+                if hasattr(ship, '_despawn_time') and sim_clock.now > ship._despawn_time:
+                    self.despawn(ship)
                     continue
             except Exception:
                 pass
+            self.spatial_index.update(ship, ship.position, ship.faction_id)
+            live.add(id(ship))
+        self.spatial_index.retain(live)
             
         # Check for blockade effectiveness
         self.update_blockades()
@@ -2788,9 +3147,9 @@ class FactionMilitaryManager:
         
     def update_blockades(self):
         """Update blockade status and prevent access"""
-        for planet_name, blockade_ships in self.blockade_zones.items():
+        for planet_name, blockade_ships in list(self.blockade_zones.items()):
             # Remove destroyed ships
-            active_ships = [ship for ship in blockade_ships if ship in self.military_ships]
+            active_ships = [ship for ship in blockade_ships if ship in self.spatial_index]
             
             if len(active_ships) < len(blockade_ships):
                 self.blockade_zones[planet_name] = active_ships
@@ -2799,6 +3158,7 @@ class FactionMilitaryManager:
             if not active_ships:
                 print(f"🔓 Blockade around {planet_name} has been broken!")
                 del self.blockade_zones[planet_name]
+                self._notify_blockade(planet_name, False)
                 
     def update_conflicts(self):
         """Update ongoing conflicts"""
@@ -2824,7 +3184,7 @@ class FactionMilitaryManager:
                 random.uniform(-200, 200)
             )
             
-            assault_ship = MilitaryShip(faction_id, MilitaryShipType.ASSAULT, position)
+            assault_ship = MilitaryShip.spawn(faction_id, MilitaryShipType.ASSAULT, position)
             self.military_ships.append(assault_ship)
             
     def resolve_conflict(self, faction1, faction2):
@@ -2841,20 +3201,36 @@ class FactionMilitaryManager:
         for planet_name, blockade_ships in self.blockade_zones.items():
             if blockade_ships and blockade_ships[0].faction_id in [faction1, faction2]:
                 # Check if blockading the other faction's planet
-                for planet in planets:
-                    if (planet.name == planet_name and 
-                        hasattr(planet, 'faction_id') and 
-                        planet.faction_id in [faction1, faction2]):
-                        to_remove.append(planet_name)
-                        break
+                planet = world_registry.planet(planet_name)
+                if planet is not None and getattr(planet, 'faction_id', None) in [faction1, faction2]:
+                    to_remove.append(planet_name)
                         
         for planet_name in to_remove:
             for ship in self.blockade_zones[planet_name]:
                 if ship in self.military_ships:
-                    self.military_ships.remove(ship)
-                    destroy(ship)
+                    self.despawn(ship)
             del self.blockade_zones[planet_name]
+            self._notify_blockade(planet_name, False)
             
+    def _notify_blockade(self, planet_name, blockaded):
+        """Tell the route planner a planet became (un)passable"""
+        try:
+            route_planner.blockade_changed(planet_name, blockaded)
+        except Exception:
+            pass
+            
+    def despawn(self, ship):
+        """Take a ship out of service and park its hull in entity_pool for reuse"""
+        if ship in self.military_ships:
+            self.military_ships.remove(ship)
+        self.spatial_index.remove(ship)
+        entity_pool.release(ship, kind='military_ship')
+            
+    def ships_near(self, position, radius, faction_id=None):
+        """Military ships within radius, nearest first (optionally one faction only)"""
+        kinds = (faction_id,) if faction_id else None
+        return self.spatial_index.query_radius(position, radius, kinds=kinds, nearest_first=True)
+        
     def is_planet_blockaded(self, planet_name):
         """Check if a planet is currently blockaded"""
         return planet_name in self.blockade_zones and len(self.blockade_zones[planet_name]) > 0
@@ -2914,6 +3290,25 @@ class Contract:
     completion_time: float = None
     metadata: dict = None
     
+def serialize_contract(c: Contract):
+    return {
+        'contract_id': c.contract_id,
+        'mission_type': c.mission_type.value,
+        'client_faction': c.client_faction,
+        'title': c.title,
+        'description': c.description,
+        'objectives': copy.deepcopy(c.objectives),
+        'rewards': copy.deepcopy(c.rewards),
+        'penalties': copy.deepcopy(c.penalties),
+        'time_limit': c.time_limit,
+        'difficulty': c.difficulty,
+        'requirements': copy.deepcopy(c.requirements),
+        'status': c.status.value,
+        'start_time': c.start_time,
+        'completion_time': c.completion_time,
+        'metadata': copy.deepcopy(c.metadata),
+    }
+
 class DynamicContractSystem:
     """Generates contracts based on current galaxy state"""
     
@@ -2921,17 +3316,21 @@ class DynamicContractSystem:
         self.available_contracts = []
         self.active_contracts = []
         self.completed_contracts = []
-        self.last_generation = 0
         self.generation_interval = 120  # 2 minutes
-        
+        # First batch on the first tick, then periodically
+        self._generation_job = sim_scheduler.every(self.generation_interval, self.generate_contracts,
+                                                   first_delay=0, name='contract_generation', owner=self)
+        
+    def archive_completed(self, keep):
+        """Drop all but the newest `keep` finished contracts; returns the dropped ones serialized"""
+        overflow = len(self.completed_contracts) - max(0, keep)
+        if overflow <= 0:
+            return []
+        dropped = self.completed_contracts[:overflow]
+        del self.completed_contracts[:overflow]
+        return [serialize_contract(c) for c in dropped]
+
     def update(self):
-        current_time = time.time()
-        
-        # Generate new contracts periodically
-        if current_time - self.last_generation > self.generation_interval:
-            self.generate_contracts()
-            self.last_generation = current_time
-            
         # Update active contracts
         self.update_active_contracts()
         
@@ -3016,7 +3415,7 @@ class DynamicContractSystem:
                 'ship_components': ['SHIELDS', 'WEAPONS']
             },
             status=ContractStatus.AVAILABLE,
-            start_time=time.time(),
+            start_time=sim_clock.now,
             metadata={'dest': planet_name}
         )
         
@@ -3072,7 +3471,7 @@ class DynamicContractSystem:
                 'ship_components': ['WEAPONS', 'SHIELDS']
             },
             status=ContractStatus.AVAILABLE,
-            start_time=time.time(),
+            start_time=sim_clock.now,
             metadata={'dest': cargo_ship.destination_planet}
         )
         
@@ -3112,7 +3511,7 @@ class DynamicContractSystem:
             difficulty=2,
             requirements={'cargo_capacity': qty},
             status=ContractStatus.AVAILABLE,
-            start_time=time.time(),
+            start_time=sim_clock.now,
             metadata={'timed': True, 'commodity': commodity, 'quantity': qty, 'origin': origin.name, 'dest': dest.name}
         )
         self.available_contracts.append(contract)
@@ -3157,7 +3556,7 @@ class DynamicContractSystem:
                 'ship_components': ['SENSORS', 'FUEL_TANK']
             },
             status=ContractStatus.AVAILABLE,
-            start_time=time.time()
+            start_time=sim_clock.now
         )
         
         self.available_contracts.append(contract)
@@ -3197,7 +3596,7 @@ class DynamicContractSystem:
                 'crew_skills': {'leadership': 3}
             },
             status=ContractStatus.AVAILABLE,
-            start_time=time.time()
+            start_time=sim_clock.now
         )
         
         self.available_contracts.append(contract)
@@ -3245,7 +3644,7 @@ class DynamicContractSystem:
             difficulty=3,
             requirements={'ship_components': ['WEAPONS', 'SHIELDS']},
             status=ContractStatus.AVAILABLE,
-            start_time=time.time(),
+            start_time=sim_clock.now,
             metadata={'target_planet': hotspot.name, 'kills_required': 1, 'kills': 0}
         )
         self.available_contracts.append(contract)
@@ -3292,7 +3691,7 @@ class DynamicContractSystem:
                 'cargo_capacity': quantity
             },
             status=ContractStatus.AVAILABLE,
-            start_time=time.time(),
+            start_time=sim_clock.now,
             metadata={'dest': planet_name, 'commodity': commodity, 'quantity': quantity}
         )
         
@@ -3300,7 +3699,7 @@ class DynamicContractSystem:
         print(f"📋 New supply contract: {contract.title}")
     def update_active_contracts(self):
         """Update progress on active contracts"""
-        current_time = time.time()
+        current_time = sim_clock.now
         
         for contract in self.active_contracts[:]:
             # Check for time limit expiration
@@ -3338,7 +3737,7 @@ class DynamicContractSystem:
         
     def remove_expired_contracts(self):
         """Remove expired available contracts"""
-        current_time = time.time()
+        current_time = sim_clock.now
         self.available_contracts = [
             contract for contract in self.available_contracts
             if current_time - contract.start_time < contract.time_limit
@@ -3360,7 +3759,7 @@ class DynamicContractSystem:
         contract.status = ContractStatus.ACCEPTED
         self.active_contracts.append(contract)
         # Reset start time on accept for fair deadlines
-        contract.start_time = time.time()
+        contract.start_time = sim_clock.now
         
         print(f"✅ Accepted contract: {contract.title}")
         return True
@@ -3416,7 +3815,7 @@ class DynamicContractSystem:
         # Move to completed contracts
         self.active_contracts.remove(contract)
         contract.status = ContractStatus.COMPLETED
-        contract.completion_time = time.time()
+        contract.completion_time = sim_clock.now
         self.completed_contracts.append(contract)
         
         print(f"🎉 Contract completed: {contract.title}")
@@ -3463,6 +3862,16 @@ class UrgencyLevel(Enum):
     URGENT = "URGENT"
     CRITICAL = "CRITICAL"
 
+class NewsEvent(Enum):
+    PIRATE_ATTACK = "PIRATE_ATTACK"
+    BLOCKADE = "BLOCKADE"
+    WAR = "WAR"
+    CARGO_LOST = "CARGO_LOST"
+    PAYMENT_OVERDUE = "PAYMENT_OVERDUE"
+    PAYMENT_LOST = "PAYMENT_LOST"
+    PAYMENT_DELIVERED = "PAYMENT_DELIVERED"
+    RUMOR = "RUMOR"
+
 class ContrabandType(Enum):
     STOLEN_GOODS = "STOLEN_GOODS"
     WEAPONS = "WEAPONS" 
@@ -3514,26 +3923,203 @@ class PlanetaryNews:
     timestamp: float
     reliability: float  # 0.0 to 1.0 - how accurate the news is
     spread_count: int   # How many times it's been passed along
+    events: tuple = ()  # NewsEvent tags assigned when the item is created
+    mentions: tuple = ()  # (kind, id) pairs: ('planet', name), ('faction', id), ('contract', id)
     
 @dataclass
 class WordOfMouthInfo:
-    """Information that spreads through word-of-mouth"""
+    """Information that spreads through word-of-mouth.
+
+    Age and accuracy are derived from sim timestamps when read: accuracy decays by
+    0.95 per 1/60 s for every planet the rumor has spread to, so the decay already
+    accrued is folded into `decay_exponent` whenever `spread_count` changes.
+    """
     info_id: str
     info_type: str  # "war", "pirate_attack", "trade_opportunity", etc.
     content: str
     origin_planet: str
-    current_accuracy: float  # Degrades as it spreads
-    age_hours: float
+    initial_accuracy: float
+    created_at: float
     visited_planets: set
+    spread_count: int = 0
+    decay_exponent: float = 0.0  # spread-count x seconds accrued before decay_since
+    decay_since: float = 0.0
+
+    @property
+    def age_hours(self):
+        return sim_clock.now - self.created_at  # 1 sim second = 1 hour of rumor time
+
+    @property
+    def current_accuracy(self):
+        exponent = self.decay_exponent + self.spread_count * (sim_clock.now - self.decay_since)
+        return self.initial_accuracy * 0.95 ** (exponent * 60.0)
+
+    def is_alive(self):
+        return self.age_hours <= 168 and self.current_accuracy >= 0.3  # 1 week, 30% accuracy
+
+    def record_spread(self, planet_name):
+        now = sim_clock.now
+        self.decay_exponent += self.spread_count * (now - self.decay_since)
+        self.decay_since = now
+        self.spread_count += 1
+        self.visited_planets.add(planet_name)
+
+def serialize_letter(letter: PhysicalLetter):
+    return {
+        'letter_id': letter.letter_id,
+        'message_type': letter.message_type.value,
+        'sender_faction': letter.sender_faction,
+        'sender_planet': letter.sender_planet,
+        'recipient_faction': letter.recipient_faction,
+        'recipient_planet': letter.recipient_planet,
+        'subject': letter.subject,
+        'content': letter.content,
+        'timestamp': letter.timestamp,
+        'urgency': letter.urgency.value,
+        'requires_response': letter.requires_response
+    }
+
+def restore_letter(l: dict):
+    return PhysicalLetter(
+        letter_id=l['letter_id'],
+        message_type=MessageType(l['message_type']),
+        sender_faction=l.get('sender_faction',''),
+        sender_planet=l.get('sender_planet',''),
+        recipient_faction=l.get('recipient_faction',''),
+        recipient_planet=l.get('recipient_planet',''),
+        subject=l.get('subject',''),
+        content=l.get('content',''),
+        timestamp=l.get('timestamp', time.time()),
+        urgency=UrgencyLevel(l.get('urgency','NORMAL')),
+        requires_response=l.get('requires_response', False)
+    )
+
+def serialize_mail(message_type, payload):
+    """One courier item (message type + letter, goods request or notice dict) as JSON-safe data"""
+    entry = {'message_type': getattr(message_type, 'value', message_type)}
+    if isinstance(payload, PhysicalLetter):
+        entry['letter'] = serialize_letter(payload)
+    elif isinstance(payload, GoodsRequest):
+        entry['goods_request'] = {
+            'commodity': payload.commodity,
+            'quantity': payload.quantity,
+            'max_price': payload.max_price,
+            'urgency': payload.urgency.value,
+            'requesting_planet': payload.requesting_planet,
+        }
+    elif isinstance(payload, dict):
+        entry['notice'] = dict(payload)
+    else:
+        return None
+    return entry
+
+def restore_mail(entry: dict):
+    """(message_type, payload) from serialize_mail() output, or None if it cannot be rebuilt"""
+    try:
+        message_type = MessageType(entry['message_type'])
+        if 'letter' in entry:
+            return message_type, restore_letter(entry['letter'])
+        if 'goods_request' in entry:
+            r = entry['goods_request']
+            return message_type, GoodsRequest(
+                commodity=r['commodity'],
+                quantity=r['quantity'],
+                max_price=r['max_price'],
+                urgency=UrgencyLevel(r.get('urgency', 'NORMAL')),
+                requesting_planet=r['requesting_planet'],
+            )
+        if 'notice' in entry:
+            return message_type, dict(entry['notice'])
+    except Exception:
+        pass
+    return None
+
+class ExpiringFeed(dict):
+    """Planet name -> time-ordered deque of letters or news, capped and expiring.
+
+    Items are appended in arrival order, so the oldest is always at the left. Each
+    planet's deque holds at most `capacity` items (the oldest drop off on append), and
+    a heap of (front item's expiry time, planet) lets `expire()` visit only planets
+    whose oldest item is due instead of re-filtering every list.
+    """
+    def __init__(self, ttl, capacity=100):
+        super().__init__()
+        self.ttl = ttl
+        self.capacity = capacity
+        self.on_evict = None  # Optional callback(planet name, item) for items dropped by cap or expiry
+        self._due = []  # (expires_at, planet name); stale entries are re-checked on pop
+
+    def __setitem__(self, planet_name, items):
+        items = items if isinstance(items, deque) else deque(items, maxlen=self.capacity)
+        super().__setitem__(planet_name, items)
+        if items:
+            heapq.heappush(self._due, (items[0].timestamp + self.ttl, planet_name))
+
+    def clear(self):
+        super().clear()
+        self._due.clear()
+
+    def add(self, planet_name, item):
+        items = self.get(planet_name)
+        if items is None:
+            items = deque(maxlen=self.capacity)
+            super().__setitem__(planet_name, items)
+        if not items:
+            heapq.heappush(self._due, (item.timestamp + self.ttl, planet_name))
+        elif len(items) == items.maxlen and self.on_evict is not None:
+            self.on_evict(planet_name, items[0])
+        items.append(item)
+
+    def newest(self, planet_name, count):
+        """Last `count` items for a planet, oldest first"""
+        items = self.get(planet_name)
+        if not items or count <= 0:
+            return []
+        newest = list(islice(reversed(items), count))
+        newest.reverse()
+        return newest
+
+    def expire(self, now):
+        """Drop expired items; touches only planets whose oldest item is due"""
+        removed = 0
+        while self._due and self._due[0][0] <= now:
+            _, planet_name = heapq.heappop(self._due)
+            items = self.get(planet_name)
+            if not items:
+                continue
+            cutoff = now - self.ttl
+            while items and items[0].timestamp <= cutoff:
+                item = items.popleft()
+                removed += 1
+                if self.on_evict is not None:
+                    self.on_evict(planet_name, item)
+            if items:
+                heapq.heappush(self._due, (items[0].timestamp + self.ttl, planet_name))
+        return removed
 
 class PhysicalCommunicationSystem:
     """Handles all physical communication - letters, word-of-mouth, news spreading"""
+
+    THREAT_DECAY_SEC = 86400.0  # Pirate/blockade news weighs 1/e as much after a day
+    MENTION_WINDOW_SEC = 604800.0  # knowledge_reliability averages the last 7 days
+    MENTION_TOKEN = re.compile(r"[A-Za-z_]+(?:-\d+)*")
+    RUMOR_EVENTS = {
+        'pirate_attack': (NewsEvent.PIRATE_ATTACK,),
+        'pirate_warning': (NewsEvent.PIRATE_ATTACK,),
+        'war_declaration': (NewsEvent.WAR,),
+    }
     
     def __init__(self):
         self.active_letters = []  # Letters being delivered by ships
-        self.planetary_mailboxes = {}  # Planet -> list of received letters
-        self.planetary_news = {}  # Planet -> list of news/rumors known
+        self.planetary_mailboxes = ExpiringFeed(ttl=2592000, capacity=200)  # Planet -> received letters, kept 30 days
+        self.planetary_news = ExpiringFeed(ttl=1209600, capacity=100)  # Planet -> news/rumors known, kept 14 days
         self.word_of_mouth_pool = []  # Active rumors spreading
+        self.rumors_by_planet = {}  # Planet -> rumors known there that ships can pick up
+        self._threat = {}  # Planet -> (threat score, sim time it was last rebased to)
+        # Planet -> {mentioned entity: [stored news mentioning it, news within MENTION_WINDOW_SEC, reliability sum of the latter]}
+        self._mentions = {}
+        self.planetary_news.on_evict = self._forget_mentions
+        self._rumor_expiry_job = sim_scheduler.every(10.0, self.expire_rumors, name='rumor_expiry', owner=self)
         self.letter_counter = 0
         
     def send_letter(self, sender_planet, recipient_planet, letter_type, subject, content, urgency=UrgencyLevel.NORMAL, sender_faction="", recipient_faction=""):
@@ -3549,14 +4135,14 @@ class PhysicalCommunicationSystem:
             recipient_planet=getattr(recipient_planet, 'name', str(recipient_planet)),
             subject=subject,
             content=content,
-            timestamp=time.time(),
+            timestamp=sim_clock.now,
             urgency=urgency,
             requires_response=(letter_type in [MessageType.WAR_DECLARATION, MessageType.PEACE_TREATY, MessageType.DIPLOMATIC_LETTER])
         )
         
-        # Create message ship to deliver the letter
-        message_ship = MessageShip(sender_planet, recipient_planet, letter_type, letter)
-        unified_transport_system.message_ships.append(message_ship)
+        # Hand the letter to the next courier on this route
+        courier_dispatcher.send(sender_planet, recipient_planet, letter_type, letter,
+                                urgent=urgency == UrgencyLevel.URGENT)
         
         print(f"📨 {letter_type.value} sent: {sender_planet.name} → {recipient_planet.name}")
         print(f"   Subject: {subject}")
@@ -3619,14 +4205,12 @@ class PhysicalCommunicationSystem:
         
     def find_faction_planets(self, faction_name):
         """Find all planets belonging to a faction"""
-        faction_planets = []
-        for planet in planets:
-            if hasattr(planet, 'faction') and planet.faction == faction_name:
-                faction_planets.append(planet)
-            elif hasattr(planet, 'enhanced_economy') and planet.enhanced_economy:
-                # Check planet type for faction association
-                if faction_name.lower() in planet.planet_type.lower():
-                    faction_planets.append(planet)
+        faction_planets = world_registry.planets_of_faction(faction_name)
+        # Planet types named after the faction also count (e.g. pirate hideouts)
+        for planet_type in world_registry.planet_types():
+            if faction_name.lower() in planet_type.lower():
+                faction_planets.extend(p for p in world_registry.planets_of_type(planet_type)
+                                       if getattr(p, 'enhanced_economy', None) and p not in faction_planets)
         return faction_planets
         
     def find_faction_capital(self, faction_name):
@@ -3642,10 +4226,7 @@ class PhysicalCommunicationSystem:
         """Deliver a letter to a planet's mailbox"""
         planet_name = getattr(destination_planet, 'name', str(destination_planet))
         
-        if planet_name not in self.planetary_mailboxes:
-            self.planetary_mailboxes[planet_name] = []
-            
-        self.planetary_mailboxes[planet_name].append(letter)
+        self.planetary_mailboxes.add(planet_name, letter)
         
         print(f"📬 Letter delivered to {planet_name}: {letter.subject}")
         
@@ -3672,7 +4253,10 @@ class PhysicalCommunicationSystem:
                 headline=f"WAR DECLARED: {letter.sender_faction} vs {letter.recipient_faction}",
                 details=letter.content,
                 source=letter.sender_planet,
-                reliability=1.0
+                reliability=1.0,
+                events=(NewsEvent.WAR,),
+                mentions=tuple(('faction', f) for f in (letter.sender_faction, letter.recipient_faction) if f)
+                         + self.extract_mentions(letter.sender_planet, letter.content)
             )
             
         elif letter.message_type == MessageType.PIRATE_WARNING:
@@ -3687,98 +4271,199 @@ class PhysicalCommunicationSystem:
             info_type=info_type,
             content=content,
             origin_planet=origin_planet,
-            current_accuracy=accuracy,
-            age_hours=0,
-            visited_planets={origin_planet}
+            initial_accuracy=accuracy,
+            created_at=sim_clock.now,
+            visited_planets={origin_planet},
+            decay_since=sim_clock.now
         )
         
         self.word_of_mouth_pool.append(rumor)
+        self.rumors_by_planet.setdefault(origin_planet, []).append(rumor)
         print(f"💬 Rumor started at {origin_planet}: {content[:50]}...")
         
-    def spread_word_of_mouth(self):
-        """Spread rumors through trader and traveler word-of-mouth"""
-        for rumor in self.word_of_mouth_pool[:]:
-            # Age the rumor
-            rumor.age_hours += 1/60  # Assuming 1 minute = 1 hour game time
-            
-            # Accuracy degrades over time and spreading
-            accuracy_decay = 0.95 ** rumor.spread_count
-            rumor.current_accuracy *= accuracy_decay
-            
-            # Remove very old or inaccurate rumors
-            if rumor.age_hours > 168 or rumor.current_accuracy < 0.3:  # 1 week or <30% accuracy
-                self.word_of_mouth_pool.remove(rumor)
+    def expire_rumors(self):
+        """Drop rumors that are too old or too garbled to pass on"""
+        if not self.word_of_mouth_pool:
+            return
+        self.word_of_mouth_pool = [r for r in self.word_of_mouth_pool if r.is_alive()]
+        for planet_name in list(self.rumors_by_planet):
+            alive = [r for r in self.rumors_by_planet[planet_name] if r.is_alive()]
+            if alive:
+                self.rumors_by_planet[planet_name] = alive
+            else:
+                del self.rumors_by_planet[planet_name]
+
+    def board_rumors(self, ship):
+        """A departing trader takes along whatever rumors its origin knows"""
+        origin_name = getattr(getattr(ship, 'origin', None), 'name', None)
+        known = self.rumors_by_planet.get(origin_name)
+        if known:
+            ship.rumors = [r for r in known if r.is_alive()]
+
+    def deliver_rumors(self, ship):
+        """Pass a trader's rumors on at its destination (called on arrival)"""
+        rumors = getattr(ship, 'rumors', None)
+        dest_name = getattr(getattr(ship, 'destination', None), 'name', None)
+        if not rumors or dest_name is None:
+            return
+        ship.rumors = []
+        origin_name = getattr(getattr(ship, 'origin', None), 'name', 'Unknown')
+        for rumor in rumors:
+            if dest_name in rumor.visited_planets or not rumor.is_alive():
                 continue
-                
-            # Spread to nearby planets through cargo ships
-            self.spread_rumor_via_ships(rumor)
-            
-    def spread_rumor_via_ships(self, rumor):
-        """Spread rumors through cargo ships and travelers"""
-        for ship in unified_transport_system.cargo_ships:
-            if hasattr(ship, 'destination') and hasattr(ship.destination, 'name'):
-                dest_name = ship.destination.name
-                
-                # Ships carry news from their origin
-                if hasattr(ship, 'origin') and ship.origin.name in rumor.visited_planets:
-                    if dest_name not in rumor.visited_planets and random.random() < 0.3:  # 30% chance
-                        rumor.visited_planets.add(dest_name)
-                        rumor.spread_count += 1
-                        
-                        # Add news to destination planet
-                        self.add_planetary_news(
-                            planet_name=dest_name,
-                            headline=f"Traveler's Tale: {rumor.info_type.title()}",
-                            details=rumor.content,
-                            source=f"Trader from {ship.origin.name}",
-                            reliability=rumor.current_accuracy
-                        )
-                        
-                        print(f"💬 Rumor spread to {dest_name} via cargo ship")
+            rumor.record_spread(dest_name)
+            self.rumors_by_planet.setdefault(dest_name, []).append(rumor)
+            self.add_planetary_news(
+                planet_name=dest_name,
+                headline=f"Traveler's Tale: {rumor.info_type.title()}",
+                details=rumor.content,
+                source=f"Trader from {origin_name}",
+                reliability=rumor.current_accuracy,
+                events=(NewsEvent.RUMOR,) + self.RUMOR_EVENTS.get(rumor.info_type, ())
+            )
+            print(f"💬 Rumor spread to {dest_name} via cargo ship")
                         
-    def add_planetary_news(self, planet_name, headline, details, source, reliability=0.8):
+    def add_planetary_news(self, planet_name, headline, details, source, reliability=0.8, events=None, mentions=None):
         """Add news/information to a planet's knowledge"""
-        if planet_name not in self.planetary_news:
-            self.planetary_news[planet_name] = []
-            
         news = PlanetaryNews(
             news_id=f"NEWS-{int(time.time())}-{random.randint(100, 999)}",
             headline=headline,
             details=details,
             source_planet=source,
-            timestamp=time.time(),
+            timestamp=sim_clock.now,
             reliability=reliability,
-            spread_count=0
+            spread_count=0,
+            events=tuple(events) if events is not None else self.classify_news(headline, details),
+            mentions=tuple(mentions) if mentions is not None else self.extract_mentions(headline, details)
         )
         
-        self.planetary_news[planet_name].append(news)
-        
-    def get_planet_knowledge(self, planet_name):
-        """Get all information (letters + news) known at a planet"""
-        letters = self.planetary_mailboxes.get(planet_name, [])
-        news = self.planetary_news.get(planet_name, [])
+        self.planetary_news.add(planet_name, news)
+        self._record_threat(planet_name, news)
+        self._record_mentions(planet_name, news)
+
+    @staticmethod
+    def classify_news(headline, details):
+        """Tag untagged news (legacy callers, old saves) from its text, once"""
+        text = f"{headline} {details}".lower()
+        events = []
+        if 'pirate' in text or 'raid' in text:
+            events.append(NewsEvent.PIRATE_ATTACK)
+        if 'blockade' in text:
+            events.append(NewsEvent.BLOCKADE)
+        if 'war declared' in text:
+            events.append(NewsEvent.WAR)
+        return tuple(events)
+
+    @classmethod
+    def extract_mentions(cls, headline, details):
+        """Planets and factions named in free text (legacy callers, old saves), resolved once"""
+        factions = faction_system.factions if 'faction_system' in globals() else {}
+        mentions = []
+        for token in cls.MENTION_TOKEN.findall(f"{headline} {details}"):
+            if world_registry.planet(token) is not None:
+                key = ('planet', token)
+            elif token in factions:
+                key = ('faction', token)
+            else:
+                continue
+            if key not in mentions:
+                mentions.append(key)
+        return tuple(mentions)
+
+    def _record_mentions(self, planet_name, news):
+        index = self._mentions.setdefault(planet_name, {})
+        for key in news.mentions:
+            entry = index.get(key)
+            if entry is None:
+                entry = index[key] = [deque(), deque(), 0.0]
+            entry[0].append(news)
+            entry[1].append(news)
+            entry[2] += news.reliability
+
+    def _forget_mentions(self, planet_name, news):
+        """ExpiringFeed eviction hook; evicted news is always the oldest at its planet"""
+        index = self._mentions.get(planet_name)
+        if not index:
+            return
+        for key in news.mentions:
+            entry = index.get(key)
+            if entry is None:
+                continue
+            if entry[0] and entry[0][0] is news:
+                entry[0].popleft()
+            if entry[1] and entry[1][0] is news:
+                entry[1].popleft()
+                entry[2] -= news.reliability
+            if not entry[0]:
+                del index[key]
+
+    def knows_about(self, planet_name, key):
+        """Whether any news held at planet_name mentions `key`, e.g. ('planet', 'Agri-339')"""
+        return key in self._mentions.get(planet_name, ())
+
+    def _record_threat(self, planet_name, news):
+        """Fold one news item into the planet's decaying threat score"""
+        weight = 0.0
+        for event in news.events:
+            if event == NewsEvent.PIRATE_ATTACK:
+                weight += news.reliability * 2.0
+            elif event == NewsEvent.BLOCKADE:
+                weight += 1.0
+        if weight <= 0.0:
+            return
+        score, since = self._threat.get(planet_name, (0.0, news.timestamp))
+        if news.timestamp > since:
+            score *= math.exp((since - news.timestamp) / self.THREAT_DECAY_SEC)
+            since = news.timestamp
+        score += weight * math.exp((news.timestamp - since) / self.THREAT_DECAY_SEC)
+        self._threat[planet_name] = (score, since)
+
+    def rebuild_news_indexes(self):
+        """Recompute threat scores and mention indexes from the news held (after loading)"""
+        self._threat.clear()
+        self._mentions.clear()
+        for planet_name, news_list in self.planetary_news.items():
+            for news in news_list:
+                self._record_threat(planet_name, news)
+                self._record_mentions(planet_name, news)
+
+    def threat_score(self, planet_name):
+        entry = self._threat.get(planet_name)
+        if entry is None:
+            return 0.0
+        score, since = entry
+        return score * math.exp(-max(0.0, sim_clock.now - since) / self.THREAT_DECAY_SEC)
+        
+    def get_planet_knowledge(self, planet_name, limit=None):
+        """Get information (letters + news) known at a planet; with `limit`, only the newest items"""
+        letters = self.planetary_mailboxes.get(planet_name, ())
+        news = self.planetary_news.get(planet_name, ())
+        total_items = len(letters) + len(news)
+        if limit is not None:
+            letters = self.planetary_mailboxes.newest(planet_name, limit)
+            news = self.planetary_news.newest(planet_name, limit)
         
         return {
-            'letters': letters,
-            'news': news,
-            'total_items': len(letters) + len(news)
+            'letters': list(letters),
+            'news': list(news),
+            'total_items': total_items
         }
         
     def player_visits_planet(self, planet_name):
         """When player visits a planet, they learn local news and can spread rumors"""
-        knowledge = self.get_planet_knowledge(planet_name)
+        knowledge = self.get_planet_knowledge(planet_name, limit=3)
         
         if knowledge['total_items'] > 0:
             print(f"📰 Local news and letters at {planet_name}:")
             
             # Show recent letters (if any)
-            for letter in knowledge['letters'][-3:]:  # Last 3 letters
-                age_hours = (time.time() - letter.timestamp) / 3600
+            for letter in knowledge['letters']:  # Last 3 letters
+                age_hours = (sim_clock.now - letter.timestamp) / 3600
                 print(f"   📨 {letter.subject} (from {letter.sender_planet}, {age_hours:.1f}h ago)")
                 
             # Show recent news
-            for news in knowledge['news'][-3:]:  # Last 3 news items
-                age_hours = (time.time() - news.timestamp) / 3600
+            for news in knowledge['news']:  # Last 3 news items
+                age_hours = (sim_clock.now - news.timestamp) / 3600
                 accuracy_str = f"{news.reliability:.0%} reliable" if news.reliability < 0.9 else "confirmed"
                 print(f"   📰 {news.headline} ({accuracy_str}, {age_hours:.1f}h ago)")
                 
@@ -3787,45 +4472,17 @@ class PhysicalCommunicationSystem:
         
     def update(self):
         """Update the physical communication system"""
-        self.spread_word_of_mouth()
-        
-        # Clean up old letters and news
-        current_time = time.time()
-        for planet_name in list(self.planetary_mailboxes.keys()):
-            # Keep letters for 30 days
-            self.planetary_mailboxes[planet_name] = [
-                letter for letter in self.planetary_mailboxes[planet_name]
-                if current_time - letter.timestamp < 2592000  # 30 days
-            ]
-            
-        for planet_name in list(self.planetary_news.keys()):
-            # Keep news for 14 days
-            self.planetary_news[planet_name] = [
-                news for news in self.planetary_news[planet_name]
-                if current_time - news.timestamp < 1209600  # 14 days
-            ]
+        # Clean up old letters (30 days) and news (14 days)
+        self.planetary_mailboxes.expire(sim_clock.now)
+        self.planetary_news.expire(sim_clock.now)
 
     def estimate_planet_threat(self, planet_name: str) -> str:
         """Estimate local pirate threat for a planet from recent news/rumors.
         Returns one of: 'UNKNOWN', 'LOW', 'MEDIUM', 'HIGH', 'EXTREME'."""
         try:
-            news_list = self.planetary_news.get(planet_name, [])
-            if not news_list:
+            if not self.planetary_news.get(planet_name):
                 return 'UNKNOWN'
-            # Consider last 48 hours
-            cutoff = time.time() - 172800
-            score = 0.0
-            for n in news_list:
-                if n.timestamp < cutoff:
-                    continue
-                headline = (n.headline or '').lower()
-                details = (n.details or '').lower()
-                if 'pirate' in headline or 'pirate' in details or 'raid' in details:
-                    # Weight by reliability and recency
-                    recency = max(0.1, 1.0 - (time.time() - n.timestamp) / 172800.0)
-                    score += n.reliability * 2.0 * recency
-                if 'blockade' in headline or 'blockade' in details:
-                    score += 1.0
+            score = self.threat_score(planet_name)
             if score < 1.0:
                 return 'LOW'
             if score < 2.0:
@@ -3840,14 +4497,17 @@ class PhysicalCommunicationSystem:
         """Average reliability of recent news at planet_name that mention target_planet.
         Returns 0.0 if no relevant items."""
         try:
-            items = self.planetary_news.get(planet_name, [])
-            if not items:
+            entry = self._mentions.get(planet_name, {}).get(('planet', target_planet))
+            if entry is None:
                 return 0.0
-            cutoff = time.time() - 604800  # 7 days
-            rels = [n.reliability for n in items if n.timestamp >= cutoff and (target_planet in n.headline or target_planet in n.details)]
-            if not rels:
+            recent = entry[1]
+            cutoff = sim_clock.now - self.MENTION_WINDOW_SEC
+            while recent and recent[0].timestamp < cutoff:
+                entry[2] -= recent.popleft().reliability
+            if not recent:
+                entry[2] = 0.0
                 return 0.0
-            return max(0.0, min(1.0, sum(rels) / len(rels)))
+            return max(0.0, min(1.0, entry[2] / len(recent)))
         except Exception:
             return 0.0
 
@@ -4362,6 +5022,9 @@ class SpaceController(Entity):
             
             # Update time display
             self.time_text.text = f'Day {time_system.game_day}  ({time_system.get_speed_label()})'
+            if sim_clock.capped:
+                # Frame can't fit all due ticks: sim runs slower than the requested rate
+                self.time_text.text += f'  ⚠️ sim {sim_clock.get_scale_label()}'
             
             # Update transport status display
             stats = unified_transport_system.get_statistics()
@@ -4442,7 +5105,7 @@ class SpaceController(Entity):
             try:
                 if dynamic_contracts.active_contracts:
                     c = dynamic_contracts.active_contracts[0]
-                    remaining = max(0, int(c.time_limit - (time.time() - c.start_time)))
+                    remaining = max(0, int(c.time_limit - (sim_clock.now - c.start_time)))
                     mm, ss = remaining // 60, remaining % 60
                     line = f"📋 {c.title} [{mm:02d}:{ss:02d}]"
                     if c.mission_type == MissionType.CARGO_DELIVERY and c.metadata and c.metadata.get('timed'):
@@ -4465,7 +5128,7 @@ class SpaceController(Entity):
                 if self.course_route and scene_manager.current_state == GameState.SPACE:
                     # Determine current waypoint
                     current_wp_name = self.course_route[min(self.course_route_index, len(self.course_route)-1)]
-                    target = next((p for p in planets if getattr(p, 'name', None) == current_wp_name), None)
+                    target = world_registry.planet(current_wp_name)
                     if target is not None:
                         d = (target.position - self.position).length()
                         final_dest = self.course_route[-1]
@@ -4540,8 +5203,8 @@ class SpaceController(Entity):
             try:
                 escorts = [s for s in military_manager.military_ships if getattr(s, 'follow_player', False)]
                 if escorts:
-                    soonest = min([getattr(s, '_despawn_time', time.time()) for s in escorts])
-                    remaining = max(0, int(soonest - time.time()))
+                    soonest = min([getattr(s, '_despawn_time', sim_clock.now) for s in escorts])
+                    remaining = max(0, int(soonest - sim_clock.now))
                     mm, ss = remaining // 60, remaining % 60
                     self.escort_text.text = f"🛰️ Escorts: {len(escorts)} [{mm:02d}:{ss:02d}]"
                     self.escort_text.enabled = True
@@ -4812,7 +5475,8 @@ class SceneManager:
         
     def initialize_space(self):
         self.space_controller = player
-        self.space_entities = [skybox, *planets, axis_indicator]
+        # Planet spheres are shown and hidden by planet_renderer
+        self.space_entities = [skybox, axis_indicator]
         
     def initialize_town(self):
         if not self.town_controller:
@@ -5031,6 +5695,7 @@ class SceneManager:
             # Hide space entities
             for entity in self.space_entities:
                 entity.disable()
+            planet_renderer.set_visible(False)
             
             # Initialize and setup town
             self.initialize_town()
@@ -5074,6 +5739,7 @@ class SceneManager:
             # Show space entities
             for entity in self.space_entities:
                 entity.enable()
+            planet_renderer.set_visible(True)
             
             # Reset and setup space camera/controller
             self.space_controller.enable()
@@ -5102,9 +5768,834 @@ class SceneManager:
 # Create scene manager
 scene_manager = SceneManager()
 
-def save_game():
-    if not os.path.exists('saves'):
-        os.makedirs('saves')
+# ===== SAVE WRITER =====
+
+class SaveWriter:
+    """Serializes game snapshots and writes them to disk on a worker thread.
+
+    save_game() builds a plain-data snapshot on the main thread; the worker turns it
+    into JSON and publishes it with write-to-temp + os.replace, so a crash mid-write
+    never leaves a truncated save behind. Only one save runs at a time: a request that
+    arrives while another is in flight is skipped and logged.
+    """
+
+    def __init__(self, save_dir: str = 'saves', autosave_slots: int = 3):
+        self.save_dir = save_dir
+        self.autosave_slots = autosave_slots
+        self._lock = threading.Lock()
+        self._thread = None
+        self.last_result = None
+        self.journal = SaveJournal(save_dir)
+        self.catalog = SaveCatalog(save_dir)
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def submit(self, game_state: dict, snapshot_seconds: float = 0.0, background: bool = True) -> bool:
+        if not self._lock.acquire(blocking=False):
+            diagnostics.log_event('save.skipped', 'WARNING', 'Save already in progress')
+            return False
+        if not background:
+            self._run(game_state, snapshot_seconds)
+            return True
+        self._thread = threading.Thread(target=self._run, args=(game_state, snapshot_seconds),
+                                        name='save-writer')
+        self._thread.start()
+        return True
+
+    def wait(self, timeout: float = None):
+        """Block until the in-flight save (if any) has been written"""
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @staticmethod
+    def write_atomic(path: str, data):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def extension() -> str:
+        return SaveContainer.EXTENSION if SETTINGS.get('save_format', 'binary') == 'binary' else '.json'
+
+    def _write_autosave(self, data, game_state: dict) -> str:
+        """Rolling autosave slots (autosave_1..N); the new file is complete before any slot moves"""
+        ext = self.extension()
+        newest = os.path.join(self.save_dir, f'autosave_1{ext}')
+        staged = f"{newest}.new"
+        self.write_atomic(staged, data)
+        # Shift existing autosaves
+        for i in range(self.autosave_slots, 1, -1):
+            older = os.path.join(self.save_dir, f'autosave_{i-1}{ext}')
+            newer = os.path.join(self.save_dir, f'autosave_{i}{ext}')
+            if os.path.exists(older):
+                try:
+                    os.replace(older, newer)
+                    self.catalog.rename(older, newer)
+                except Exception:
+                    pass
+        os.replace(staged, newest)
+        self.catalog.record(newest, data, game_state)
+        return newest
+
+    def _run(self, game_state: dict, snapshot_seconds: float):
+        try:
+            started = perf_counter()
+            os.makedirs(self.save_dir, exist_ok=True)
+            journal = self.journal
+            if SETTINGS.get('save_mode', 'journal') == 'journal' and not journal.needs_checkpoint():
+                mode = 'journal'
+                path = journal.path
+                size = journal.append(game_state)
+                self.catalog.record_journal(os.path.join(self.save_dir, f'autosave_1{self.extension()}'),
+                                            game_state, journal.records_since_checkpoint)
+            else:
+                mode = 'checkpoint'
+                journal.begin_checkpoint(game_state)
+                if self.extension() == SaveContainer.EXTENSION:
+                    data = SaveContainer.encode(game_state)
+                else:
+                    data = json.dumps(game_state)
+                size = len(data)
+                try:
+                    path = self._write_autosave(data, game_state)
+                    journal.checkpoint_written(game_state, size)
+                    print('Game autosaved (slot 1).')
+                except Exception:
+                    # Fallback timestamped save
+                    journal.reset()
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    path = os.path.join(self.save_dir, f'save_{timestamp}{self.extension()}')
+                    self.write_atomic(path, data)
+                    self.catalog.record(path, data, game_state)
+                    print(f'Game saved to {path}')
+            self.last_result = {
+                'path': path,
+                'mode': mode,
+                'bytes': size,
+                'snapshot_ms': round(snapshot_seconds * 1000.0, 2),
+                'write_ms': round((perf_counter() - started) * 1000.0, 2),
+            }
+            diagnostics.log_event('save.completed', 'INFO', f'Saved {path}', self.last_result)
+        except Exception as e:
+            diagnostics.log_exception('save.worker', e)
+        finally:
+            self._lock.release()
+
+class SaveJournal:
+    """Incremental persistence: occasional full checkpoints plus appended delta records.
+
+    Between checkpoints each save is diffed against the last persisted snapshot and a
+    single JSON line is appended to `journal.jsonl` holding only what changed:
+    economy fields and stockpile entries, contract upserts/removals, ship spawns and
+    despawns, batched ship positions, and whole replacements for the remaining small
+    sections. Every record carries the id of the checkpoint it extends, so records
+    left over from an older checkpoint are ignored on replay.
+    """
+
+    ECONOMY_DICT_FIELDS = ('stockpiles', 'daily_consumption', 'daily_production')
+    CONTRACT_SECTIONS = ('contracts', 'transport_contracts')
+    DYNAMIC_CONTRACT_LISTS = ('available', 'active', 'completed')
+    SHIP_KINDS = ('cargo', 'message', 'payment')
+
+    def __init__(self, save_dir: str = 'saves', file_name: str = 'journal.jsonl'):
+        self.path = os.path.join(save_dir, file_name)
+        self.checkpoint_id = None
+        self.checkpoint_bytes = 0
+        self.journal_bytes = 0
+        self.records_since_checkpoint = 0
+        self._baseline = None  # Last persisted snapshot (plain data, never mutated)
+
+    def reset(self):
+        """Force the next save to be a full checkpoint (e.g. after loading)"""
+        self.checkpoint_id = None
+        self._baseline = None
+
+    def needs_checkpoint(self) -> bool:
+        if self._baseline is None or self.checkpoint_id is None:
+            return True
+        if self.records_since_checkpoint >= SETTINGS.get('save_checkpoint_every', 10):
+            return True
+        return self.journal_bytes > self.checkpoint_bytes * SETTINGS.get('save_journal_max_ratio', 0.5)
+
+    def begin_checkpoint(self, game_state: dict):
+        self.checkpoint_id = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{random.getrandbits(32):08x}"
+        game_state['checkpoint'] = {'id': self.checkpoint_id}
+
+    def checkpoint_written(self, game_state: dict, size: int):
+        """Start a fresh journal for the checkpoint that was just published"""
+        self.checkpoint_bytes = size
+        self.journal_bytes = 0
+        self.records_since_checkpoint = 0
+        self._baseline = game_state
+        SaveWriter.write_atomic(self.path, '')
+
+    def append(self, game_state: dict) -> int:
+        """Append the delta against the baseline; returns bytes written (0 if nothing changed)"""
+        game_state['checkpoint'] = {'id': self.checkpoint_id}
+        record = self.diff(self._baseline, game_state)
+        self._baseline = game_state
+        if not record:
+            return 0
+        record['cp'] = self.checkpoint_id
+        record['seq'] = self.records_since_checkpoint + 1
+        line = json.dumps(record) + "\n"
+        with open(self.path, 'a') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self.records_since_checkpoint += 1
+        self.journal_bytes += len(line)
+        return len(line)
+
+    @staticmethod
+    def _keyed_delta(old_list, new_list, key):
+        """Upserts/removals between two lists of dicts identified by `key`, or None if equal"""
+        old_by_id = {e.get(key): e for e in old_list or []}
+        new_by_id = {e.get(key): e for e in new_list or []}
+        upserts = [e for k, e in new_by_id.items() if old_by_id.get(k) != e]
+        removed = [k for k in old_by_id if k not in new_by_id]
+        return {'upsert': upserts, 'remove': removed} if upserts or removed else None
+
+    @staticmethod
+    def _apply_keyed(entries, delta, key):
+        entries = list(entries or [])
+        index = {e.get(key): i for i, e in enumerate(entries)}
+        for entry in delta.get('upsert', []):
+            if entry.get(key) in index:
+                entries[index[entry.get(key)]] = entry
+            else:
+                entries.append(entry)
+        removed = set(delta.get('remove', []))
+        return [e for e in entries if e.get(key) not in removed]
+
+    @classmethod
+    def diff(cls, old: dict, new: dict) -> dict:
+        record = {}
+        sections = {}
+        section_keys = {}
+        handled = {'checkpoint', 'planets', 'planets_v2', 'ships', 'dynamic_contracts'} | set(cls.CONTRACT_SECTIONS)
+        for key, value in new.items():
+            if key in handled or old.get(key) == value:
+                continue
+            before = old.get(key)
+            if isinstance(value, dict) and isinstance(before, dict):
+                # Keyed sections (mailboxes, news, heat): only the entries that changed
+                changed = {k: v for k, v in value.items() if before.get(k) != v}
+                removed = [k for k in before if k not in value]
+                section_keys[key] = {'set': changed, 'remove': removed}
+            else:
+                sections[key] = value
+        if section_keys:
+            record['section_keys'] = section_keys
+        # Planets: economy deltas, or a full replacement if the planet set itself changed
+        old_planets = {e.get('name'): e for e in old.get('planets_v2', [])}
+        new_planets = new.get('planets_v2', [])
+        same_planets = len(old_planets) == len(new_planets) and all(
+            e.get('name') in old_planets
+            and {k: v for k, v in e.items() if k != 'economy'} == {k: v for k, v in old_planets[e.get('name')].items() if k != 'economy'}
+            and (e.get('economy') is None) == (old_planets[e.get('name')].get('economy') is None)
+            for e in new_planets)
+        if not same_planets:
+            sections['planets'] = new.get('planets')
+            sections['planets_v2'] = new_planets
+        else:
+            economies = {}
+            for entry in new_planets:
+                econ, old_econ = entry.get('economy'), old_planets[entry.get('name')].get('economy')
+                if not econ or econ == old_econ:
+                    continue
+                changes = {}
+                for field, value in econ.items():
+                    before = old_econ.get(field)
+                    if value == before:
+                        continue
+                    if field in cls.ECONOMY_DICT_FIELDS and isinstance(value, dict) and isinstance(before, dict):
+                        changes[field] = {k: v for k, v in value.items() if before.get(k) != v}
+                        removed = [k for k in before if k not in value]
+                        if removed:
+                            changes.setdefault('_removed', {})[field] = removed
+                    else:
+                        changes[field] = value
+                economies[entry.get('name')] = changes
+            if economies:
+                record['economies'] = economies
+        # Contracts: upserts and removals keyed by id (status transitions land here)
+        for section in cls.CONTRACT_SECTIONS:
+            delta = cls._keyed_delta(old.get(section), new.get(section), 'id')
+            if delta:
+                record[section] = delta
+        old_dynamic, new_dynamic = old.get('dynamic_contracts'), new.get('dynamic_contracts')
+        if isinstance(old_dynamic, dict) and isinstance(new_dynamic, dict):
+            dynamic = {}
+            for name in cls.DYNAMIC_CONTRACT_LISTS:
+                delta = cls._keyed_delta(old_dynamic.get(name), new_dynamic.get(name), 'contract_id')
+                if delta:
+                    dynamic[name] = delta
+            if dynamic:
+                record['dynamic_contracts'] = dynamic
+        elif new_dynamic != old_dynamic:
+            sections['dynamic_contracts'] = new_dynamic
+        # Ships: spawns/despawns plus one batch of positions for ships that only moved
+        old_ships, new_ships = old.get('ships', {}), new.get('ships', {})
+        spawned, despawned, positions = {}, [], {}
+        for kind in cls.SHIP_KINDS:
+            old_by_id = {e.get('ship_id'): e for e in old_ships.get(kind, [])}
+            new_list = new_ships.get(kind, [])
+            if None in old_by_id or any(e.get('ship_id') is None for e in new_list):
+                sections['ships'] = new_ships  # Untracked ships: fall back to replacing the section
+                spawned, despawned, positions = {}, [], {}
+                break
+            new_ids = set()
+            for entry in new_list:
+                sid = entry['ship_id']
+                new_ids.add(sid)
+                before = old_by_id.get(sid)
+                if before == entry:
+                    continue
+                moved = cls._movement(before, entry) if before is not None else None
+                if moved is not None:
+                    positions[sid] = moved
+                else:
+                    spawned.setdefault(kind, []).append(entry)
+            despawned.extend(sid for sid in old_by_id if sid not in new_ids)
+        if spawned:
+            record['ships_spawned'] = spawned
+        if despawned:
+            record['ships_despawned'] = despawned
+        if positions:
+            record['positions'] = positions
+        if sections:
+            record['sections'] = sections
+        return record
+
+    @staticmethod
+    def _movement(before, entry):
+        """[x, y, z, waypoints_consumed] if the ship only moved along its route, else None"""
+        if {k: v for k, v in before.items() if k not in ('position', 'waypoints')} != \
+                {k: v for k, v in entry.items() if k not in ('position', 'waypoints')}:
+            return None
+        old_wp, new_wp = before.get('waypoints') or [], entry.get('waypoints') or []
+        consumed = len(old_wp) - len(new_wp)
+        if consumed < 0 or old_wp[consumed:] != new_wp:
+            return None
+        return list(entry.get('position') or [0.0, 0.0, 0.0]) + [consumed]
+
+    @classmethod
+    def apply(cls, state: dict, record: dict):
+        """Replay one delta record onto a loaded snapshot (in place)"""
+        for key, value in record.get('sections', {}).items():
+            state[key] = value
+        for key, delta in record.get('section_keys', {}).items():
+            target = state.setdefault(key, {})
+            target.update(delta.get('set', {}))
+            for k in delta.get('remove', []):
+                target.pop(k, None)
+        planets_by_name = {e.get('name'): e for e in state.get('planets_v2', [])} if record.get('economies') else {}
+        for name, changes in record.get('economies', {}).items():
+            econ = (planets_by_name.get(name) or {}).get('economy')
+            if econ is None:
+                continue
+            for field, value in changes.items():
+                if field == '_removed':
+                    continue
+                if field in cls.ECONOMY_DICT_FIELDS and isinstance(econ.get(field), dict):
+                    econ[field].update(value)
+                else:
+                    econ[field] = value
+            for field, keys in changes.get('_removed', {}).items():
+                for k in keys:
+                    econ.get(field, {}).pop(k, None)
+        for section in cls.CONTRACT_SECTIONS:
+            if record.get(section):
+                state[section] = cls._apply_keyed(state.get(section), record[section], 'id')
+        if record.get('dynamic_contracts'):
+            dynamic = state.setdefault('dynamic_contracts', {})
+            for name, delta in record['dynamic_contracts'].items():
+                dynamic[name] = cls._apply_keyed(dynamic.get(name), delta, 'contract_id')
+        if not any(record.get(k) for k in ('ships_despawned', 'positions', 'ships_spawned')):
+            return
+        ships = state.setdefault('ships', {})
+        despawned = set(record.get('ships_despawned', []))
+        positions = record.get('positions', {})
+        spawned = record.get('ships_spawned', {})
+        for kind in cls.SHIP_KINDS:
+            entries = [e for e in ships.get(kind, []) if e.get('ship_id') not in despawned]
+            index = {e.get('ship_id'): i for i, e in enumerate(entries)}
+            for entry in spawned.get(kind, []):
+                if entry.get('ship_id') in index:
+                    entries[index[entry['ship_id']]] = entry
+                else:
+                    entries.append(entry)
+            for entry in entries:
+                moved = positions.get(entry.get('ship_id'))
+                if moved is not None:
+                    entry['position'] = moved[:3]
+                    if len(moved) > 3 and moved[3]:
+                        entry['waypoints'] = (entry.get('waypoints') or [])[moved[3]:]
+            ships[kind] = entries
+
+    def replay(self, game_state: dict) -> int:
+        """Apply journal records that extend this checkpoint; returns how many were applied"""
+        checkpoint_id = (game_state.get('checkpoint') or {}).get('id')
+        if not checkpoint_id or not os.path.exists(self.path):
+            return 0
+        applied = 0
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except Exception:
+                    break  # Torn tail from an interrupted append
+                if record.get('cp') != checkpoint_id:
+                    continue
+                self.apply(game_state, record)
+                applied += 1
+        return applied
+
+class SaveContainer:
+    """Versioned binary save file: a small header with a section table, then compressed sections.
+
+    Layout: MAGIC, u32 header length, header JSON (format version, summary metadata and
+    `{name, offset, length, codec, crc32}` per section), then the section blobs. Sections
+    are zlib-compressed JSON, except `economies`, which packs every planet's stockpiles
+    and economy scalars into one float64 matrix. Any section can be read on its own and
+    `read_header()` touches only the first few hundred bytes, which is all a save menu needs.
+    """
+
+    MAGIC = b'ILKSAVE\x00'
+    FORMAT_VERSION = 1
+    EXTENSION = '.ilks'
+    SECTION_KEYS = (
+        ('player', ('version', 'current_scene', 'player_position', 'player_rotation', 'town_player_position',
+                    'player_wallet', 'ship', 'faction_heat', 'sim_clock', 'checkpoint', 'time', 'location')),
+        ('planets', ('planets', 'planets_v2')),
+        ('contracts', ('contracts', 'transport_contracts', 'dynamic_contracts')),
+        ('ships', ('ships', 'courier_queue')),
+        ('communication', ('planetary_mailboxes', 'planetary_news')),
+    )
+
+    @staticmethod
+    def is_container(path: str) -> bool:
+        try:
+            with open(path, 'rb') as f:
+                return f.read(len(SaveContainer.MAGIC)) == SaveContainer.MAGIC
+        except Exception:
+            return False
+
+    @staticmethod
+    def summarize(game_state: dict) -> dict:
+        ships = game_state.get('ships') or {}
+        return {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'game_version': game_state.get('version'),
+            'scene': game_state.get('current_scene'),
+            'credits': (game_state.get('player_wallet') or {}).get('credits'),
+            'planets': len(game_state.get('planets_v2') or game_state.get('planets') or []),
+            'ships': sum(len(v) for v in ships.values() if isinstance(v, list)),
+            'sim_now': (game_state.get('sim_clock') or {}).get('now'),
+            'game_day': (game_state.get('time') or {}).get('game_day'),
+            'location': game_state.get('location'),
+        }
+
+    @staticmethod
+    def _pack_economies(planets_v2) -> bytes:
+        """Planet economies as one row per planet: scalar fields, then each dict field's keys"""
+        rows = [(e.get('name'), e['economy']) for e in planets_v2 or [] if e.get('economy')]
+        scalars, dicts, extra = [], {}, {}
+        for name, econ in rows:
+            for field, value in econ.items():
+                if isinstance(value, dict) and all(isinstance(v, (int, float)) for v in value.values()):
+                    keys = dicts.setdefault(field, [])
+                    keys.extend(k for k in value if k not in keys)
+                elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                    if field not in scalars:
+                        scalars.append(field)
+                else:
+                    extra.setdefault(name, {})[field] = value
+        columns = [(field, None) for field in scalars] + [(field, k) for field, keys in dicts.items() for k in keys]
+        matrix = array('d')
+        int_columns = set(range(len(columns)))
+        nan = float('nan')
+        for name, econ in rows:
+            for col, (field, key) in enumerate(columns):
+                value = econ.get(field) if key is None else (econ.get(field) or {}).get(key)
+                if not isinstance(value, (int, float)) or isinstance(value, bool) or (key is None and field in extra.get(name, {})):
+                    matrix.append(nan)
+                    continue
+                if not isinstance(value, int):
+                    int_columns.discard(col)
+                matrix.append(float(value))
+        if sys.byteorder != 'little':
+            matrix.byteswap()
+        layout = json.dumps({'planets': [name for name, _ in rows], 'scalars': scalars, 'dicts': dicts,
+                             'int_columns': sorted(int_columns), 'extra': extra}).encode('utf-8')
+        return struct.pack('<I', len(layout)) + layout + matrix.tobytes()
+
+    @staticmethod
+    def _unpack_economies(blob: bytes) -> dict:
+        (layout_len,) = struct.unpack_from('<I', blob, 0)
+        layout = json.loads(blob[4:4 + layout_len].decode('utf-8'))
+        matrix = array('d')
+        matrix.frombytes(blob[4 + layout_len:])
+        if sys.byteorder != 'little':
+            matrix.byteswap()
+        columns = [(field, None) for field in layout['scalars']] + \
+                  [(field, k) for field, keys in layout['dicts'].items() for k in keys]
+        int_columns = set(layout['int_columns'])
+        width = len(columns)
+        economies = {}
+        for row, name in enumerate(layout['planets']):
+            econ = {field: {} for field in layout['dicts']}
+            for col, (field, key) in enumerate(columns):
+                value = matrix[row * width + col]
+                if value != value:  # NaN: absent
+                    continue
+                if col in int_columns:
+                    value = int(value)
+                if key is None:
+                    econ[field] = value
+                else:
+                    econ[field][key] = value
+            econ.update(layout['extra'].get(name, {}))
+            economies[name] = econ
+        return economies
+
+    @classmethod
+    def encode(cls, game_state: dict, meta: dict = None) -> bytes:
+        sections = []
+        claimed = set()
+        for name, keys in cls.SECTION_KEYS:
+            payload = {k: game_state[k] for k in keys if k in game_state}
+            claimed.update(keys)
+            if name == 'planets' and payload.get('planets_v2'):
+                payload['planets_v2'] = [dict(e, economy=None) for e in payload['planets_v2']]
+            sections.append((name, 'zlib+json', json.dumps(payload).encode('utf-8')))
+        sections.append(('economies', 'zlib+f64', cls._pack_economies(game_state.get('planets_v2'))))
+        misc = {k: v for k, v in game_state.items() if k not in claimed}
+        sections.append(('misc', 'zlib+json', json.dumps(misc).encode('utf-8')))
+        table, blobs, offset = [], [], 0
+        for name, codec, raw in sections:
+            blob = zlib.compress(raw, 6)
+            table.append({'name': name, 'offset': offset, 'length': len(blob), 'codec': codec,
+                          'crc32': zlib.crc32(blob)})
+            blobs.append(blob)
+            offset += len(blob)
+        header = json.dumps({'format': cls.FORMAT_VERSION, 'meta': meta or cls.summarize(game_state),
+                             'sections': table}).encode('utf-8')
+        return cls.MAGIC + struct.pack('<I', len(header)) + header + b''.join(blobs)
+
+    @classmethod
+    def read_header(cls, path: str) -> dict:
+        with open(path, 'rb') as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"{path} is not a save container")
+            (header_len,) = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_len).decode('utf-8'))
+        if header.get('format', 0) > cls.FORMAT_VERSION:
+            raise ValueError(f"{path} uses save format {header.get('format')}, newer than {cls.FORMAT_VERSION}")
+        header['_data_start'] = len(cls.MAGIC) + 4 + header_len
+        return header
+
+    @classmethod
+    def read_section(cls, path: str, name: str, header: dict = None):
+        """Decode one section without touching the others"""
+        header = header or cls.read_header(path)
+        entry = next((e for e in header['sections'] if e['name'] == name), None)
+        if entry is None:
+            return None
+        with open(path, 'rb') as f:
+            f.seek(header['_data_start'] + entry['offset'])
+            blob = f.read(entry['length'])
+        if zlib.crc32(blob) != entry['crc32']:
+            raise ValueError(f"Save section '{name}' in {path} is corrupted")
+        raw = zlib.decompress(blob)
+        if entry['codec'] == 'zlib+f64':
+            return cls._unpack_economies(raw)
+        return json.loads(raw.decode('utf-8'))
+
+    @classmethod
+    def load(cls, path: str) -> dict:
+        """Reassemble the full game_state dict save_game() snapshotted"""
+        return dict(LazyGameState(path).load_all())
+
+class LazyGameState(dict):
+    """game_state backed by a save container, decoding each section the first time it is used.
+
+    Keys map to sections through SaveContainer.SECTION_KEYS (anything else lives in
+    `misc`), so reading or writing `ships` decodes only the ships section. Planet
+    economies are attached when the planets section is decoded. Iterating decodes
+    everything that is left.
+    """
+    def __init__(self, path: str, header: dict = None):
+        super().__init__()
+        self.path = path
+        self.header = header or SaveContainer.read_header(path)
+        self._section_of = {key: name for name, keys in SaveContainer.SECTION_KEYS for key in keys}
+        self._unread = [e['name'] for e in self.header['sections'] if e['name'] != 'economies']
+        self.sections_read = []
+
+    def _read(self, name):
+        self._unread.remove(name)
+        section = SaveContainer.read_section(self.path, name, self.header) or {}
+        if name == 'planets':
+            economies = SaveContainer.read_section(self.path, 'economies', self.header) or {}
+            for planet in section.get('planets_v2') or []:
+                planet['economy'] = economies.get(planet.get('name'))
+        super().update(section)
+        self.sections_read.append(name)
+
+    def _ensure(self, key):
+        name = self._section_of.get(key, 'misc')
+        if name in self._unread:
+            self._read(name)
+
+    def load_all(self):
+        for name in list(self._unread):
+            self._read(name)
+        return self
+
+    def __getitem__(self, key):
+        self._ensure(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._ensure(key)
+        super().__setitem__(key, value)
+
+    def __contains__(self, key):
+        self._ensure(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self._ensure(key)
+        return super().get(key, default)
+
+    def setdefault(self, key, default=None):
+        self._ensure(key)
+        return super().setdefault(key, default)
+
+    def pop(self, key, *default):
+        self._ensure(key)
+        return super().pop(key, *default)
+
+    def __iter__(self):
+        self.load_all()
+        return super().__iter__()
+
+    def __len__(self):
+        self.load_all()
+        return super().__len__()
+
+    def keys(self):
+        self.load_all()
+        return super().keys()
+
+    def items(self):
+        self.load_all()
+        return super().items()
+
+    def values(self):
+        self.load_all()
+        return super().values()
+
+class SaveCatalog:
+    """saves/index.json: one metadata entry per save slot, maintained by the save worker.
+
+    Listing slots reads only this small file (rebuilt from container headers if it is
+    missing). Each entry records the file size and crc32 written, so a damaged or
+    truncated save is detected before anything tries to parse it. Timestamped saves
+    beyond `save_keep_timestamped` are pruned oldest-first.
+    """
+
+    FILE_NAME = 'index.json'
+
+    def __init__(self, save_dir: str = 'saves'):
+        self.save_dir = save_dir
+        self.path = os.path.join(save_dir, self.FILE_NAME)
+        self._slots = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_save_file(name: str) -> bool:
+        return name.endswith(SaveContainer.EXTENSION) or (name.endswith('.json') and name != SaveCatalog.FILE_NAME)
+
+    def _entries(self) -> dict:
+        if self._slots is None:
+            try:
+                with open(self.path, 'r') as f:
+                    self._slots = json.load(f).get('slots', {})
+            except Exception:
+                self._slots = self._scan()
+        return self._slots
+
+    def _write(self):
+        try:
+            os.makedirs(self.save_dir, exist_ok=True)
+            SaveWriter.write_atomic(self.path, json.dumps({'format': 1, 'slots': self._slots}, indent=1))
+        except Exception as e:
+            diagnostics.log_exception('save.catalog', e)
+
+    def _scan(self) -> dict:
+        """Rebuild entries from the files on disk (headers only for containers)"""
+        slots = {}
+        if not os.path.isdir(self.save_dir):
+            return slots
+        for name in os.listdir(self.save_dir):
+            if not self.is_save_file(name):
+                continue
+            path = os.path.join(self.save_dir, name)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                meta = SaveContainer.read_header(path).get('meta', {}) if data.startswith(SaveContainer.MAGIC) else {}
+                entry = {k: meta.get(k) for k in ('game_day', 'credits', 'location', 'planets', 'ships')}
+                entry.update({'saved_at': os.path.getmtime(path), 'bytes': len(data), 'crc32': zlib.crc32(data)})
+                slots[name] = entry
+            except Exception:
+                continue
+        return slots
+
+    def rebuild(self):
+        with self._lock:
+            self._slots = self._scan()
+            self._write()
+
+    def record(self, path: str, data, game_state: dict):
+        """Register a freshly written save file (data is exactly what was written)"""
+        raw = data if isinstance(data, bytes) else data.encode('utf-8')
+        meta = SaveContainer.summarize(game_state)
+        with self._lock:
+            slots = self._entries()
+            slots[os.path.basename(path)] = {
+                'saved_at': datetime.now().timestamp(),
+                'game_day': meta.get('game_day'),
+                'credits': meta.get('credits'),
+                'location': meta.get('location'),
+                'planets': meta.get('planets'),
+                'ships': meta.get('ships'),
+                'bytes': len(raw),
+                'crc32': zlib.crc32(raw),
+            }
+            self._prune(slots)
+            self._write()
+
+    def record_journal(self, path: str, game_state: dict, records: int):
+        """A journal append moved the slot forward without rewriting its checkpoint"""
+        meta = SaveContainer.summarize(game_state)
+        with self._lock:
+            entry = self._entries().get(os.path.basename(path))
+            if entry is None:
+                return
+            entry['journal'] = {'saved_at': datetime.now().timestamp(), 'game_day': meta.get('game_day'),
+                                'credits': meta.get('credits'), 'location': meta.get('location'),
+                                'ships': meta.get('ships'), 'records': records}
+            self._write()
+
+    @staticmethod
+    def current(entry: dict) -> dict:
+        """Slot metadata including journaled progress on top of its checkpoint"""
+        return dict(entry, **entry.get('journal', {}))
+
+    def rename(self, old_path: str, new_path: str):
+        """Mirror an on-disk slot rotation (no write; the following record() persists it)"""
+        with self._lock:
+            slots = self._entries()
+            entry = slots.pop(os.path.basename(old_path), None)
+            if entry is not None:
+                # The journal only ever extends autosave_1, so a rotated slot is its bare checkpoint
+                entry.pop('journal', None)
+                slots[os.path.basename(new_path)] = entry
+
+    def _prune(self, slots: dict):
+        keep = SETTINGS.get('save_keep_timestamped', 5)
+        stamped = sorted((n for n in slots if n.startswith('save_')), key=lambda n: slots[n].get('saved_at') or 0)
+        for name in stamped[:max(0, len(stamped) - keep)]:
+            try:
+                os.remove(os.path.join(self.save_dir, name))
+            except Exception:
+                pass
+            slots.pop(name, None)
+        for name in [n for n in slots if not os.path.exists(os.path.join(self.save_dir, n))]:
+            slots.pop(name, None)
+
+    def slots(self) -> list:
+        """[(file_name, entry)] newest first, without opening any save"""
+        with self._lock:
+            entries = dict(self._entries())
+        return sorted(((name, self.current(entry)) for name, entry in entries.items()),
+                      key=lambda kv: kv[1].get('saved_at') or 0, reverse=True)
+
+    def verify(self, name: str) -> bool:
+        """Size and checksum match what the writer recorded (no parsing)"""
+        with self._lock:
+            entry = self._entries().get(name)
+        if entry is None:
+            return False
+        try:
+            with open(os.path.join(self.save_dir, name), 'rb') as f:
+                data = f.read()
+        except Exception:
+            return False
+        return len(data) == entry.get('bytes') and zlib.crc32(data) == entry.get('crc32')
+
+def read_save_file(path: str, lazy: bool = False) -> dict:
+    """game_state from a binary container or a legacy JSON save; `lazy` decodes container sections on first use"""
+    if SaveContainer.is_container(path):
+        return LazyGameState(path) if lazy else SaveContainer.load(path)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def convert_legacy_saves(save_dir: str = 'saves') -> int:
+    """Rewrite old JSON saves as containers; originals are kept under saves/legacy/"""
+    converted = 0
+    if not os.path.isdir(save_dir):
+        return 0
+    for name in sorted(os.listdir(save_dir)):
+        if not name.endswith('.json') or not SaveCatalog.is_save_file(name):
+            continue
+        source = os.path.join(save_dir, name)
+        try:
+            with open(source, 'r') as f:
+                game_state = json.load(f)
+            stem = name[:-len('.json')]
+            target = os.path.join(save_dir, stem + SaveContainer.EXTENSION)
+            if os.path.exists(target):
+                target = os.path.join(save_dir, f"{stem}_legacy{SaveContainer.EXTENSION}")
+            SaveWriter.write_atomic(target, SaveContainer.encode(game_state))
+            os.makedirs(os.path.join(save_dir, 'legacy'), exist_ok=True)
+            os.replace(source, os.path.join(save_dir, 'legacy', name))
+            converted += 1
+        except Exception as e:
+            diagnostics.log_exception('save.convert_legacy', e)
+    if converted:
+        print(f'Converted {converted} legacy JSON save(s) to {SaveContainer.EXTENSION}')
+    return converted
+
+save_writer = SaveWriter()
+
+def save_game(background=True):
+    """Snapshot the world here, then serialize and write it on save_writer's thread"""
+    if save_writer.busy:
+        diagnostics.log_event('save.skipped', 'WARNING', 'Save already in progress')
+        return False
+    started = perf_counter()
+    game_state = snapshot_game_state()
+    return save_writer.submit(game_state, perf_counter() - started, background)
+
+def snapshot_game_state():
+    """Plain-data copy of the world (no live containers), safe to serialize on another thread"""
+    # Ship Entities may lag the batched movement arrays; sync before snapshotting
+    try:
+        unified_transport_system.flush_kinematics()
+        simulation_lod.sync_ships()
+    except Exception:
+        pass
     
     def vec3_to_list(v):
         try:
@@ -5112,13 +6603,19 @@ def save_game():
         except Exception:
             return [0.0, 0.0, 0.0]
     
+    def scale_to_list(v):
+        try:
+            return [float(v.x), float(v.y), float(v.z)]
+        except Exception:
+            return float(v) if isinstance(v, (int, float)) else 1.0
+    
     GAME_VERSION = '0.9.0'
     game_state = {
         'version': GAME_VERSION,
         'current_scene': scene_manager.current_state,
         'player_position': (player.position.x, player.position.y, player.position.z),
         'player_rotation': (player.rotation.x, player.rotation.y, player.rotation.z),
-        'planets': [(p.position.x, p.position.y, p.position.z, p.scale) for p in planets],
+        'planets': [(p.position.x, p.position.y, p.position.z, scale_to_list(p.scale)) for p in planets],
         # New detailed planet snapshot
         'planets_v2': [
             {
@@ -5126,14 +6623,14 @@ def save_game():
                 'type': getattr(p, 'planet_type', None),
                 'faction_id': getattr(p, 'faction_id', None),
                 'position': (p.position.x, p.position.y, p.position.z),
-                'scale': getattr(p, 'scale', 1),
+                'scale': scale_to_list(getattr(p, 'scale', 1)),
                 'has_fuel_station': getattr(p, 'has_fuel_station', False),
                 'fuel_price': getattr(p, 'fuel_price', 5),
                 'economy': (
                     {
-                        'stockpiles': getattr(p.enhanced_economy, 'stockpiles', {}),
-                        'daily_consumption': getattr(p.enhanced_economy, 'daily_consumption', {}),
-                        'daily_production': getattr(p.enhanced_economy, 'daily_production', {}),
+                        'stockpiles': dict(getattr(p.enhanced_economy, 'stockpiles', {})),
+                        'daily_consumption': dict(getattr(p.enhanced_economy, 'daily_consumption', {})),
+                        'daily_production': dict(getattr(p.enhanced_economy, 'daily_production', {})),
                         'credits': getattr(p.enhanced_economy, 'credits', 0),
                         'recent_attacks': getattr(p.enhanced_economy, 'recent_attacks', 0),
                         'minerals_reserve': getattr(p.enhanced_economy, 'minerals_reserve', 0),
@@ -5162,6 +6659,7 @@ def save_game():
         'ships': {
             'cargo': [
                 {
+                    'ship_id': getattr(cs, 'ship_id', None),
                     'origin': getattr(cs.origin, 'name', None),
                     'dest': getattr(cs.destination, 'name', None),
                     'position': vec3_to_list(cs.position),
@@ -5169,26 +6667,35 @@ def save_game():
                     'speed': getattr(cs, 'speed', 8.0),
                     'health': getattr(cs, 'health', 100),
                     'contract_id': getattr(cs, 'contract_id', None),
-                    'cargo': cs.cargo
+                    'cargo': dict(cs.cargo)
                 }
                 for cs in getattr(unified_transport_system, 'cargo_ships', [])
                 if hasattr(cs, 'origin') and hasattr(cs, 'destination')
             ],
             'message': [
                 {
+                    'ship_id': getattr(ms, 'ship_id', None),
                     'origin': getattr(ms.origin, 'name', None),
                     'dest': getattr(ms.destination, 'name', None),
                     'position': vec3_to_list(ms.position),
                     'waypoints': [vec3_to_list(wp) for wp in getattr(ms, 'waypoints', [])],
                     'speed': getattr(ms, 'speed', 12.0),
                     'health': getattr(ms, 'health', 100),
-                    'message_type': getattr(ms, 'message_type', None)
+                    'message_type': getattr(getattr(ms, 'message_type', None), 'value', getattr(ms, 'message_type', None)),
+                    'payload': serialize_mail(getattr(ms, 'message_type', None), getattr(ms, 'payload', None)),
+                    'bundle': [e for e in (serialize_mail(*item) for item in getattr(ms, 'bundle', None) or []) if e],
+                    'stops': [
+                        {'dest': getattr(stop, 'name', None),
+                         'bundle': [e for e in (serialize_mail(*item) for item in items) if e]}
+                        for stop, items in getattr(ms, 'stops', None) or []
+                    ]
                 }
                 for ms in getattr(unified_transport_system, 'message_ships', [])
                 if hasattr(ms, 'origin') and hasattr(ms, 'destination')
             ],
             'payment': [
                 {
+                    'ship_id': getattr(ps, 'ship_id', None),
                     'origin': getattr(ps.origin, 'name', None),
                     'dest': getattr(ps.destination, 'name', None),
                     'position': vec3_to_list(ps.position),
@@ -5201,7 +6708,9 @@ def save_game():
                 for ps in getattr(unified_transport_system, 'payment_ships', [])
                 if hasattr(ps, 'origin') and hasattr(ps, 'destination')
             ]
-        }
+        },
+        # Mail still waiting for a courier
+        'courier_queue': courier_dispatcher.snapshot()
     }
 
     # Persist player wallet and ship core state
@@ -5223,9 +6732,9 @@ def save_game():
                 'current': ship_systems.fuel_system.current_fuel,
             },
             'components': comps,
-            'spare_parts': ship_systems.spare_parts,
+            'spare_parts': dict(ship_systems.spare_parts),
             'navigation': {
-                'course_route': getattr(player, 'course_route', []),
+                'course_route': list(getattr(player, 'course_route', []) or []),
                 'course_index': getattr(player, 'course_route_index', 0),
                 'autopilot': getattr(player, 'autopilot', False)
             }
@@ -5233,21 +6742,7 @@ def save_game():
         # Persist physical communication state (mailboxes + news caches)
         try:
             game_state['planetary_mailboxes'] = {
-                planet: [
-                    {
-                        'letter_id': letter.letter_id,
-                        'message_type': letter.message_type.value,
-                        'sender_faction': letter.sender_faction,
-                        'sender_planet': letter.sender_planet,
-                        'recipient_faction': letter.recipient_faction,
-                        'recipient_planet': letter.recipient_planet,
-                        'subject': letter.subject,
-                        'content': letter.content,
-                        'timestamp': letter.timestamp,
-                        'urgency': letter.urgency.value,
-                        'requires_response': letter.requires_response
-                    } for letter in letters
-                ]
+                planet: [serialize_letter(letter) for letter in letters]
                 for planet, letters in physical_communication.planetary_mailboxes.items()
             }
             game_state['planetary_news'] = {
@@ -5259,7 +6754,9 @@ def save_game():
                         'source_planet': news.source_planet,
                         'timestamp': news.timestamp,
                         'reliability': news.reliability,
-                        'spread_count': news.spread_count
+                        'spread_count': news.spread_count,
+                        'events': [e.value for e in news.events],
+                        'mentions': [list(m) for m in news.mentions]
                     } for news in news_list
                 ]
                 for planet, news_list in physical_communication.planetary_news.items()
@@ -5269,7 +6766,22 @@ def save_game():
 
         # Persist faction heat
         try:
-            game_state['faction_heat'] = faction_system.player_heat
+            game_state['faction_heat'] = dict(faction_system.player_heat)
+        except Exception:
+            pass
+        # Persist simulation clock so saved timestamps stay in the same time base
+        try:
+            game_state['sim_clock'] = {'now': sim_clock.now, 'time_scale': sim_clock.time_scale}
+            game_state['time'] = {'game_day': time_system.game_day, 'day_length': time_system.day_length}
+        except Exception:
+            pass
+        # Where the player is, for the save catalog (nearest planet in space)
+        try:
+            if scene_manager.current_state == GameState.TOWN and nearby_planet is not None:
+                game_state['location'] = f"Landed on {nearby_planet.name}"
+            elif planets:
+                closest = min(planets, key=lambda p: (p.position - player.position).length())
+                game_state['location'] = f"Near {closest.name}"
         except Exception:
             pass
         # Persist contract registry states (including insurance and knowledge flags)
@@ -5303,24 +6815,6 @@ def save_game():
 
     # Serialize dynamic contracts (available + active)
     try:
-        def serialize_contract(c: Contract):
-            return {
-                'contract_id': c.contract_id,
-                'mission_type': c.mission_type.value,
-                'client_faction': c.client_faction,
-                'title': c.title,
-                'description': c.description,
-                'objectives': c.objectives,
-                'rewards': c.rewards,
-                'penalties': c.penalties,
-                'time_limit': c.time_limit,
-                'difficulty': c.difficulty,
-                'requirements': c.requirements,
-                'status': c.status.value,
-                'start_time': c.start_time,
-                'completion_time': c.completion_time,
-                'metadata': c.metadata,
-            }
         game_state['dynamic_contracts'] = {
             'available': [serialize_contract(c) for c in dynamic_contracts.available_contracts],
             'active': [serialize_contract(c) for c in dynamic_contracts.active_contracts],
@@ -5335,49 +6829,81 @@ def save_game():
             scene_manager.town_controller.position.y,
             scene_manager.town_controller.position.z
         )
-    
-    # Rolling autosave slots (autosave_1..3)
+    return game_state
+
+def describe_latest_save():
+    """One-line summary of the newest save, from the catalog only"""
     try:
-        # Shift existing autosaves
-        for i in range(3, 1, -1):
-            older = f'saves/autosave_{i-1}.json'
-            newer = f'saves/autosave_{i}.json'
-            if os.path.exists(older):
-                try:
-                    os.replace(older, newer)
-                except Exception:
-                    pass
-        # Write newest autosave_1
-        with open('saves/autosave_1.json', 'w') as f:
-            json.dump(game_state, f)
-        print('Game autosaved (slot 1).')
+        slots = save_writer.catalog.slots()
+        if not slots:
+            return None
+        _, entry = slots[0]
+        parts = [f"Day {entry['game_day']}" if entry.get('game_day') is not None else None,
+                 entry.get('location'),
+                 f"{int(entry['credits']):,} cr" if isinstance(entry.get('credits'), (int, float)) else None]
+        return ', '.join(p for p in parts if p) or datetime.fromtimestamp(entry.get('saved_at') or 0).strftime('%Y-%m-%d %H:%M')
     except Exception:
-        # Fallback timestamped save
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'saves/save_{timestamp}.json'
-        with open(filename, 'w') as f:
-            json.dump(game_state, f)
-        print(f'Game saved to {filename}')
+        return None
+
 def load_game():
+    # Never read a slot the save worker is still writing
+    save_writer.wait()
     if not os.path.exists('saves'):
         print('No saves directory found')
         return
         
-    save_files = [f for f in os.listdir('saves') if f.endswith('.json')]
-    if not save_files:
+    catalog = save_writer.catalog
+    if SETTINGS.get('save_format', 'binary') == 'binary' and convert_legacy_saves('saves'):
+        catalog.rebuild()
+    slots = catalog.slots()
+    if not slots:
         print('No save files found')
         return
         
-    # Load the most recent save file
-    latest_save = max(save_files)
-    with open(f'saves/{latest_save}', 'r') as f:
-        game_state = json.load(f)
+    # Load the most recent save whose checksum matches the catalog; skip damaged ones
+    latest_save = None
+    for name, _ in slots:
+        if catalog.verify(name):
+            latest_save = name
+            break
+        print(f'⚠️ Save {name} failed its checksum, trying an older slot')
+        diagnostics.log_event('save.corrupted', 'WARNING', f'Checksum mismatch for {name}')
+    if latest_save is None:
+        print('No intact save files found')
+        return
+    # Sections are decoded as the restore below reaches them (player, planets, contracts, news, ships)
+    game_state = read_save_file(f'saves/{latest_save}', lazy=True)
+    # Bring the checkpoint up to date with journaled deltas, then checkpoint afresh on the next save
+    try:
+        replayed = save_writer.journal.replay(game_state)
+        if replayed:
+            print(f'Replayed {replayed} journal record(s) onto {latest_save}')
+    except Exception as e:
+        diagnostics.log_exception('load.journal', e)
+    save_writer.journal.reset()
     try:
         version = game_state.get('version', 'unknown')
         if version != '0.9.0':
             print(f"ℹ️ Loading save version {version}. Current game version 0.9.0. Attempting compatibility load...")
     except Exception:
         pass
+    # Restore simulation time before any timestamps are rebuilt
+    try:
+        clock_state = game_state.get('sim_clock') or {}
+        if 'now' in clock_state:
+            # Never rewind: running timers in this session were set against the current clock
+            sim_clock.now = max(sim_clock.now, float(clock_state['now']))
+            sim_clock.accumulator = 0.0
+        if 'time_scale' in clock_state:
+            sim_clock.set_time_scale(clock_state['time_scale'])
+        time_state = game_state.get('time') or {}
+        if 'game_day' in time_state:
+            time_system.game_day = int(time_state['game_day'])
+            time_system.last_day_update = sim_clock.now
+        if 'day_length' in time_state:
+            time_system.set_day_length(time_state['day_length'])
+    except Exception:
+        pass
     
     # Switch to correct scene
     if game_state['current_scene'] == GameState.TOWN:
@@ -5391,19 +6917,20 @@ def load_game():
     
     # Restore planets
     for p in planets:
-        destroy(p)
+        if getattr(p, 'enhanced_economy', None) is not None:
+            sim_scheduler.cancel_owner(p.enhanced_economy)
+    planet_renderer.release_all()
     planets.clear()
+    planet_names.clear()
+    world_registry.clear_planets()
+    galaxy_graph.clear()
+    supplier_index.clear()
     
     if 'planets_v2' in game_state and game_state['planets_v2']:
         for entry in game_state['planets_v2']:
             pos = entry.get('position', (0, 0, 0))
-            planet = Planet(position=Vec3(pos[0], pos[1], pos[2]))
-            if entry.get('scale') is not None:
-                planet.scale = entry['scale']
-            if entry.get('name'):
-                planet.name = entry['name']
-            if entry.get('type'):
-                planet.planet_type = entry['type']
+            planet = Planet(position=Vec3(pos[0], pos[1], pos[2]), planet_type=entry.get('type'),
+                            name=entry.get('name'), scale=entry.get('scale'))
             if entry.get('faction_id'):
                 planet.faction_id = entry['faction_id']
             planet.has_fuel_station = entry.get('has_fuel_station', False)
@@ -5432,17 +6959,19 @@ def load_game():
     else:
         # Backward compatibility
         for p_data in game_state.get('planets', []):
-            planet = Planet(position=Vec3(p_data[0], p_data[1], p_data[2]))
-            planet.scale = p_data[3]
+            planet = Planet(position=Vec3(p_data[0], p_data[1], p_data[2]), scale=p_data[3])
             planets.append(planet)
+    galaxy_graph.rebuild(planets)
+    planet_renderer.refresh()
+    simulation_lod.invalidate()
     
     # Restore contract registry (best-effort)
     try:
         contract_registry._contracts.clear()
         for entry in game_state.get('contracts', []):
             # Map names back to planet objects
-            origin = next((p for p in planets if getattr(p, 'name', None) == entry.get('origin')), None)
-            dest = next((p for p in planets if getattr(p, 'name', None) == entry.get('dest')), None)
+            origin = world_registry.planet(entry.get('origin'))
+            dest = world_registry.planet(entry.get('dest'))
             cid = entry.get('id') or contract_registry._next_id()
             contract_registry._contracts[cid] = {
                 'origin': origin,
@@ -5455,8 +6984,8 @@ def load_game():
             }
         # Load enhanced contract details if present
         for entry in game_state.get('transport_contracts', []):
-            origin = next((p for p in planets if getattr(p, 'name', None) == entry.get('origin')), None)
-            dest = next((p for p in planets if getattr(p, 'name', None) == entry.get('dest')), None)
+            origin = world_registry.planet(entry.get('origin'))
+            dest = world_registry.planet(entry.get('dest'))
             cid = entry.get('id') or contract_registry._next_id()
             contract_registry._contracts[cid] = {
                 'origin': origin,
@@ -5485,19 +7014,7 @@ def load_game():
             restored = []
             for l in letters:
                 try:
-                    restored.append(PhysicalLetter(
-                        letter_id=l['letter_id'],
-                        message_type=MessageType(l['message_type']),
-                        sender_faction=l.get('sender_faction',''),
-                        sender_planet=l.get('sender_planet',''),
-                        recipient_faction=l.get('recipient_faction',''),
-                        recipient_planet=l.get('recipient_planet',''),
-                        subject=l.get('subject',''),
-                        content=l.get('content',''),
-                        timestamp=l.get('timestamp', time.time()),
-                        urgency=UrgencyLevel(l.get('urgency','NORMAL')),
-                        requires_response=l.get('requires_response', False)
-                    ))
+                    restored.append(restore_letter(l))
                 except Exception:
                     continue
             physical_communication.planetary_mailboxes[planet] = restored
@@ -5506,6 +7023,14 @@ def load_game():
             restored_news = []
             for n in news_list:
                 try:
+                    if 'events' in n:
+                        events = tuple(NewsEvent(v) for v in n['events'])
+                    else:
+                        events = PhysicalCommunicationSystem.classify_news(n['headline'], n['details'])
+                    if 'mentions' in n:
+                        mentions = tuple(tuple(m) for m in n['mentions'])
+                    else:
+                        mentions = PhysicalCommunicationSystem.extract_mentions(n['headline'], n['details'])
                     restored_news.append(PlanetaryNews(
                         news_id=n['news_id'],
                         headline=n['headline'],
@@ -5513,11 +7038,14 @@ def load_game():
                         source_planet=n['source_planet'],
                         timestamp=n['timestamp'],
                         reliability=n.get('reliability', 0.8),
-                        spread_count=n.get('spread_count', 0)
+                        spread_count=n.get('spread_count', 0),
+                        events=events,
+                        mentions=mentions
                     ))
                 except Exception:
                     continue
             physical_communication.planetary_news[planet] = restored_news
+        physical_communication.rebuild_news_indexes()
     except Exception:
         pass
 
@@ -5531,6 +7059,8 @@ def load_game():
     # Restore in-flight ships (best-effort)
     try:
         # Clear any existing ships
+        simulation_lod.reset()
+        courier_dispatcher.clear()
         unified_transport_system.message_ships.clear()
         unified_transport_system.cargo_ships.clear()
         unified_transport_system.payment_ships.clear()
@@ -5544,8 +7074,8 @@ def load_game():
         ships = game_state.get('ships', {})
         # Cargo
         for entry in ships.get('cargo', []):
-            origin = next((p for p in planets if getattr(p, 'name', None) == entry.get('origin')), None)
-            dest = next((p for p in planets if getattr(p, 'name', None) == entry.get('dest')), None)
+            origin = world_registry.planet(entry.get('origin'))
+            dest = world_registry.planet(entry.get('dest'))
             if not origin or not dest:
                 continue
             cs = CargoShip(origin, dest, entry.get('cargo', {}))
@@ -5554,25 +7084,37 @@ def load_game():
             cs.speed = entry.get('speed', cs.speed)
             cs.health = entry.get('health', cs.health)
             cs.contract_id = entry.get('contract_id', None)
+            cs.ship_id = entry.get('ship_id') or cs.ship_id
             unified_transport_system.cargo_ships.append(cs)
 
         # Message
         for entry in ships.get('message', []):
-            origin = next((p for p in planets if getattr(p, 'name', None) == entry.get('origin')), None)
-            dest = next((p for p in planets if getattr(p, 'name', None) == entry.get('dest')), None)
+            origin = world_registry.planet(entry.get('origin'))
+            dest = world_registry.planet(entry.get('dest'))
             if not origin or not dest:
                 continue
-            ms = MessageShip(origin, dest, entry.get('message_type', None), payload=None)
+            bundle = [mail for mail in (restore_mail(e) for e in entry.get('bundle') or [entry.get('payload') or {}]) if mail]
+            if not bundle:
+                continue  # Nothing deliverable aboard (older saves did not record payloads)
+            ms = MessageShip(origin, dest, *bundle[0])
+            ms.bundle = bundle
+            ms.stops = []
+            for stop in entry.get('stops', []):
+                stop_planet = world_registry.planet(stop.get('dest'))
+                items = [mail for mail in (restore_mail(e) for e in stop.get('bundle', [])) if mail]
+                if stop_planet and items:
+                    ms.stops.append((stop_planet, items))
             ms.position = list_to_vec3(entry.get('position', [0, 0, 0]))
             ms.waypoints = [list_to_vec3(v) for v in entry.get('waypoints', [])]
             ms.speed = entry.get('speed', ms.speed)
             ms.health = entry.get('health', ms.health)
+            ms.ship_id = entry.get('ship_id') or ms.ship_id
             unified_transport_system.message_ships.append(ms)
 
         # Payment
         for entry in ships.get('payment', []):
-            origin = next((p for p in planets if getattr(p, 'name', None) == entry.get('origin')), None)
-            dest = next((p for p in planets if getattr(p, 'name', None) == entry.get('dest')), None)
+            origin = world_registry.planet(entry.get('origin'))
+            dest = world_registry.planet(entry.get('dest'))
             if not origin or not dest:
                 continue
             ps = PaymentShip(origin, dest, entry.get('credits', 0))
@@ -5581,7 +7123,10 @@ def load_game():
             ps.speed = entry.get('speed', ps.speed)
             ps.health = entry.get('health', ps.health)
             ps.contract_id = entry.get('contract_id', None)
+            ps.ship_id = entry.get('ship_id') or ps.ship_id
             unified_transport_system.payment_ships.append(ps)
+
+        courier_dispatcher.restore(game_state.get('courier_queue'))
     except Exception:
         pass
     
@@ -5609,7 +7154,7 @@ def load_game():
                         difficulty=obj.get('difficulty', 1),
                         requirements=obj.get('requirements', {}),
                         status=ContractStatus(obj.get('status', 'AVAILABLE')),
-                        start_time=obj.get('start_time', time.time()),
+                        start_time=obj.get('start_time', sim_clock.now),
                         completion_time=obj.get('completion_time'),
                         metadata=obj.get('metadata')
                     )
@@ -5672,41 +7217,383 @@ save_button.on_click = save_game
 load_button.on_click = load_game
 quit_button.on_click = quit_game
 
+# ===== GALAXY GRAPH =====
+
+def _distance(a: 'Vec3', b: 'Vec3') -> float:
+    try:
+        return (a - b).length()
+    except Exception:
+        return 0.0
+
+class GalaxyGraph:
+    """k-nearest-neighbour lane graph over planets, backed by a SpatialHashGrid.
+
+    Every planet links to its k nearest others and links are undirected, so an
+    edge exists while either endpoint lists the other among its own k nearest.
+    Planets can be inserted and removed one at a time; only the planets whose
+    k-nearest sets change are touched.
+    """
+    def __init__(self, k_neighbors=3, cell_size=200.0):
+        self.k = max(1, int(k_neighbors))
+        self.grid = SpatialHashGrid(cell_size)
+        self.adjacency = {}  # name -> {neighbor_name: distance}
+        self._own = {}       # name -> set of names this planet picked as its k nearest
+        self._reach = {}     # name -> distance to its k-th nearest (inf while it has fewer)
+        self._unfull = set() # names with fewer than k picks (only while the galaxy has <= k planets)
+        self._planets = {}   # name -> planet
+        self._reach_heap = []  # (-reach, name) max-heap of finite reaches; stale entries skipped on read
+
+    def __len__(self):
+        return len(self._planets)
+
+    def __contains__(self, name):
+        return name in self._planets
+
+    def clear(self):
+        self.grid.clear()
+        self.adjacency.clear()
+        self._own.clear()
+        self._reach.clear()
+        self._unfull.clear()
+        self._planets.clear()
+        self._reach_heap.clear()
+
+    def _pos(self, name):
+        return self._planets[name].position
+
+    def _k_nearest(self, name):
+        """(name, distance) of the k nearest other planets"""
+        found = self.grid.nearest(self._pos(name), k=self.k + 1)
+        out = []
+        for q in found:
+            qname = getattr(q, 'name', None)
+            if qname == name or qname not in self._planets:
+                continue
+            out.append((qname, _distance(self._pos(name), q.position)))
+        return out[:self.k]
+
+    def _link(self, a, b, w):
+        self.adjacency[a][b] = w
+        self.adjacency[b][a] = w
+
+    def _unlink_if_unused(self, a, b):
+        if b in self._own.get(a, ()) or a in self._own.get(b, ()):
+            return
+        self.adjacency.get(a, {}).pop(b, None)
+        self.adjacency.get(b, {}).pop(a, None)
+
+    def _pick(self, name):
+        """(Re)compute a planet's own k nearest and link them"""
+        old_own = self._own.get(name, set())
+        picks = self._k_nearest(name)
+        self._own[name] = {q for q, _ in picks}
+        for q, w in picks:
+            self._link(name, q, w)
+        for q in old_own - self._own[name]:
+            self._unlink_if_unused(name, q)
+        if len(picks) >= self.k:
+            reach = picks[-1][1]
+            self._unfull.discard(name)
+            if reach != self._reach.get(name):
+                heapq.heappush(self._reach_heap, (-reach, name))
+        else:
+            reach = float('inf')
+            self._unfull.add(name)
+        self._reach[name] = reach
+
+    def _max_reach(self):
+        """Largest current finite reach (0.0 if none)"""
+        heap = self._reach_heap
+        if len(heap) > 4 * len(self._reach) + 64:
+            heap[:] = [(-r, q) for q, r in self._reach.items() if math.isfinite(r)]
+            heapq.heapify(heap)
+        while heap and self._reach.get(heap[0][1]) != -heap[0][0]:
+            heapq.heappop(heap)
+        return -heap[0][0] if heap else 0.0
+
+    def rebuild(self, planets, k_neighbors=None):
+        """Bulk build from a planet list (use this for whole galaxies; add() is for single planets)"""
+        if k_neighbors is not None:
+            self.k = max(1, int(k_neighbors))
+        self.clear()
+        named = [p for p in planets if getattr(p, 'name', None)]
+        if named:
+            # About four planets per occupied cell on the XZ plane
+            xs = [float(p.position.x) for p in named]
+            zs = [float(p.position.z) for p in named]
+            extent = max(max(xs) - min(xs), max(zs) - min(zs), 1.0)
+            self.grid.cell_size = max(1.0, 2.0 * extent / math.sqrt(len(named)))
+        for p in named:
+            self._planets[p.name] = p
+            self.adjacency[p.name] = {}
+            self.grid.update(p, p.position)
+        for p in named:
+            self._pick(p.name)
+        self._topology_changed()
+
+    def add(self, planet):
+        """Insert one planet and update the neighbours it displaces"""
+        name = getattr(planet, 'name', None)
+        if not name:
+            return
+        if name in self._planets:
+            self.remove(name)
+        self._planets[name] = planet
+        self.adjacency[name] = {}
+        self.grid.update(planet, planet.position)
+        self._pick(name)
+        # Planets that now have the newcomer among their k nearest: those whose reach covers
+        # it (all within the largest reach) plus any that still have fewer than k picks
+        limit = self._max_reach()
+        candidates = self.grid.query_radius(planet.position, limit) if limit > 0 else []
+        candidates.extend(self._planets[q] for q in self._unfull if q != name)
+        for q in candidates:
+            qname = getattr(q, 'name', None)
+            if qname == name or qname not in self._planets:
+                continue
+            if _distance(planet.position, q.position) < self._reach.get(qname, float('inf')):
+                self._pick(qname)
+        self._topology_changed()
+
+    def remove(self, planet_or_name):
+        """Drop one planet; planets that had picked it choose a replacement"""
+        name = planet_or_name if isinstance(planet_or_name, str) else getattr(planet_or_name, 'name', None)
+        planet = self._planets.pop(name, None)
+        if planet is None:
+            return
+        self.grid.remove(planet)
+        affected = [q for q in self.adjacency.pop(name, {}) if name in self._own.get(q, ())]
+        for q in self.adjacency:
+            self.adjacency[q].pop(name, None)
+        self._own.pop(name, None)
+        self._reach.pop(name, None)
+        self._unfull.discard(name)
+        for q in affected:
+            self._own[q].discard(name)
+            self._pick(q)
+        self._topology_changed()
+
+    def _topology_changed(self):
+        try:
+            route_planner.invalidate_all()
+        except Exception:
+            pass
+
+    def neighbors(self, name):
+        return self.adjacency.get(name, {})
+
+    def within(self, position, radius):
+        """Planets within radius of a position, nearest first"""
+        return self.grid.query_radius(position, radius, nearest_first=True)
+
+    def nearest(self, position, k=1):
+        return self.grid.nearest(position, k=k)
+
+galaxy_graph = GalaxyGraph()
+planet_graph = galaxy_graph.adjacency  # name -> {neighbor_name: distance}
+
+# ===== WORLD REGISTRY =====
+
+class WorldRegistry:
+    """Stable integer IDs and indexed lookups for planets and transport ships.
+
+    Planets register themselves when created and re-index when their type or faction
+    changes; ships register when they join one of the transport manager's ShipGroups.
+    Every index holds weak references, so an entity dropped by its owner falls out of
+    lookups on its own.
+    """
+    def __init__(self):
+        self._next_id = 1
+        self._by_id = weakref.WeakValueDictionary()
+        self._planets_by_name = weakref.WeakValueDictionary()
+        self._planets_by_faction = {}  # faction id -> WeakSet of planets
+        self._planets_by_type = {}     # planet type -> WeakSet of planets
+        self._ships_by_kind = {}       # ship kind -> WeakSet of ships
+
+    def _assign_id(self, entity):
+        entity_id = getattr(entity, 'entity_id', None)
+        if entity_id is None:
+            entity_id = self._next_id
+            self._next_id += 1
+            entity.entity_id = entity_id
+        self._by_id[entity_id] = entity
+        return entity_id
+
+    @staticmethod
+    def _index(index, key, entity):
+        if key is not None:
+            index.setdefault(key, weakref.WeakSet()).add(entity)
+
+    @staticmethod
+    def _unindex(index, key, entity):
+        members = index.get(key)
+        if members is not None:
+            members.discard(entity)
+            if not members:
+                del index[key]
+
+    def get(self, entity_id):
+        return self._by_id.get(entity_id)
+
+    def is_registered(self, entity):
+        entity_id = getattr(entity, 'entity_id', None)
+        return entity_id is not None and self._by_id.get(entity_id) is entity
+
+    # --- planets ---
+    def add_planet(self, planet):
+        self._assign_id(planet)
+        self._planets_by_name[planet.name] = planet
+        self._index(self._planets_by_type, getattr(planet, 'planet_type', None), planet)
+        self._index(self._planets_by_faction, getattr(planet, 'faction_id', None), planet)
+
+    def remove_planet(self, planet):
+        if self._planets_by_name.get(getattr(planet, 'name', None)) is planet:
+            del self._planets_by_name[planet.name]
+        self._unindex(self._planets_by_type, getattr(planet, 'planet_type', None), planet)
+        self._unindex(self._planets_by_faction, getattr(planet, 'faction_id', None), planet)
+        self._by_id.pop(getattr(planet, 'entity_id', None), None)
+
+    def planet_changed(self, planet, field, old, new):
+        """Move a registered planet between type/faction buckets"""
+        if old == new or not self.is_registered(planet):
+            return
+        index = self._planets_by_type if field == 'planet_type' else self._planets_by_faction
+        self._unindex(index, old, planet)
+        self._index(index, new, planet)
+
+    def clear_planets(self):
+        for planet in list(self._planets_by_name.values()):
+            self._by_id.pop(getattr(planet, 'entity_id', None), None)
+        self._planets_by_name.clear()
+        self._planets_by_faction.clear()
+        self._planets_by_type.clear()
+
+    def planet(self, name):
+        """Planet by name, or None"""
+        return self._planets_by_name.get(name) if name is not None else None
+
+    def planets_of_faction(self, faction_id):
+        return list(self._planets_by_faction.get(faction_id, ()))
+
+    def planets_of_type(self, planet_type):
+        return list(self._planets_by_type.get(planet_type, ()))
+
+    def planet_types(self):
+        return list(self._planets_by_type)
+
+    # --- ships ---
+    def add_ship(self, ship, kind):
+        self._assign_id(ship)
+        ship._ship_kind = kind
+        self._index(self._ships_by_kind, kind, ship)
+
+    def remove_ship(self, ship):
+        self._unindex(self._ships_by_kind, getattr(ship, '_ship_kind', None), ship)
+        self._by_id.pop(getattr(ship, 'entity_id', None), None)
+
+    def ships_of_kind(self, kind):
+        return list(self._ships_by_kind.get(kind, ()))
+
+    def stats(self):
+        return {'entities': len(self._by_id), 'planets': len(self._planets_by_name),
+                'ships': {kind: len(members) for kind, members in self._ships_by_kind.items()}}
+
+world_registry = WorldRegistry()
+
+class ShipGroup:
+    """Insertion-ordered set of one kind of transport ship.
+
+    Keeps the list interface the rest of the game uses (append, remove, `in`,
+    iteration, len, indexing) but membership tests and removal are O(1), and every
+    ship is registered with world_registry under the group's kind.
+    """
+    def __init__(self, kind):
+        self.kind = kind
+        self._ships = {}  # id(ship) -> ship; the group holds the owning reference
+
+    def append(self, ship):
+        if id(ship) not in self._ships:
+            self._ships[id(ship)] = ship
+            world_registry.add_ship(ship, self.kind)
+
+    add = append
+
+    def extend(self, ships):
+        for ship in ships:
+            self.append(ship)
+
+    def discard(self, ship):
+        if self._ships.get(id(ship)) is ship:
+            del self._ships[id(ship)]
+            world_registry.remove_ship(ship)
+            return True
+        return False
+
+    def remove(self, ship):
+        if not self.discard(ship):
+            raise ValueError(f"ship not in {self.kind} group")
+
+    def clear(self):
+        for ship in self._ships.values():
+            world_registry.remove_ship(ship)
+        self._ships.clear()
+
+    def __contains__(self, ship):
+        return self._ships.get(id(ship)) is ship
+
+    def __iter__(self):
+        # Snapshot, so callers may add or remove ships while looping
+        return iter(list(self._ships.values()))
+
+    def __len__(self):
+        return len(self._ships)
+
+    def __bool__(self):
+        return bool(self._ships)
+
+    def __getitem__(self, index):
+        return list(self._ships.values())[index]
+
 # Planet class
-class Planet(Entity):
-    def __init__(self, position=(0,0,0)):
-        # Define planet types and their characteristics
-        planet_types = {
-            "agricultural": {"color": color.green, "name_prefix": "Agri"},
-            "industrial": {"color": color.gray, "name_prefix": "Forge"},
-            "mining": {"color": color.brown, "name_prefix": "Mine"},
-            "tech": {"color": color.blue, "name_prefix": "Tech"},
-            "luxury": {"color": color.magenta, "name_prefix": "Haven"},
-            "desert": {"color": color.yellow, "name_prefix": "Dune"},
-            "ice": {"color": color.cyan, "name_prefix": "Frost"},
-            "volcanic": {"color": color.red, "name_prefix": "Ember"},
-            "gas_giant": {"color": color.violet, "name_prefix": "Storm"},
-            "oceanic": {"color": color.azure, "name_prefix": "Aqua"}
-        }
-        
+PLANET_TYPES = {
+    "agricultural": {"color": color.green, "name_prefix": "Agri"},
+    "industrial": {"color": color.gray, "name_prefix": "Forge"},
+    "mining": {"color": color.brown, "name_prefix": "Mine"},
+    "tech": {"color": color.blue, "name_prefix": "Tech"},
+    "luxury": {"color": color.magenta, "name_prefix": "Haven"},
+    "desert": {"color": color.yellow, "name_prefix": "Dune"},
+    "ice": {"color": color.cyan, "name_prefix": "Frost"},
+    "volcanic": {"color": color.red, "name_prefix": "Ember"},
+    "gas_giant": {"color": color.violet, "name_prefix": "Storm"},
+    "oceanic": {"color": color.azure, "name_prefix": "Aqua"}
+}
+
+planet_names = set()
+
+class Planet:
+    """Simulation record for one planet.
+
+    Holds everything the economy, routing and save code read (name, type, position,
+    scale, economy, fuel). The visible sphere is a separate pooled Entity that
+    planet_renderer attaches as `body` only while the player is within render range.
+    """
+    def __init__(self, position=(0,0,0), planet_type=None, name=None, scale=None):
         # Randomly select planet type
-        self.planet_type = random.choice(list(planet_types.keys()))
-        planet_data = planet_types[self.planet_type]
-        
-        super().__init__(
-            model='sphere',
-            color=planet_data["color"].tint(random.uniform(-0.3, 0.3)),
-            position=position,
-            scale=random.uniform(20, 50),  # Scaled down from 2000-5000
-            texture='white_cube',
-            collider='sphere'
-        )
-        # Remove rotation by setting speed to 0
-        self.rotation_speed = Vec3(0, 0, 0)
-        # Add landing detection radius (use scalar X component of scale)
-        self.landing_radius = float(self.scale.x) * 2
-        # Add name for the planet
-        self.name = f"{planet_data['name_prefix']}-{random.randint(100, 999)}"
+        self.planet_type = planet_type if planet_type in PLANET_TYPES else random.choice(list(PLANET_TYPES.keys()))
+        planet_data = PLANET_TYPES[self.planet_type]
+        self.body = None
+        self._color = planet_data["color"].tint(random.uniform(-0.3, 0.3))
+        self.position = position if isinstance(position, Vec3) else Vec3(*position)
+        self.scale = scale if scale is not None else random.uniform(20, 50)  # Scaled down from 2000-5000
+        # Add name for the planet (unique, since routing and economies key on it)
+        self.name = name or f"{planet_data['name_prefix']}-{random.randint(100, 999)}"
+        if self.name in planet_names:
+            base, n = self.name, 2
+            while f"{base}-{n}" in planet_names:
+                n += 1
+            self.name = f"{base}-{n}"
+        planet_names.add(self.name)
+        world_registry.add_planet(self)
         
         # Initialize enhanced economy
         self.enhanced_economy = None  # Will be initialized later
@@ -5717,26 +7604,148 @@ class Planet(Entity):
         
         # Generate market for this planet (keep for compatibility)
         market_system.generate_market_for_planet(self.name, self.planet_type)
-    
-    def update(self):
-        pass  # Remove rotation update
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        if isinstance(value, (int, float)):
+            value = Vec3(value, value, value)
+        elif not isinstance(value, Vec3):
+            value = Vec3(*value)
+        self._scale = value
+        # Landing detection radius (use scalar X component of scale)
+        self.landing_radius = float(value.x) * 2
+        if self.body is not None:
+            self.body.scale = value
+
+    @property
+    def planet_type(self):
+        return self._planet_type
+
+    @planet_type.setter
+    def planet_type(self, value):
+        old = self.__dict__.get('_planet_type')
+        self._planet_type = value
+        world_registry.planet_changed(self, 'planet_type', old, value)
+
+    @property
+    def faction_id(self):
+        return self._faction_id  # AttributeError until a faction claims the planet
+
+    @faction_id.setter
+    def faction_id(self, value):
+        old = self.__dict__.get('_faction_id')
+        self._faction_id = value
+        world_registry.planet_changed(self, 'faction_id', old, value)
+
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        self._color = value
+        if self.body is not None:
+            self.body.color = value
         
     def is_player_in_landing_range(self, player_position):
         # Calculate distance to player
         distance = (self.position - player_position).length()
         return distance < self.landing_radius
 
+def _build_planet_body():
+    return Entity(model='sphere', texture='white_cube', collider='sphere')
+
+class PlanetRenderer:
+    """Keeps sphere Entities only for planets near the player.
+
+    `refresh()` asks galaxy_graph for planets within `render_range` of the camera
+    anchor, gives the nearest `max_bodies` of them a pooled sphere and returns the
+    rest to entity_pool, so scene-graph cost follows what is on screen rather than
+    galaxy size.
+    """
+    def __init__(self, render_range=3000.0, max_bodies=300):
+        self.render_range = render_range
+        self.max_bodies = max_bodies
+        self.visible = True
+        self._shown = {}  # planet name -> planet
+
+    def __len__(self):
+        return len(self._shown)
+
+    def _attach(self, planet):
+        planet.body = entity_pool.acquire('planet_body', _build_planet_body,
+                                          position=planet.position, scale=planet.scale,
+                                          color=planet.color)
+        planet.body.planet = planet
+        self._shown[planet.name] = planet
+
+    def _detach(self, planet):
+        self._shown.pop(planet.name, None)
+        body, planet.body = planet.body, None
+        if body is not None:
+            body.planet = None
+            entity_pool.release(body, kind='planet_body')
+
+    def refresh(self, position=None):
+        if not self.visible:
+            self.release_all()
+            return
+        if position is None:
+            try:
+                position = player.position
+            except Exception:
+                return
+        wanted = {}
+        for planet in galaxy_graph.within(position, self.render_range)[:self.max_bodies]:
+            wanted[planet.name] = planet
+        for name, planet in list(self._shown.items()):
+            if wanted.get(name) is not planet:
+                self._detach(planet)
+        for name, planet in wanted.items():
+            if name not in self._shown:
+                self._attach(planet)
+
+    def release_all(self):
+        for planet in list(self._shown.values()):
+            self._detach(planet)
+
+    def set_visible(self, visible):
+        self.visible = bool(visible)
+        self.refresh()
+
+planet_renderer = PlanetRenderer()
+frame_scheduler.every(0.5, planet_renderer.refresh, jitter=0, first_delay=0, name='planet_render')
+
+def nearest_planet_to(position):
+    """(planet, distance) of the closest planet, or (None, inf)"""
+    hits = galaxy_graph.nearest(position, k=1)
+    found = hits[0] if hits else None
+    if found is None:
+        return None, float('inf')
+    return found, (found.position - position).length()
+
 # Create planets
+# GAME_GALAXY_SIZE sets the planet count; larger galaxies widen into a disc of constant density
+try:
+    GALAXY_SIZE = max(1, int(os.environ.get('GAME_GALAXY_SIZE', '15')))
+except Exception:
+    GALAXY_SIZE = 15
+GALAXY_RADIUS = 500.0 * max(1.0, GALAXY_SIZE / 15.0) ** 0.5
 planets = []
-for _ in range(15):
+for _ in range(GALAXY_SIZE):
     pos = Vec3(
+        random.uniform(-GALAXY_RADIUS, GALAXY_RADIUS),
         random.uniform(-500, 500),
-        random.uniform(-500, 500),
-        random.uniform(-500, 500)
+        random.uniform(-GALAXY_RADIUS, GALAXY_RADIUS)
     )
     if pos.length() > 100:
         planet = Planet(position=pos)
         planets.append(planet)
+galaxy_graph.rebuild(planets)
 
 # Landing prompt UI (now managed via UIManager)
 landing_prompt = Panel(
@@ -5788,6 +7797,179 @@ landing_hide_threshold = 40.0
 
 # ===== TRANSPORT SHIP CLASSES =====
 
+# ===== ENTITY POOLS =====
+
+class EntityPool:
+    """Free lists of disabled Entities keyed by kind, reused instead of Entity()/destroy().
+
+    Constructing and destroying Panda3D nodes under heavy traffic churns the scene
+    graph and causes frame hitches, so ship shells, planet bodies, combat FX and
+    military hulls are parked here when they go out of service. Each kind keeps at
+    most `max_free_per_kind` spares; anything beyond that is destroyed as before.
+    """
+
+    def __init__(self, max_free_per_kind: int = 512):
+        self.max_free_per_kind = max_free_per_kind
+        self._free = {}
+        self._root = None
+        self.created = 0
+        self.reused = 0
+
+    def _parking(self):
+        # Hidden parent for released children, so destroying their old parent spares them
+        if self._root is None:
+            self._root = Entity(enabled=False)
+        return self._root
+
+    def take(self, kind: str):
+        """A pooled Entity of this kind (re-enabled), or None if none are free"""
+        free = self._free.get(kind)
+        if not free:
+            return None
+        entity = free.pop()
+        entity._pool_free = False
+        entity.enabled = True
+        self.reused += 1
+        return entity
+
+    def acquire(self, kind: str, factory, **attrs):
+        """take() or build with factory(), then apply attrs (position, color, parent, ...)"""
+        entity = self.take(kind)
+        if entity is None:
+            entity = factory()
+            self.created += 1
+        entity._pool_kind = kind
+        entity._pool_free = False
+        for name, value in attrs.items():
+            setattr(entity, name, value)
+        return entity
+
+    def release(self, entity, kind: str = None, delay: float = None, detach: bool = False):
+        """Disable and park an Entity; `delay` is in wall seconds, `detach` re-parents it off its owner"""
+        if entity is None:
+            return
+        if delay:
+            # Visual lifetimes must not stretch with time_scale, so delays run on frame_scheduler
+            frame_scheduler.after(delay, lambda: self.release(entity, kind, detach=detach), name='pool_release')
+            return
+        kind = kind or getattr(entity, '_pool_kind', None)
+        if kind is None or getattr(entity, '_pool_free', False):
+            return  # Not pooled, or already released
+        free = self._free.setdefault(kind, [])
+        if len(free) >= self.max_free_per_kind:
+            destroy(entity)
+            return
+        try:
+            entity.enabled = False
+            if detach:
+                entity.parent = self._parking()
+        except Exception:
+            destroy(entity)
+            return
+        entity._pool_kind = kind
+        entity._pool_free = True
+        free.append(entity)
+
+    def free_count(self) -> int:
+        return sum(len(free) for free in self._free.values())
+
+entity_pool = EntityPool()
+
+def _build_ship_shell(ship_type):
+    """Procedural ship geometry (basic kitbash): hull + nacelles + cargo pods under one node"""
+    shell = Entity()
+    # Use a widely available model to avoid missing-asset black screens
+    Entity(parent=shell, model='cube', scale=(0.6, 0.6, 2.2), color=color.light_gray)
+    # Side nacelles
+    Entity(parent=shell, model='cube', scale=(0.2, 0.2, 0.8), position=(0.6, 0, -0.3), color=color.gray)
+    Entity(parent=shell, model='cube', scale=(0.2, 0.2, 0.8), position=(-0.6, 0, -0.3), color=color.gray)
+    # Cargo pods for cargo ships
+    if ship_type in ("CARGO", "PAYMENT"):
+        Entity(parent=shell, model='cube', scale=(0.5, 0.5, 0.5), position=(0.0, -0.5, -0.2), color=color.orange if ship_type == "CARGO" else color.yellow)
+    return shell
+
+# ===== SHIP TRAILS =====
+
+class TrailRenderer:
+    """Breadcrumb trails for every transport ship, drawn as one dynamic point mesh.
+
+    Each ship gets a fixed-size ring buffer of its recent positions (one sample every
+    `drop_interval` sim seconds). The shared mesh is rebuilt from all buffers at most
+    every `redraw_interval` wall seconds and only when something changed, so trails
+    cost one scene-graph node in total instead of one Entity per breadcrumb.
+    """
+
+    def __init__(self, length: int = 25, drop_interval: float = 0.6, thickness: float = 4):
+        self.length = length
+        self.drop_interval = drop_interval
+        self.thickness = thickness
+        self._trails = {}  # id(ship) -> [ring, head, count, next_drop_time]
+        self._entity = None
+        self.dirty = False
+
+    def __len__(self):
+        return len(self._trails)
+
+    def record(self, ship, x, y, z):
+        """Sample a ship's position if its next breadcrumb is due"""
+        trail = self._trails.get(id(ship))
+        now = sim_clock.now
+        if trail is None:
+            trail = self._trails[id(ship)] = [[None] * self.length, 0, 0, now + self.drop_interval]
+            return
+        if now < trail[3]:
+            return
+        trail[3] = now + self.drop_interval
+        head = trail[1]
+        trail[0][head] = (x, y, z)
+        trail[1] = (head + 1) % self.length
+        trail[2] = min(trail[2] + 1, self.length)
+        self.dirty = True
+
+    def points(self, ship):
+        """Breadcrumbs for one ship, oldest first"""
+        trail = self._trails.get(id(ship))
+        if not trail:
+            return []
+        ring, head, count = trail[0], trail[1], trail[2]
+        return [ring[(head - count + i) % self.length] for i in range(count)]
+
+    def release(self, ship):
+        if self._trails.pop(id(ship), None) is not None:
+            self.dirty = True
+
+    def retain(self, live_ids):
+        """Drop trails for ships that are no longer alive"""
+        for key in [k for k in self._trails if k not in live_ids]:
+            del self._trails[key]
+            self.dirty = True
+
+    def clear(self):
+        self._trails.clear()
+        self.dirty = True
+
+    def redraw(self):
+        if not self.dirty:
+            return
+        self.dirty = False
+        vertices = []
+        for ring, head, count, _ in self._trails.values():
+            for i in range(count):
+                vertices.append(ring[(head - count + i) % self.length])
+        try:
+            if self._entity is None:
+                mesh = Mesh(vertices=vertices, mode='point', thickness=self.thickness, static=False)
+                self._entity = Entity(model=mesh, color=color.white66)
+                self._mesh = mesh
+            else:
+                self._mesh.vertices = vertices
+                self._mesh.generate()
+        except Exception:
+            pass
+
+trail_renderer = TrailRenderer()
+frame_scheduler.every(0.1, trail_renderer.redraw, jitter=0, first_delay=0, name='trail_redraw')
+
 class LaserFX:
     """Lightweight visual effects for combat (beams and impact flashes)."""
     @staticmethod
@@ -5798,11 +7980,11 @@ class LaserFX:
             if length <= 0:
                 return
             # Use a thin quad aligned along the vector
-            beam = Entity(model='cube', color=beam_color, position=mid, scale=(0.1, 0.1, max(0.2, length)))
+            beam = entity_pool.acquire('fx_beam', lambda: Entity(model='cube'), color=beam_color,
+                                       position=mid, scale=(0.1, 0.1, max(0.2, length)))
             # Orient the beam roughly toward target (approx; Ursina simple)
-            dir_vec = (end_pos - start_pos).normalized()
             beam.look_at(end_pos)
-            destroy(beam, delay=duration)
+            entity_pool.release(beam, delay=duration)
             SoundFX.play('laser')
         except Exception:
             pass
@@ -5810,8 +7992,9 @@ class LaserFX:
     @staticmethod
     def spawn_impact(position, fx_color=color.yellow, duration=0.25):
         try:
-            flash = Entity(model='sphere', color=fx_color, position=position, scale=0.7)
-            destroy(flash, delay=duration)
+            flash = entity_pool.acquire('fx_impact', lambda: Entity(model='sphere', scale=0.7),
+                                        color=fx_color, position=position)
+            entity_pool.release(flash, delay=duration)
             SoundFX.play('impact')
         except Exception:
             pass
@@ -5839,17 +8022,12 @@ class TransportShip(Entity):
         else:
             start_pos = Vec3(0, 0, 0)
             
-        # Procedural ship geometry (basic kitbash): hull + nacelles + cargo pods
         super().__init__(position=start_pos, **kwargs)
         self.model = None
-        # Use a widely available model to avoid missing-asset black screens
-        hull = Entity(parent=self, model='cube', scale=(0.6, 0.6, 2.2), color=color.light_gray)
-        # Side nacelles
-        Entity(parent=self, model='cube', scale=(0.2, 0.2, 0.8), position=(0.6, 0, -0.3), color=color.gray)
-        Entity(parent=self, model='cube', scale=(0.2, 0.2, 0.8), position=(-0.6, 0, -0.3), color=color.gray)
-        # Cargo pods for cargo ships
-        if getattr(self, 'ship_type', '') in ("CARGO", "PAYMENT"):
-            Entity(parent=self, model='cube', scale=(0.5, 0.5, 0.5), position=(0.0, -0.5, -0.2), color=color.orange if self.ship_type=="CARGO" else color.yellow)
+        # Hull/nacelles/pod come as one pooled shell, recycled when the ship leaves service
+        shell_kind = f"ship_shell:{ship_type}" if ship_type in ("CARGO", "PAYMENT") else "ship_shell"
+        self._shell = entity_pool.acquire(shell_kind, lambda: _build_ship_shell(ship_type),
+                                          parent=self, position=Vec3(0, 0, 0))
         
         # Unique identifier for contracts/intel
         if not hasattr(TransportShip, '_id_counter'):
@@ -5862,9 +8040,6 @@ class TransportShip(Entity):
         self.ship_type = ship_type
         self.delivered = False
         self.encounter_triggered = False
-        # Visual trail (simple breadcrumbs)
-        self._trail_timer = 0.0
-        self._trail_nodes = []
         # Basic health model for combat persistence
         self.health = 100
         self.retreating = False
@@ -5875,7 +8050,8 @@ class TransportShip(Entity):
             return
             
         # Move along waypoints if available, else direct to destination
-        if hasattr(self.destination, 'position'):
+        # (skipped while the batched ShipKinematics engine is moving this ship)
+        if hasattr(self.destination, 'position') and not getattr(self, '_kinematics_driven', False):
             target_pos = None
             if hasattr(self, 'waypoints') and self.waypoints:
                 # Peek next waypoint
@@ -5891,14 +8067,13 @@ class TransportShip(Entity):
             speed = getattr(self, 'speed', 10.0)
             # Expose target for escorts/AI consumers
             self.current_target_pos = target_pos
-            self.position += direction * speed * time.dt
+            self.position += direction * speed * sim_clock.dt
             
             # Check if arrived at final destination
             if (self.position - self.destination.position).length() < 5:
                 self.on_arrival()
                 
-        # Check for player encounters
-        self.check_player_encounter()
+        # Player encounters are detected by UnifiedTransportSystemManager via its spatial index
 
         # LOD: reduce child visuals when far from player
         try:
@@ -5910,21 +8085,10 @@ class TransportShip(Entity):
         except Exception:
             pass
 
-        # Drop simple trail nodes at intervals
-        self._trail_timer += time.dt
-        if self._trail_timer > 0.6:
-            self._trail_timer = 0.0
-            try:
-                node = Entity(model='sphere', scale=0.2, color=color.white66, position=self.position)
-                self._trail_nodes.append(node)
-                if len(self._trail_nodes) > 25:
-                    old = self._trail_nodes.pop(0)
-                    destroy(old)
-            except Exception:
-                pass
+        # Breadcrumb trails are sampled by UnifiedTransportSystemManager into trail_renderer
 
         # Check for retreat if heavily damaged
-        self.last_retreat_check += time.dt
+        self.last_retreat_check += sim_clock.dt
         if not self.retreating and self.health <= 25 and self.last_retreat_check > 2.0:
             self.last_retreat_check = 0.0
             self.start_retreat()
@@ -5951,25 +8115,10 @@ class TransportShip(Entity):
             if retreat_target and hasattr(retreat_target, 'position'):
                 self.waypoints = [retreat_target.position]
                 self.destination = retreat_target
+            unified_transport_system.refresh_route(self)
         except Exception:
             pass
                 
-    def check_player_encounter(self):
-        """Check if player is near this ship"""
-        if hasattr(scene_manager, 'space_controller') and scene_manager.space_controller:
-            # Guard against empty/destroyed nodepaths
-            try:
-                player_pos = scene_manager.space_controller.position
-                _ = self.position  # access to ensure node exists
-            except Exception:
-                return
-            try:
-                distance = (self.position - player_pos).length()
-            except Exception:
-                return
-            if distance < 30 and not self.encounter_triggered:
-                self.trigger_player_encounter()
-                
     def trigger_player_encounter(self):
         """Trigger encounter with player"""
         self.encounter_triggered = True
@@ -5998,6 +8147,14 @@ class TransportShip(Entity):
         self.delivered = True
         # Removal is handled by transport manager after update loop to avoid mid-frame node issues
 
+    def release_visuals(self):
+        """Hand the hull shell back to entity_pool and drop the trail (safe to call twice)"""
+        shell = getattr(self, '_shell', None)
+        if shell is not None:
+            self._shell = None
+            entity_pool.release(shell, detach=True)
+        trail_renderer.release(self)
+
     def take_damage(self, amount: int):
         try:
             self.health -= int(amount)
@@ -6042,8 +8199,7 @@ class TransportShip(Entity):
                     lst.remove(self)
         except Exception:
             pass
-        for n in getattr(self, '_trail_nodes', []):
-            destroy(n)
+        self.release_visuals()
         destroy(self)
 
 class MessageShip(TransportShip):
@@ -6070,19 +8226,137 @@ class MessageShip(TransportShip):
             print(f"📨 Message ship launched: {getattr(origin_planet, 'name', 'Unknown')} → {getattr(destination_planet, 'name', 'Unknown')}")
         
     def on_arrival(self):
-        """Deliver letter to destination planet's mailbox"""
+        """Deliver every letter in the bag to the destination planet, then fly to the next stop"""
+        for message_type, payload in getattr(self, 'bundle', None) or [(self.message_type, self.payload)]:
+            self.deliver(message_type, payload)
+        stops = getattr(self, 'stops', None)
+        if stops:
+            self.destination, self.bundle = stops.pop(0)
+            unified_transport_system.refresh_route(self)
+            return
+        super().on_arrival()
+
+    def deliver(self, message_type, payload):
+        """Deliver one letter to destination planet's mailbox"""
         destination_name = getattr(self.destination, 'name', 'Unknown')
         
         # Handle physical letters through the communication system
-        if isinstance(self.payload, PhysicalLetter):
-            physical_communication.deliver_letter(self.payload, self.destination)
+        if isinstance(payload, PhysicalLetter):
+            physical_communication.deliver_letter(payload, self.destination)
         else:
             # Fallback for old message types
             if hasattr(self.destination, 'enhanced_economy') and self.destination.enhanced_economy:
-                self.destination.enhanced_economy.receive_message(self.message_type, self.payload)
+                self.destination.enhanced_economy.receive_message(message_type, payload)
             print(f"📬 Message delivered to {destination_name}")
-            
-        super().on_arrival()
+
+# ===== COURIER DISPATCH =====
+
+class CourierDispatcher:
+    """Queues outgoing mail per origin→destination pair and sends it out in shared couriers.
+
+    A bag leaves when it holds `max_batch` items or when its oldest item has waited
+    `batch_wait` sim seconds (`urgent_wait` if anything in it is urgent). When one of
+    an origin's bags leaves, the rest of that origin's bags ride along: one courier
+    visits up to `max_stops` destinations in nearest-next order, dropping each bag on
+    the way, so a planet writing to many neighbours launches one ship instead of many.
+    """
+    def __init__(self, max_batch=16, batch_wait=10.0, urgent_wait=1.0, max_stops=24, check_interval=0.5):
+        self.max_batch = max_batch
+        self.batch_wait = batch_wait
+        self.urgent_wait = urgent_wait
+        self.max_stops = max_stops
+        self._pending = {}  # origin name -> {dest name: [origin, destination, items, due]}
+        self.couriers_sent = 0
+        self.payloads_sent = 0
+        self._job = sim_scheduler.every(check_interval, self.flush_due, jitter=0, name='courier_dispatch', owner=self)
+
+    def __len__(self):
+        return sum(len(bag[2]) for bags in self._pending.values() for bag in bags.values())
+
+    def send(self, origin, destination, message_type, payload, urgent=False):
+        """Queue one letter; it leaves with the next courier from this origin"""
+        origin_name = getattr(origin, 'name', None)
+        bags = self._pending.setdefault(origin_name, {})
+        dest_name = getattr(destination, 'name', None)
+        bag = bags.get(dest_name)
+        if bag is None:
+            bag = bags[dest_name] = [origin, destination, [], sim_clock.now + self.batch_wait]
+        bag[2].append((message_type, payload))
+        if urgent:
+            bag[3] = min(bag[3], sim_clock.now + self.urgent_wait)
+        if len(bag[2]) >= self.max_batch:
+            self._dispatch(origin_name)
+
+    def flush_due(self):
+        now = sim_clock.now
+        for origin_name in [o for o, bags in self._pending.items() if any(bag[3] <= now for bag in bags.values())]:
+            self._dispatch(origin_name)
+
+    def flush(self):
+        for origin_name in list(self._pending):
+            self._dispatch(origin_name)
+
+    def clear(self):
+        self._pending.clear()
+
+    def snapshot(self):
+        """Queued bags as JSON-safe entries; waits are stored relative to sim_clock.now"""
+        now = sim_clock.now
+        return [
+            {
+                'origin': getattr(origin, 'name', None),
+                'dest': getattr(destination, 'name', None),
+                'items': [entry for entry in (serialize_mail(*item) for item in items) if entry],
+                'wait': max(0.0, due - now),
+            }
+            for bags in self._pending.values()
+            for origin, destination, items, due in bags.values()
+        ]
+
+    def restore(self, entries):
+        """Replace the queue with bags from snapshot(); unknown planets and unreadable items are skipped"""
+        self._pending.clear()
+        now = sim_clock.now
+        for entry in entries or []:
+            origin = world_registry.planet(entry.get('origin'))
+            destination = world_registry.planet(entry.get('dest'))
+            items = [mail for mail in (restore_mail(e) for e in entry.get('items', [])) if mail]
+            if not origin or not destination or not items:
+                continue
+            bags = self._pending.setdefault(origin.name, {})
+            bags[destination.name] = [origin, destination, items, now + float(entry.get('wait', 0.0))]
+
+    def _dispatch(self, origin_name):
+        bags = list(self._pending.pop(origin_name, {}).values())
+        if not bags:
+            return
+        origin = bags[0][0]
+        # Nearest-next tour from the origin, cut into courier-sized legs
+        here = getattr(origin, 'position', None)
+        tour = []
+        while bags:
+            if here is None:
+                bag = bags.pop(0)
+            else:
+                bag = min(bags, key=lambda b: _distance(here, b[1].position) if hasattr(b[1], 'position') else 0.0)
+                bags.remove(bag)
+            tour.append((bag[1], bag[2]))
+            here = getattr(bag[1], 'position', here)
+        for i in range(0, len(tour), max(1, self.max_stops)):
+            stops = tour[i:i + max(1, self.max_stops)]
+            destination, items = stops[0]
+            message_type, payload = items[0]
+            ship = MessageShip(origin, destination, message_type, payload)
+            ship.bundle = items
+            ship.stops = stops[1:]
+            unified_transport_system.message_ships.append(ship)
+            self.couriers_sent += 1
+            self.payloads_sent += sum(len(stop_items) for _, stop_items in stops)
+
+    def stats(self):
+        return {'couriers': self.couriers_sent, 'payloads': self.payloads_sent, 'queued': len(self)}
+
+courier_dispatcher = CourierDispatcher()
 class CargoShip(TransportShip):
     """Ship carrying cargo between planets"""
     
@@ -6105,6 +8379,9 @@ class CargoShip(TransportShip):
         else:
             self.waypoints = []
         
+        self.rumors = []
+        physical_communication.board_rumors(self)
+        
         print(f"🚛 Cargo ship launched: {getattr(origin_planet, 'name', 'Unknown')} → {getattr(destination_planet, 'name', 'Unknown')}")
         print(f"   Cargo: {self.get_cargo_description()}")
 
@@ -6154,6 +8431,7 @@ class CargoShip(TransportShip):
                 self.destination.enhanced_economy.stockpiles[commodity] = current + quantity
                 
         print(f"✅ Cargo delivered to {getattr(self.destination, 'name', 'Unknown')}: {self.get_cargo_description()}")
+        physical_communication.deliver_rumors(self)
         # Notify contract registry for payment leg
         if hasattr(self, 'contract_id'):
             contract_registry.cargo_delivered(self.contract_id)
@@ -6194,11 +8472,8 @@ class PaymentShip(TransportShip):
             contract_registry.payment_delivered(self.contract_id)
             try:
                 payload = {'kind': 'CONTRACT_NOTICE', 'contract_id': self.contract_id, 'notice': 'PAYMENT_DELIVERED'}
-                if 'unified_transport_system' in globals():
-                    msg1 = MessageShip(self.origin, self.destination, MessageType.NEWS_BULLETIN, payload)
-                    msg2 = MessageShip(self.destination, self.origin, MessageType.NEWS_BULLETIN, payload)
-                    unified_transport_system.message_ships.append(msg1)
-                    unified_transport_system.message_ships.append(msg2)
+                courier_dispatcher.send(self.origin, self.destination, MessageType.NEWS_BULLETIN, payload)
+                courier_dispatcher.send(self.destination, self.origin, MessageType.NEWS_BULLETIN, payload)
             except Exception:
                 pass
         super().on_arrival()
@@ -6236,10 +8511,10 @@ class PirateRaider(TransportShip):
         # LOD-based skip handled upstream; keep logic small
         if self.hunting_mode:
             self.hunt_cargo_ships()
-        else:
+        elif not getattr(self, '_kinematics_driven', False):
             if hasattr(self.pirate_base, 'position'):
                 direction = (self.pirate_base.position - self.position).normalized()
-                self.position += direction * self.speed * time.dt
+                self.position += direction * self.speed * sim_clock.dt
                 if (self.position - self.pirate_base.position).length() < 5:
                     self.return_to_base()
                     
@@ -6247,13 +8522,9 @@ class PirateRaider(TransportShip):
         """Hunt for cargo ships to raid"""
         # Look for cargo ships in range
         if 'unified_transport_system' in globals():
-            for cargo_ship in unified_transport_system.cargo_ships:
-                if not hasattr(cargo_ship, 'position'):
-                    continue
-                    
-                distance = (self.position - cargo_ship.position).length()
-                
-                if distance < self.raid_range and self.should_attack_cargo_ship(cargo_ship):
+            for cargo_ship in unified_transport_system.spatial_index.query_radius(
+                    self.position, self.raid_range, kinds=('cargo',), nearest_first=True):
+                if self.should_attack_cargo_ship(cargo_ship):
                     self.attack_cargo_ship(cargo_ship)
                     return
                     
@@ -6302,12 +8573,15 @@ class PirateRaider(TransportShip):
             # Remove the cargo ship and settle contract consequences
             if 'unified_transport_system' in globals() and cargo_ship in unified_transport_system.cargo_ships:
                 unified_transport_system.cargo_ships.remove(cargo_ship)
+                unified_transport_system.forget_ship(cargo_ship)
                 if hasattr(cargo_ship, 'contract_id'):
                     contract_registry.cargo_lost(cargo_ship.contract_id)
+                cargo_ship.release_visuals()
                 destroy(cargo_ship)
                 
             # Return to base with stolen goods
             self.hunting_mode = False
+            unified_transport_system.refresh_route(self)
             
             # Share intelligence with other pirates
             self.share_intelligence(cargo_ship)
@@ -6319,6 +8593,7 @@ class PirateRaider(TransportShip):
                 if random.random() < 0.3:  # 30% chance failed attack is reported
                     cargo_ship.destination.enhanced_economy.record_pirate_attack()
             self.hunting_mode = False
+            unified_transport_system.refresh_route(self)
             
     def increase_regional_threat(self, cargo_ship):
         """LOGICAL: Successful pirate attacks increase regional threat"""
@@ -6358,7 +8633,7 @@ class PirateRaider(TransportShip):
             random.uniform(-5, 5), 
             random.uniform(-5, 5)
         )
-        self.position += random_offset * time.dt
+        self.position += random_offset * sim_clock.dt
         
     def share_intelligence(self, cargo_ship):
         """Share intelligence about cargo routes with other pirate bases"""
@@ -6370,7 +8645,7 @@ class PirateRaider(TransportShip):
             estimated_value=cargo_ship.contract_value,
             escort_level="NONE",
             route_danger=0.3,
-            intel_timestamp=time.time()
+            intel_timestamp=sim_clock.now
         )
         
         # Send intelligence to other pirate bases
@@ -6391,6 +8666,7 @@ class PirateRaider(TransportShip):
         print(f"🏴‍☠️ Raider returned to {getattr(self.pirate_base, 'name', 'Unknown Base')}")
         print(f"   Delivered stolen goods: {self.get_stolen_cargo_description()}")
         
+        self.release_visuals()
         destroy(self)
         
     def get_stolen_cargo_description(self):
@@ -6800,7 +9076,7 @@ class CrewSystem:
 class TimeSystem:
     def __init__(self):
         self.game_day = 1
-        self.last_day_update = time.time()
+        self.last_day_update = sim_clock.now
         self.day_length = 300  # 5 minutes = 1 game day
         # Centralized speed control bounds and step (seconds per game day)
         self.min_day_length = 30
@@ -6808,11 +9084,15 @@ class TimeSystem:
         self.day_length_step = 30
         
     def update(self):
-        current_time = time.time()
+        current_time = sim_clock.now
         if current_time - self.last_day_update >= self.day_length:
             self.advance_day()
             self.last_day_update = current_time
-            
+
+    def advance_day(self):
+        self.game_day += 1
+        self.last_day_update = sim_clock.now
+
     def set_day_length(self, seconds: float):
         # Clamp and set seconds per in-game day
         seconds = float(seconds)
@@ -6847,9 +9127,9 @@ class MissionSystem:
         
     def generate_missions(self):
         """Generate new missions periodically"""
-        if time.time() - self.last_mission_generation > 60:  # New missions every minute
+        if sim_clock.now - self.last_mission_generation > 60:  # New missions every minute
             self.create_random_missions()
-            self.last_mission_generation = time.time()
+            self.last_mission_generation = sim_clock.now
             
     def create_random_missions(self):
         mission_types = [
@@ -6895,11 +9175,114 @@ class MissionSystem:
                 )
                 self.available_missions.append(mission)
 
+# ===== SUPPLIER INDEX =====
+
+class SupplierIndex:
+    """Commodity -> planets whose daily production exceeds their daily consumption.
+
+    Economies report their production/consumption tables whenever either is replaced,
+    so procurement never has to walk the whole galaxy. Each commodity keeps its
+    suppliers sorted by surplus (largest first); the sort is redone lazily only for
+    commodities whose membership or surplus changed.
+    """
+    def __init__(self):
+        self._surplus = {}   # commodity -> {planet name: (surplus, planet)}
+        self._ranked = {}    # commodity -> [planet, ...] by surplus, rebuilt on demand
+        self._by_planet = {}  # planet name -> set of commodities it currently supplies
+        self.lookups = 0
+        self.updates = 0
+
+    def update(self, economy):
+        """Re-index one economy after its production or consumption table changed"""
+        planet = getattr(economy, 'planet_object', None)
+        name = getattr(planet, 'name', None) or getattr(economy, 'planet_name', None)
+        if name is None:
+            return
+        production = getattr(economy, 'daily_production', None) or {}
+        consumption = getattr(economy, 'daily_consumption', None) or {}
+        supplied = set()
+        for commodity, amount in production.items():
+            surplus = amount - consumption.get(commodity, 0)
+            if surplus > 0:
+                supplied.add(commodity)
+                entries = self._surplus.setdefault(commodity, {})
+                if entries.get(name) != (surplus, planet):
+                    entries[name] = (surplus, planet)
+                    self._ranked.pop(commodity, None)
+        for commodity in self._by_planet.get(name, set()) - supplied:
+            self._drop(commodity, name)
+        if supplied:
+            self._by_planet[name] = supplied
+        else:
+            self._by_planet.pop(name, None)
+        self.updates += 1
+
+    def remove(self, planet_name):
+        for commodity in self._by_planet.pop(planet_name, set()):
+            self._drop(commodity, planet_name)
+
+    def _drop(self, commodity, name):
+        entries = self._surplus.get(commodity)
+        if entries and entries.pop(name, None) is not None:
+            self._ranked.pop(commodity, None)
+            if not entries:
+                del self._surplus[commodity]
+
+    def clear(self):
+        self._surplus.clear()
+        self._ranked.clear()
+        self._by_planet.clear()
+
+    def suppliers(self, commodity, near=None, limit=None, exclude=None):
+        """Planets with a surplus of `commodity`, largest surplus first.
+
+        With `near` the closest `limit` suppliers to that position are returned instead
+        (nearest first), which keeps procurement local in large galaxies.
+        """
+        self.lookups += 1
+        ranked = self._ranked.get(commodity)
+        if ranked is None:
+            entries = self._surplus.get(commodity, {})
+            ranked = [planet for _, planet in sorted(entries.values(), key=lambda e: -e[0])]
+            self._ranked[commodity] = ranked
+        if exclude is not None:
+            ranked = [p for p in ranked if getattr(p, 'name', None) != exclude]
+        if near is not None:
+            def dist(p):
+                return _distance(near, p.position) if hasattr(p, 'position') else float('inf')
+            if limit:
+                return heapq.nsmallest(limit, ranked, key=dist)
+            return sorted(ranked, key=dist)
+        return list(ranked[:limit] if limit else ranked)
+
+    def stats(self):
+        return {'commodities': len(self._surplus),
+                'entries': sum(len(e) for e in self._surplus.values()),
+                'lookups': self.lookups, 'updates': self.updates}
+
+supplier_index = SupplierIndex()
+
 # ===== ENHANCED PLANET ECONOMY =====
 
 class EnhancedPlanetEconomy:
     """Enhanced planet economy with realistic transport mechanics"""
     
+    DAY_SECONDS = 300.0  # 1 game day = 5 minutes
+    TARGET_BUFFER_DAYS = 60.0
+    # Production order matters: energy is spent commodity by commodity in this order
+    PRODUCTION_ORDER = ('minerals', 'fuel', 'technology', 'weapons', 'medicine', 'luxury_goods', 'spices', 'food')
+    PERISHABLES = ('food', 'medicine', 'spices')
+    RECIPES = {
+        'minerals': {'inputs': {}, 'energy': 1.0},
+        'fuel': {'inputs': {}, 'energy': 1.0},
+        'technology': {'inputs': {'minerals': 1.0}, 'energy': 2.0},
+        'weapons': {'inputs': {'technology': 1.0}, 'energy': 3.0},
+        'medicine': {'inputs': {'food': 1.0, 'technology': 0.5}, 'energy': 1.0},
+        'luxury_goods': {'inputs': {'technology': 0.5, 'spices': 0.5}, 'energy': 2.0},
+        'spices': {'inputs': {}, 'energy': 1.0},
+        'food': {'inputs': {}, 'energy': 1.0},
+    }
+    
     def __init__(self, planet_name, planet_type, planet_object):
         self.planet_name = planet_name
         self.planet_type = planet_type
@@ -6907,8 +9290,8 @@ class EnhancedPlanetEconomy:
         
         # Enhanced stockpile system
         self.stockpiles = {}
-        self.daily_consumption = {}
-        self.daily_production = {}
+        self._daily_consumption = {}
+        self._daily_production = {}
         self.outgoing_requests = {}
         self.expected_deliveries = {}
         self.credits = random.randint(10000, 50000)
@@ -6918,9 +9301,10 @@ class EnhancedPlanetEconomy:
         self.energy_infrastructure = random.uniform(0.8, 1.2)  # scales energy from solar/grid
         self.fertility = 1.0  # affects food yields (0.6..1.2)
         
-        # Transport timing
-        self.last_procurement_check = 0
+        # Transport timing: procurement runs from sim_scheduler at a per-planet offset
         self.procurement_interval = 45  # Check every 45 seconds
+        self._procurement_job = sim_scheduler.every(self.procurement_interval, self.assess_and_send_requests,
+                                                    name=f'procurement:{planet_name}', owner=self)
         
         # Connect to existing market system
         if planet_name in market_system.planet_economies:
@@ -6931,6 +9315,24 @@ class EnhancedPlanetEconomy:
         else:
             self.initialize_economy()
             
+    @property
+    def daily_production(self):
+        return self._daily_production
+
+    @daily_production.setter
+    def daily_production(self, table):
+        self._daily_production = table
+        supplier_index.update(self)
+
+    @property
+    def daily_consumption(self):
+        return self._daily_consumption
+
+    @daily_consumption.setter
+    def daily_consumption(self, table):
+        self._daily_consumption = table
+        supplier_index.update(self)
+
     def initialize_economy(self):
         """Set up production/consumption based on planet type"""
         economy_templates = {
@@ -6985,123 +9387,57 @@ class EnhancedPlanetEconomy:
                 
     def update(self):
         """Update economy and handle transport needs"""
-        current_time = time.time()
+        self.step_production(sim_clock.dt)
+        self.update_logistics()
         
-        # Recipe-based production with energy and reserve limits
-        # Energy budget per second
-        day_seconds = 300.0  # 1 game day = 5 minutes
+    def energy_parameters(self):
+        """(solar energy per day, max fuel burn per day) for this planet"""
         base_solar_per_day = (self.planet_object.population / 20000.0) if hasattr(self.planet_object, 'population') else 50.0
         base_solar_per_day *= self.energy_infrastructure
-        base_solar = base_solar_per_day / day_seconds
         max_burn_per_day = max(1.0, (self.planet_object.population / 50000.0) if hasattr(self.planet_object, 'population') else 1.0)
-        burn_request = (max_burn_per_day / day_seconds) * time.dt
+        return base_solar_per_day, max_burn_per_day
+        
+    def step_production(self, dt):
+        """Recipe-based production with energy and reserve limits, then consumption and losses.
+
+        VectorEconomyEngine runs the same model for all planets at once; keep the two in step.
+        """
+        day_seconds = self.DAY_SECONDS
+        blockaded = getattr(self.planet_object, 'blockaded', False)
+        # Energy budget per second
+        base_solar_per_day, max_burn_per_day = self.energy_parameters()
+        base_solar = base_solar_per_day / day_seconds
+        burn_request = (max_burn_per_day / day_seconds) * dt
         actual_burn = min(burn_request, self.stockpiles.get('fuel', 0))
         # convert burned fuel to energy (yield factor 5)
-        energy = (base_solar * time.dt) + (actual_burn * 5.0)
+        self._energy = (base_solar * dt) + (actual_burn * 5.0)
         self.stockpiles['fuel'] = self.stockpiles.get('fuel', 0) - actual_burn
-        if getattr(self.planet_object, 'blockaded', False):
-            energy *= 0.7
-
-        recipes = {
-            'minerals': {'inputs': {}, 'energy': 1.0},
-            'fuel': {'inputs': {}, 'energy': 1.0},
-            'technology': {'inputs': {'minerals': 1.0}, 'energy': 2.0},
-            'weapons': {'inputs': {'technology': 1.0}, 'energy': 3.0},
-            'medicine': {'inputs': {'food': 1.0, 'technology': 0.5}, 'energy': 1.0},
-            'luxury_goods': {'inputs': {'technology': 0.5, 'spices': 0.5}, 'energy': 2.0},
-            'spices': {'inputs': {}, 'energy': 1.0},
-            'food': {'inputs': {}, 'energy': 1.0},
-        }
-
-        target_buffer_days = 60.0
-
-        def produce(commodity, desired_units):
-            nonlocal energy
-            if desired_units <= 0:
-                return 0.0
-            if commodity in ('minerals', 'fuel'):
-                # extraction limited by reserve and energy
-                reserve = self.minerals_reserve if commodity == 'minerals' else self.fuel_reserve
-                if reserve <= 0:
-                    return 0.0
-                extract_cap_per_day = max(1.0, ((reserve / 1000.0) ** 0.5) * 40.0)
-                extract_cap = (extract_cap_per_day / day_seconds) * time.dt
-                units_by_energy = energy / max(0.0001, recipes[commodity]['energy'])
-                units = min(desired_units, extract_cap, units_by_energy)
-                if units <= 0:
-                    return 0.0
-                energy -= units * recipes[commodity]['energy']
-                if commodity == 'minerals':
-                    self.minerals_reserve = max(0.0, self.minerals_reserve - units)
-                else:
-                    self.fuel_reserve = max(0.0, self.fuel_reserve - units)
-                self.stockpiles[commodity] = self.stockpiles.get(commodity, 0.0) + units
-                return units
-            # non-extraction
-            recipe = recipes.get(commodity, {'inputs': {}, 'energy': 0.0})
-            max_by_energy = energy / max(0.0001, recipe['energy'])
-            units = min(desired_units, max_by_energy)
-            if units <= 0:
-                return 0.0
-            # limit by inputs
-            for inp, req in recipe['inputs'].items():
-                avail = self.stockpiles.get(inp, 0.0)
-                if req > 0:
-                    units = min(units, avail / req)
-                if units <= 0:
-                    return 0.0
-            # days-of-supply throttle
-            daily_need = float(self.daily_consumption.get(commodity, 0.0))
-            if daily_need > 0:
-                desired_stock = daily_need * target_buffer_days
-                current = self.stockpiles.get(commodity, 0.0)
-                if current >= desired_stock * 2.0:
-                    units = 0.0
-                elif current > desired_stock:
-                    surplus_ratio = (current - desired_stock) / max(1.0, desired_stock)
-                    units = units * max(0.2, 1.0 - 0.8 * surplus_ratio)
-            if commodity == 'food':
-                units = units * max(0.6, min(1.2, self.fertility))
-            if units <= 0:
-                return 0.0
-            # consume inputs and energy
-            for inp, req in recipe['inputs'].items():
-                self.stockpiles[inp] = self.stockpiles.get(inp, 0.0) - (req * units)
-            energy -= units * recipe['energy']
-            self.stockpiles[commodity] = self.stockpiles.get(commodity, 0.0) + units
-            # adjust fertility gently
-            if commodity == 'food':
-                baseline = float(self.daily_consumption.get('food', 1.0)) * 2.0 / day_seconds * time.dt
-                if units > baseline:
-                    self.fertility = max(0.6, self.fertility - 0.0005)
-                else:
-                    self.fertility = min(1.2, self.fertility + 0.00025)
-            return units
+        if blockaded:
+            self._energy *= 0.7
 
         # Execute production according to daily production targets (per-second fraction)
-        order = ['minerals', 'fuel', 'technology', 'weapons', 'medicine', 'luxury_goods', 'spices', 'food']
-        for commodity in order:
+        for commodity in self.PRODUCTION_ORDER:
             daily_target = float(self.daily_production.get(commodity, 0.0))
-            desired = (daily_target / day_seconds) * time.dt
-            if getattr(self.planet_object, 'blockaded', False):
+            desired = (daily_target / day_seconds) * dt
+            if blockaded:
                 desired *= 0.7
-            produce(commodity, desired)
+            self._produce(commodity, desired, dt)
 
         # Consumption per second, capped by available stock
         for commodity, amount in self.daily_consumption.items():
             per_second = float(amount) / day_seconds
             current_stock = self.stockpiles.get(commodity, 0.0)
-            consumption = min(per_second * time.dt, current_stock)
+            consumption = min(per_second * dt, current_stock)
             self.stockpiles[commodity] = current_stock - consumption
         # Perishables decay beyond 60-day buffer (approx per-tick)
-        for perishable in ('food', 'medicine', 'spices'):
+        for perishable in self.PERISHABLES:
             if perishable in self.stockpiles:
                 buffer = float(self.daily_consumption.get(perishable, 1.0)) * 60.0
                 current = self.stockpiles.get(perishable, 0.0)
                 if current > buffer:
                     # ~2% per day beyond buffer
                     decay_per_day = 0.02
-                    decay = (current - buffer) * decay_per_day * (time.dt / day_seconds)
+                    decay = (current - buffer) * decay_per_day * (dt / day_seconds)
                     self.stockpiles[perishable] = max(0.0, current - decay)
         # Storage pressure: operational losses when over 90-day buffer
         for commodity, current in list(self.stockpiles.items()):
@@ -7111,17 +9447,79 @@ class EnhancedPlanetEconomy:
             buffer90 = daily_need * 90.0
             if current > buffer90:
                 loss_per_day = 0.02  # 2% per day beyond buffer
-                loss = (current - buffer90) * loss_per_day * (time.dt / day_seconds)
+                loss = (current - buffer90) * loss_per_day * (dt / day_seconds)
                 self.stockpiles[commodity] = max(0.0, self.stockpiles[commodity] - loss)
-            
-        # Check for procurement needs
-        if current_time - self.last_procurement_check > self.procurement_interval:
-            self.assess_and_send_requests()
-            self.last_procurement_check = current_time
-            
+                
+    def _produce(self, commodity, desired_units, dt):
+        """Produce up to desired_units of a commodity from the energy left this tick"""
+        if desired_units <= 0:
+            return 0.0
+        day_seconds = self.DAY_SECONDS
+        recipe = self.RECIPES.get(commodity, {'inputs': {}, 'energy': 0.0})
+        if commodity in ('minerals', 'fuel'):
+            # extraction limited by reserve and energy
+            reserve = self.minerals_reserve if commodity == 'minerals' else self.fuel_reserve
+            if reserve <= 0:
+                return 0.0
+            extract_cap_per_day = max(1.0, ((reserve / 1000.0) ** 0.5) * 40.0)
+            extract_cap = (extract_cap_per_day / day_seconds) * dt
+            units_by_energy = self._energy / max(0.0001, recipe['energy'])
+            units = min(desired_units, extract_cap, units_by_energy)
+            if units <= 0:
+                return 0.0
+            self._energy -= units * recipe['energy']
+            if commodity == 'minerals':
+                self.minerals_reserve = max(0.0, self.minerals_reserve - units)
+            else:
+                self.fuel_reserve = max(0.0, self.fuel_reserve - units)
+            self.stockpiles[commodity] = self.stockpiles.get(commodity, 0.0) + units
+            return units
+        # non-extraction
+        max_by_energy = self._energy / max(0.0001, recipe['energy'])
+        units = min(desired_units, max_by_energy)
+        if units <= 0:
+            return 0.0
+        # limit by inputs
+        for inp, req in recipe['inputs'].items():
+            avail = self.stockpiles.get(inp, 0.0)
+            if req > 0:
+                units = min(units, avail / req)
+            if units <= 0:
+                return 0.0
+        # days-of-supply throttle
+        daily_need = float(self.daily_consumption.get(commodity, 0.0))
+        if daily_need > 0:
+            desired_stock = daily_need * self.TARGET_BUFFER_DAYS
+            current = self.stockpiles.get(commodity, 0.0)
+            if current >= desired_stock * 2.0:
+                units = 0.0
+            elif current > desired_stock:
+                surplus_ratio = (current - desired_stock) / max(1.0, desired_stock)
+                units = units * max(0.2, 1.0 - 0.8 * surplus_ratio)
+        if commodity == 'food':
+            units = units * max(0.6, min(1.2, self.fertility))
+        if units <= 0:
+            return 0.0
+        # consume inputs and energy
+        for inp, req in recipe['inputs'].items():
+            self.stockpiles[inp] = self.stockpiles.get(inp, 0.0) - (req * units)
+        self._energy -= units * recipe['energy']
+        self.stockpiles[commodity] = self.stockpiles.get(commodity, 0.0) + units
+        # adjust fertility gently
+        if commodity == 'food':
+            baseline = float(self.daily_consumption.get('food', 1.0)) * 2.0 / day_seconds * dt
+            if units > baseline:
+                self.fertility = max(0.6, self.fertility - 0.0005)
+            else:
+                self.fertility = min(1.2, self.fertility + 0.00025)
+        return units
+        
+    def update_logistics(self, dt=None):
+        """Manufacturing (runs after production, per planet); procurement is scheduled"""
         # Update manufacturing processes
         crew_effectiveness = 50  # Default effectiveness if no crew system
-        enhanced_manufacturing.update_manufacturing(self.planet_name, time.dt, crew_effectiveness, self.stockpiles)
+        enhanced_manufacturing.update_manufacturing(self.planet_name, sim_clock.dt if dt is None else dt,
+                                                    crew_effectiveness, self.stockpiles)
         
         # Auto-start manufacturing based on available materials
         self.auto_start_manufacturing()
@@ -7132,9 +9530,9 @@ class EnhancedPlanetEconomy:
         
         for commodity, request in needs.items():
             # Don't spam requests
-            if commodity not in self.outgoing_requests or time.time() - self.outgoing_requests[commodity] > 120:
+            if commodity not in self.outgoing_requests or sim_clock.now - self.outgoing_requests[commodity] > 120:
                 self.send_procurement_message(request)
-                self.outgoing_requests[commodity] = time.time()
+                self.outgoing_requests[commodity] = sim_clock.now
                 
                 # LOGICAL CORRECTION: High prices attract more traders
                 if request.max_price > 100:  # High-value commodity
@@ -7272,35 +9670,20 @@ class EnhancedPlanetEconomy:
         return base_price * urgency_multipliers[urgency] * storage_factor * shortage_factor * energy_premium
     
     def send_procurement_message(self, request):
-        """Send procurement message to suppliers"""
-        suppliers = self.find_suppliers(request.commodity)
+        """Send procurement message to the nearest suppliers"""
+        suppliers = supplier_index.suppliers(request.commodity, near=getattr(self.planet_object, 'position', None),
+                                             limit=SETTINGS.get('procurement_max_suppliers'), exclude=self.planet_name)
         
         for supplier_planet in suppliers:
-            if supplier_planet.name != self.planet_name:
-                message_ship = MessageShip(
-                    self.planet_object,
-                    supplier_planet,
-                    MessageType.GOODS_REQUEST,
-                    request
-                )
-                unified_transport_system.message_ships.append(message_ship)
+            courier_dispatcher.send(self.planet_object, supplier_planet, MessageType.GOODS_REQUEST, request)
                 
     def find_suppliers(self, commodity):
-        """Find planets that produce this commodity"""
-        suppliers = []
-        
-        for planet in planets:
-            if hasattr(planet, 'enhanced_economy') and planet.enhanced_economy:
-                production = planet.enhanced_economy.daily_production.get(commodity, 0)
-                consumption = planet.enhanced_economy.daily_consumption.get(commodity, 0)
-                if production > consumption:  # Has surplus
-                    suppliers.append(planet)
-                    
-        return suppliers
+        """Find planets that produce this commodity (largest surplus first)"""
+        return supplier_index.suppliers(commodity)
     
     def receive_message(self, message_type, payload):
         """Process incoming message"""
-        if message_type == MessageType.GOODS_REQUEST:
+        if message_type == MessageType.GOODS_REQUEST and isinstance(payload, GoodsRequest):
             self.handle_goods_request(payload)
         elif message_type == MessageType.NEWS_BULLETIN and isinstance(payload, dict):
             kind = payload.get('kind')
@@ -7318,7 +9701,9 @@ class EnhancedPlanetEconomy:
                                 headline="Cargo Lost In Transit",
                                 details=f"Contract {contract_id} cargo failed to arrive.",
                                 source=getattr(self.planet_object, 'name', self.planet_name),
-                                reliability=0.9
+                                reliability=0.9,
+                                events=(NewsEvent.CARGO_LOST,),
+                                mentions=(('contract', contract_id),)
                             )
                     except Exception:
                         pass
@@ -7333,7 +9718,9 @@ class EnhancedPlanetEconomy:
                                 headline=headline,
                                 details=f"Contract {contract_id}: {headline}.",
                                 source=getattr(self.planet_object, 'name', self.planet_name),
-                                reliability=0.9
+                                reliability=0.9,
+                                events=(NewsEvent(notice),),
+                                mentions=(('contract', contract_id),)
                             )
                     except Exception:
                         pass
@@ -7385,13 +9772,7 @@ class EnhancedPlanetEconomy:
         can_supply = min(quantity, available_stock)
         
         if can_supply > 0 and surplus > 0:
-            # Find requesting planet
-            requesting_planet = None
-            for planet in planets:
-                if planet.name == request.requesting_planet:
-                    requesting_planet = planet
-                    break
-                    
+            requesting_planet = world_registry.planet(request.requesting_planet)
             if requesting_planet and hasattr(requesting_planet, 'enhanced_economy'):
                 # Pricing logic: ensure destination offers enough to cover supplier min + shipping + margin
                 unit_min = self.calculate_min_acceptable_price(commodity)
@@ -7481,6 +9862,11 @@ class EnhancedPlanetEconomy:
                             self.planet_name, recipe_name, self.stockpiles, crew_effectiveness
                         )
                         break  # Only start one process at a time
+
+    def record_pirate_attack(self):
+        """Record a pirate attack on shipments bound for this planet"""
+        self.recent_attacks = getattr(self, 'recent_attacks', 0) + 1
+        print(f"⚠️ {self.planet_name} records pirate attack! (Recent attacks: {self.recent_attacks})")
 class PirateBaseEconomy(EnhancedPlanetEconomy):
     """Economy for pirate bases with contraband and raiding needs"""
     
@@ -7490,8 +9876,9 @@ class PirateBaseEconomy(EnhancedPlanetEconomy):
         # Pirate-specific stockpiles
         self.contraband_stockpiles = {}
         self.intelligence_cache = []
-        self.last_raid_launch = 0
         self.raid_interval = 120  # Launch raiders every 2 minutes
+        self._raid_job = sim_scheduler.every(self.raid_interval, self.consider_launching_raiders,
+                                             name=f'raids:{base_name}', owner=self)
         
         self.initialize_pirate_economy()
         
@@ -7516,17 +9903,6 @@ class PirateBaseEconomy(EnhancedPlanetEconomy):
             ContrabandType.SLAVES: 0
         }
         
-    def update(self):
-        """Update pirate base economy and raiding operations"""
-        super().update()
-        
-        current_time = time.time()
-        
-        # Launch raiders based on intelligence and needs
-        if current_time - self.last_raid_launch > self.raid_interval:
-            self.consider_launching_raiders()
-            self.last_raid_launch = current_time
-            
     def consider_launching_raiders(self):
         """Decide whether to launch raiders - LOGICAL: target wealthy areas and profitable routes"""
         # 1. TARGET WEALTHY PLANETS - Pirates follow the money!
@@ -7625,7 +10001,7 @@ class PirateBaseEconomy(EnhancedPlanetEconomy):
                     if commodity in intel.cargo_manifest:
                         score *= 2
                         
-            age_hours = (time.time() - intel.intel_timestamp) / 3600
+            age_hours = (sim_clock.now - intel.intel_timestamp) / 3600
             if age_hours > 24:
                 continue
                 
@@ -7637,13 +10013,20 @@ class PirateBaseEconomy(EnhancedPlanetEconomy):
         
     def receive_intelligence(self, intelligence):
         """Receive intelligence about cargo movements"""
-        # Remove old intelligence
-        self.intelligence_cache = [intel for intel in self.intelligence_cache 
-                                 if time.time() - intel.intel_timestamp < 86400]  # 24 hours
-                                 
         self.intelligence_cache.append(intelligence)
+        self.prune_intelligence()
         print(f"🕵️ {self.planet_name} received cargo intelligence: {intelligence.cargo_manifest}")
         
+    def prune_intelligence(self, max_age=None, max_items=None):
+        """Forget stale intel (24 hours by default) and keep at most the newest `max_items`"""
+        policy = SETTINGS.get('retention', {})
+        max_age = policy.get('intel_max_age_sec', 86400) if max_age is None else max_age
+        max_items = policy.get('intel_max_items', 50) if max_items is None else max_items
+        before = len(self.intelligence_cache)
+        self.intelligence_cache = [intel for intel in self.intelligence_cache
+                                   if sim_clock.now - intel.intel_timestamp < max_age][-max_items:]
+        return before - len(self.intelligence_cache)
+
     def receive_stolen_goods(self, stolen_cargo):
         """Process stolen goods from successful raids"""
         for commodity, quantity in stolen_cargo.items():
@@ -7651,23 +10034,338 @@ class PirateBaseEconomy(EnhancedPlanetEconomy):
             
         print(f"🏴‍☠️ {self.planet_name} received stolen goods: {stolen_cargo}")
 
+# ===== VECTORIZED ECONOMY ENGINE =====
+
+class VectorEconomyEngine:
+    """Runs EnhancedPlanetEconomy.step_production for every planet at once (requires NumPy).
+
+    Stockpiles, production targets, consumption, reserves and fertility are laid out as
+    [planet x commodity] arrays. Each tick the stockpile dicts are gathered into the
+    arrays, the energy/recipe/decay/storage model runs as array operations, and the
+    results are written back, so the rest of the game keeps using plain dicts.
+    """
+    PARAM_REFRESH_SEC = 5.0  # Re-read production/consumption tables this often
+
+    def __init__(self):
+        self._economies = ()
+        self._next_param_refresh = 0.0
+        self.columns = list(EnhancedPlanetEconomy.PRODUCTION_ORDER)
+
+    def _refresh_parameters(self, economies):
+        """(Re)build the per-planet parameter arrays from the economy objects"""
+        extra = sorted({c for e in economies for c in e.daily_consumption} - set(self.columns[:8]))
+        self.columns = list(EnhancedPlanetEconomy.PRODUCTION_ORDER) + extra
+        self.col = {c: i for i, c in enumerate(self.columns)}
+        cols = self.columns
+        self.production = np.array([[float(e.daily_production.get(c, 0.0)) for c in cols] for e in economies])
+        self.consumption = np.array([[float(e.daily_consumption.get(c, 0.0)) for c in cols] for e in economies])
+        self.has_consumption = np.array([[c in e.daily_consumption for c in cols] for e in economies], dtype=bool)
+        # Perishable buffers and the food baseline default to 1.0/day when a planet lists no consumption
+        self.consumption_or_one = np.where(self.has_consumption, self.consumption, 1.0)
+        energy = [e.energy_parameters() for e in economies]
+        self.solar_per_day = np.array([s for s, _ in energy])
+        self.max_burn_per_day = np.array([b for _, b in energy])
+        self._economies = tuple(economies)
+        self._next_param_refresh = sim_clock.now + self.PARAM_REFRESH_SEC
+
+    def step(self, economies, dt):
+        """Advance production/consumption for all economies by dt (a scalar or one value per economy)"""
+        if not economies:
+            return
+        if np.ndim(dt):
+            dt = np.asarray(dt, dtype=float)
+            if not (dt > 0).any():
+                return
+            dt_cols = dt[:, None]
+        else:
+            if dt <= 0:
+                return
+            dt_cols = dt
+        if (len(economies) != len(self._economies)
+                or any(a is not b for a, b in zip(economies, self._economies))
+                or sim_clock.now >= self._next_param_refresh):
+            self._refresh_parameters(economies)
+        cols, col = self.columns, self.col
+        day = EnhancedPlanetEconomy.DAY_SECONDS
+        nan = float('nan')
+
+        # Gather mutable state (other systems edit the dicts between ticks)
+        missing = [nan] * len(cols)
+        raw = np.array([list(map(e.stockpiles.get, cols, missing)) for e in economies])
+        present = ~np.isnan(raw)
+        stock = np.where(present, raw, 0.0)
+        minerals_reserve = np.array([float(e.minerals_reserve) for e in economies])
+        fuel_reserve = np.array([float(e.fuel_reserve) for e in economies])
+        fertility = np.array([float(e.fertility) for e in economies])
+        blockaded = np.array([bool(getattr(e.planet_object, 'blockaded', False)) for e in economies])
+        block_factor = np.where(blockaded, 0.7, 1.0)
+
+        # Energy: solar plus burned fuel
+        fuel = col['fuel']
+        actual_burn = np.minimum(self.max_burn_per_day / day * dt, stock[:, fuel])
+        energy = (self.solar_per_day / day * dt + actual_burn * 5.0) * block_factor
+        stock[:, fuel] -= actual_burn
+
+        buffer_days = EnhancedPlanetEconomy.TARGET_BUFFER_DAYS
+        for commodity in EnhancedPlanetEconomy.PRODUCTION_ORDER:
+            c = col[commodity]
+            recipe = EnhancedPlanetEconomy.RECIPES[commodity]
+            cost = recipe['energy']
+            desired = self.production[:, c] / day * dt * block_factor
+            if commodity in ('minerals', 'fuel'):
+                reserve = minerals_reserve if commodity == 'minerals' else fuel_reserve
+                cap = np.maximum(1.0, np.sqrt(np.maximum(reserve, 0.0) / 1000.0) * 40.0) / day * dt
+                units = np.minimum(np.minimum(desired, cap), energy / max(0.0001, cost))
+                units = np.where((desired > 0) & (reserve > 0) & (units > 0), units, 0.0)
+                energy -= units * cost
+                reserve[:] = np.maximum(0.0, reserve - units)
+                stock[:, c] += units
+                continue
+            units = np.minimum(desired, energy / max(0.0001, cost))
+            ok = (desired > 0) & (units > 0)
+            for inp, req in recipe['inputs'].items():
+                if req > 0:
+                    units = np.minimum(units, stock[:, col[inp]] / req)
+                ok &= units > 0
+            # Days-of-supply throttle
+            need = self.consumption[:, c]
+            desired_stock = need * buffer_days
+            current = stock[:, c]
+            surplus = (current - desired_stock) / np.maximum(1.0, desired_stock)
+            throttle = np.where(current > desired_stock, np.maximum(0.2, 1.0 - 0.8 * surplus), 1.0)
+            throttle = np.where(current >= desired_stock * 2.0, 0.0, throttle)
+            units = units * np.where(need > 0, throttle, 1.0)
+            if commodity == 'food':
+                units = units * np.clip(fertility, 0.6, 1.2)
+            units = np.where(ok & (units > 0), units, 0.0)
+            for inp, req in recipe['inputs'].items():
+                stock[:, col[inp]] -= req * units
+            energy -= units * cost
+            stock[:, c] += units
+            if commodity == 'food':
+                baseline = self.consumption_or_one[:, c] * 2.0 / day * dt
+                produced = units > 0
+                fertility = np.where(produced & (units > baseline), np.maximum(0.6, fertility - 0.0005), fertility)
+                fertility = np.where(produced & (units <= baseline), np.minimum(1.2, fertility + 0.00025), fertility)
+
+        # Consumption capped by stock (only commodities a planet actually lists)
+        consumed = np.maximum(stock - self.consumption / day * dt_cols, 0.0)
+        stock = np.where(self.has_consumption, consumed, stock)
+        present |= self.has_consumption
+        present[:, fuel] = True
+        present |= stock != 0.0
+
+        # Perishables decay ~2%/day beyond a 60-day buffer
+        for perishable in EnhancedPlanetEconomy.PERISHABLES:
+            c = col[perishable]
+            buffer = self.consumption_or_one[:, c] * 60.0
+            current = stock[:, c]
+            over = present[:, c] & (current > buffer)
+            stock[:, c] = np.where(over, np.maximum(0.0, current - (current - buffer) * 0.02 * (dt / day)), current)
+        # Storage pressure: 2%/day beyond a 90-day buffer
+        buffer90 = self.consumption * 90.0
+        over = present & (self.consumption > 0) & (stock > buffer90)
+        stock = np.where(over, np.maximum(0.0, stock - (stock - buffer90) * 0.02 * (dt_cols / day)), stock)
+
+        # Scatter back into the dicts
+        rows = stock.tolist()
+        complete = present.all(axis=1)
+        for i, e in enumerate(economies):
+            row = rows[i]
+            if complete[i]:
+                e.stockpiles.update(zip(cols, row))
+            else:
+                keep = present[i]
+                e.stockpiles.update((c, row[j]) for j, c in enumerate(cols) if keep[j])
+            e.minerals_reserve = float(minerals_reserve[i])
+            e.fuel_reserve = float(fuel_reserve[i])
+            e.fertility = float(fertility[i])
+
+# Shared engine used by simulation_step when SETTINGS['vectorized_economy'] is on
+economy_engine = VectorEconomyEngine() if np is not None else None
+
+# ===== BATCHED SHIP KINEMATICS =====
+
+class ShipKinematics:
+    """Struct-of-arrays movement engine for transport ships (requires NumPy).
+
+    Position, current target, destination and speed of every tracked ship live in
+    NumPy arrays and are advanced with one vectorized step per tick. Waypoint lists
+    stay on the ships; a ship only drops back into Python when it reaches a waypoint
+    or arrives. Entity positions are written back by `push()`/`flush()`, so only
+    ships that are visible need to be touched every tick.
+    """
+    WAYPOINT_RADIUS = 6.0
+    ARRIVAL_RADIUS = 5.0
+
+    def __init__(self, capacity=256):
+        self._slots = {}  # id(ship) -> slot
+        self._free = []
+        self._count = 0   # High-water mark of used slots
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old = self._count
+        def grow(arr, shape, dtype=float):
+            new = np.zeros(shape, dtype=dtype)
+            if arr is not None:
+                new[:old] = arr[:old]
+            return new
+        self.pos = grow(getattr(self, 'pos', None), (capacity, 3))
+        self.target = grow(getattr(self, 'target', None), (capacity, 3))
+        self.dest = grow(getattr(self, 'dest', None), (capacity, 3))
+        self.speed = grow(getattr(self, 'speed', None), capacity)
+        self.active = grow(getattr(self, 'active', None), capacity, bool)
+        self.has_waypoint = grow(getattr(self, 'has_waypoint', None), capacity, bool)
+        self.ships = (getattr(self, 'ships', []) + [None] * capacity)[:capacity]
+        self.capacity = capacity
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, ship):
+        return id(ship) in self._slots
+
+    def track(self, ship):
+        """Start simulating a ship's movement in the arrays"""
+        if id(ship) in self._slots:
+            return
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._count >= self.capacity:
+                self._allocate(self.capacity * 2)
+            slot = self._count
+            self._count += 1
+        self._slots[id(ship)] = slot
+        self.ships[slot] = ship
+        self.active[slot] = False
+        self.refresh(ship)
+
+    def refresh(self, ship):
+        """Re-read route and speed after they change (retreat, raider heading home)"""
+        slot = self._slots.get(id(ship))
+        if slot is None:
+            return
+        if not self.active[slot]:
+            # The Entity was authoritative while Python moved the ship
+            self.pos[slot] = self._xyz(ship.position)
+        destination = getattr(ship, 'pirate_base', None) if isinstance(ship, PirateRaider) else getattr(ship, 'destination', None)
+        driven = (not getattr(ship, 'delivered', False) and hasattr(destination, 'position')
+                  and not getattr(ship, 'hunting_mode', False))
+        self.active[slot] = driven
+        ship._kinematics_driven = driven
+        if not driven:
+            return
+        waypoints = getattr(ship, 'waypoints', None) if not isinstance(ship, PirateRaider) else None
+        self.dest[slot] = self._xyz(destination.position)
+        self.target[slot] = self._xyz(waypoints[0]) if waypoints else self.dest[slot]
+        self.has_waypoint[slot] = bool(waypoints)
+        self.speed[slot] = float(getattr(ship, 'speed', 10.0))
+        ship.current_target_pos = self._vec(self.target[slot])
+
+    def untrack(self, ship):
+        slot = self._slots.pop(id(ship), None)
+        if slot is None:
+            return
+        self.active[slot] = False
+        self.ships[slot] = None
+        self._free.append(slot)
+        ship._kinematics_driven = False
+
+    def retain(self, live_ids):
+        """Stop tracking every ship whose id() is not in `live_ids`"""
+        for key in [k for k in self._slots if k not in live_ids]:
+            self.untrack(self.ships[self._slots[key]])
+
+    def step(self, dt):
+        """Advance all driven ships by dt; returns ships that arrived this tick"""
+        n = self._count
+        if n == 0 or dt <= 0:
+            return []
+        active = self.active[:n]
+        pos, target = self.pos[:n], self.target[:n]
+        # Consume waypoints that were reached before moving (same order as TransportShip.update)
+        dist = np.linalg.norm(target - pos, axis=1)
+        for slot in np.flatnonzero(active & self.has_waypoint[:n] & (dist < self.WAYPOINT_RADIUS)):
+            ship = self.ships[slot]
+            try:
+                ship.waypoints.pop(0)
+            except Exception:
+                pass
+            waypoints = getattr(ship, 'waypoints', None)
+            self.target[slot] = self._xyz(waypoints[0]) if waypoints else self.dest[slot]
+            self.has_waypoint[slot] = bool(waypoints)
+            ship.current_target_pos = self._vec(self.target[slot])
+        delta = target - pos
+        dist = np.linalg.norm(delta, axis=1)
+        step = np.where(active & (dist > 0), self.speed[:n] * dt / np.maximum(dist, 1e-9), 0.0)
+        pos += delta * step[:, None]
+        arrived = np.flatnonzero(active & (np.linalg.norm(self.dest[:n] - pos, axis=1) < self.ARRIVAL_RADIUS))
+        self.active[arrived] = False
+        return [self.ships[slot] for slot in arrived]
+
+    def visible_ships(self, player_pos, radius):
+        """Tracked ships within `radius` of the player (the ones worth pushing every tick)"""
+        n = self._count
+        if n == 0:
+            return []
+        d = np.linalg.norm(self.pos[:n] - self._xyz(player_pos), axis=1)
+        return [self.ships[slot] for slot in np.flatnonzero(self.active[:n] & (d < radius))]
+
+    def coords(self, ship):
+        slot = self._slots.get(id(ship))
+        return None if slot is None else self.pos[slot]
+
+    def push(self, ship):
+        """Write the simulated position back to the ship's Entity"""
+        slot = self._slots.get(id(ship))
+        if slot is not None:
+            ship.position = self._vec(self.pos[slot])
+
+    def flush(self):
+        """Push every tracked ship (before saving, or periodically for off-screen logic)"""
+        for slot in self._slots.values():
+            if self.active[slot]:
+                self.ships[slot].position = self._vec(self.pos[slot])
+
+    @staticmethod
+    def _xyz(v):
+        return (float(v.x), float(v.y), float(v.z))
+
+    @staticmethod
+    def _vec(row):
+        return Vec3(float(row[0]), float(row[1]), float(row[2]))
+
 # ===== UNIFIED TRANSPORT SYSTEM MANAGER =====
 
 class UnifiedTransportSystemManager:
     """Manager for all transport ships and systems"""
     
     def __init__(self):
-        self.message_ships = []
-        self.cargo_ships = []
-        self.payment_ships = []
-        self.raiders = []
-        self.smugglers = []
+        self.message_ships = ShipGroup('message')
+        self.cargo_ships = ShipGroup('cargo')
+        self.payment_ships = ShipGroup('payment')
+        self.raiders = ShipGroup('raider')
+        self.smugglers = ShipGroup('smuggler')
+        # Proximity index over every ship above, tagged by kind; refreshed each update
+        self.spatial_index = SpatialHashGrid(cell_size=100.0)
+        # Batched NumPy movement (created on first update when enabled and NumPy is present)
+        self.kinematics = None
+        self._next_kinematics_flush = 0.0
+        # Interval is read from SETTINGS on every reschedule so it can be tuned at runtime
+        self._patrol_job = sim_scheduler.every(lambda: SETTINGS.get('patrol_spawn_interval_sec', 60),
+                                               self.spawn_threat_patrol, first_delay=0,
+                                               name='threat_patrol', owner=self)
+        
+    def ship_groups(self):
+        """(kind, list) pairs in update order"""
+        return (('message', self.message_ships), ('cargo', self.cargo_ships),
+                ('payment', self.payment_ships), ('raider', self.raiders),
+                ('smuggler', self.smugglers))
         
     def update(self):
         """Update all transport ships"""
-        all_ships = (self.message_ships + self.cargo_ships + self.payment_ships + 
-                    self.raiders + self.smugglers)
-        
         # LOD-based update throttling by distance to player
         player_pos = None
         try:
@@ -7675,7 +10373,15 @@ class UnifiedTransportSystemManager:
                 player_pos = scene_manager.space_controller.position
         except Exception:
             player_pos = None
-        for ship in all_ships[:]:  # Copy to avoid modification during iteration
+        if self.kinematics is None and np is not None and SETTINGS.get('batched_kinematics', False):
+            self.kinematics = ShipKinematics()
+        kin = self.kinematics
+        live = set()
+        for kind, ship in [(k, s) for k, ships in self.ship_groups() for s in ships]:
+            if getattr(ship, '_far_transit', None) is not None:
+                continue  # Flown analytically by simulation_lod
+            if kin is not None and ship not in kin and hasattr(ship, 'position'):
+                kin.track(ship)
             # Decide update interval by distance
             interval = SETTINGS['lod']['update_interval_near']
             if player_pos is not None and hasattr(ship, 'position'):
@@ -7687,7 +10393,7 @@ class UnifiedTransportSystemManager:
                         interval = SETTINGS['lod']['update_interval_far']
                 except Exception:
                     pass
-            now = time.time()
+            now = sim_clock.now
             if interval > 0:
                 if not hasattr(ship, '_next_update_time'):
                     ship._next_update_time = now
@@ -7705,30 +10411,33 @@ class UnifiedTransportSystemManager:
             # Remove delivered ships
             if hasattr(ship, 'delivered') and ship.delivered:
                 self.remove_ship(ship)
-        # Dynamic patrol spawning near high-threat routes
+            elif hasattr(ship, 'position'):
+                live.add(id(ship))
+                if kin is not None and getattr(ship, '_kinematics_driven', False):
+                    x, y, z = kin.coords(ship)
+                    self.spatial_index.move(ship, x, y, z, kind)
+                else:
+                    self.spatial_index.update(ship, ship.position, kind)
+                    p = ship.position
+                    x, y, z = p.x, p.y, p.z
+                trail_renderer.record(ship, x, y, z)
+        # Forget ships that left the lists elsewhere (raided, destroyed, reloaded)
+        self.spatial_index.retain(live)
+        trail_renderer.retain(live)
+        if kin is not None:
+            kin.retain(live)
+            self.step_kinematics(kin, player_pos)
+        if player_pos is not None:
+            self.check_player_encounters(player_pos)
         try:
-            if not hasattr(self, '_last_patrol_spawn'):
-                self._last_patrol_spawn = 0
-            if time.time() - self._last_patrol_spawn > SETTINGS.get('patrol_spawn_interval_sec', 60):
-                threat = self.calculate_threat_level()
-                if threat in ("HIGH", "EXTREME") and self.cargo_ships:
-                    # Pick a cargo ship on a route and spawn a patrol near it
-                    target = random.choice(self.cargo_ships)
-                    pos = target.position + Vec3(random.uniform(-25, 25), 0, random.uniform(-25, 25))
-                    faction_id = 'terran_federation'  # Default patrol faction; could be dynamic by region
-                    patrol = MilitaryShip(faction_id, MilitaryShipType.PATROL, pos, patrol_radius=150)
-                    patrol.patrol_center = pos
-                    if 'military_manager' in globals():
-                        military_manager.military_ships.append(patrol)
-                self._last_patrol_spawn = time.time()
             # Reactive escorts along player's current route
             if hasattr(player, 'course_route') and player.course_route and player.autopilot:
                 try:
                     # Occasionally spawn friendly patrols near current leg
                     if random.random() < 0.1 and self.cargo_ships:
                         pos = player.position + Vec3(random.uniform(-35, 35), 0, random.uniform(-35, 35))
-                        faction_id = getattr(next((pl for pl in planets if pl.name == player.course_route[player.course_route_index]), None), 'faction_id', 'terran_federation')
-                        patrol = MilitaryShip(faction_id, MilitaryShipType.PATROL, pos, patrol_radius=120)
+                        faction_id = getattr(world_registry.planet(player.course_route[player.course_route_index]), 'faction_id', 'terran_federation')
+                        patrol = MilitaryShip.spawn(faction_id, MilitaryShipType.PATROL, pos, patrol_radius=120)
                         patrol.patrol_center = pos
                         military_manager.military_ships.append(patrol)
                 except Exception:
@@ -7736,19 +10445,72 @@ class UnifiedTransportSystemManager:
         except Exception:
             pass
                     
+    def spawn_threat_patrol(self):
+        """Dynamic patrol spawning near high-threat routes (scheduled every patrol_spawn_interval_sec)"""
+        threat = self.calculate_threat_level()
+        if threat in ("HIGH", "EXTREME") and self.cargo_ships:
+            # Pick a cargo ship on a route and spawn a patrol near it
+            target = random.choice(self.cargo_ships)
+            pos = target.position + Vec3(random.uniform(-25, 25), 0, random.uniform(-25, 25))
+            faction_id = 'terran_federation'  # Default patrol faction; could be dynamic by region
+            # Skip if this faction already has a ship covering the spot
+            if 'military_manager' in globals() and not military_manager.ships_near(pos, 150, faction_id):
+                patrol = MilitaryShip.spawn(faction_id, MilitaryShipType.PATROL, pos, patrol_radius=150)
+                patrol.patrol_center = pos
+                military_manager.military_ships.append(patrol)
+                    
+    def step_kinematics(self, kin, player_pos):
+        """Vectorized movement for all driven ships, then arrivals and Entity write-back"""
+        for ship in kin.step(sim_clock.dt):
+            kin.push(ship)
+            ship._kinematics_driven = False
+            if isinstance(ship, PirateRaider):
+                ship.return_to_base()
+            else:
+                ship.on_arrival()
+            if getattr(ship, 'delivered', False):
+                self.remove_ship(ship)
+        # Visible ships are written back every tick; the rest on a slower cadence for off-screen logic
+        if sim_clock.now >= self._next_kinematics_flush:
+            kin.flush()
+            self._next_kinematics_flush = sim_clock.now + SETTINGS.get('kinematics_flush_interval_sec', 1.0)
+        elif player_pos is not None:
+            for ship in kin.visible_ships(player_pos, SETTINGS['lod']['visibility_threshold']):
+                kin.push(ship)
+                
+    def flush_kinematics(self):
+        """Bring every Entity position up to date with the batched simulation"""
+        if self.kinematics is not None:
+            self.kinematics.flush()
+                
+    def check_player_encounters(self, player_pos, radius=30):
+        """Trigger encounters for transport ships near the player (one grid query)"""
+        for ship in self.spatial_index.query_radius(player_pos, radius, kinds=('message', 'cargo', 'payment', 'smuggler')):
+            if not getattr(ship, 'encounter_triggered', True):
+                ship.trigger_player_encounter()
+                
+    def refresh_route(self, ship):
+        """Tell the batched movement engine that a ship's route, speed or mode changed"""
+        if self.kinematics is not None:
+            self.kinematics.refresh(ship)
+            
+    def forget_ship(self, ship):
+        """Drop a ship from the spatial index and movement engine (list removal is the caller's)"""
+        self.spatial_index.remove(ship)
+        if self.kinematics is not None:
+            self.kinematics.untrack(ship)
+            
     def remove_ship(self, ship):
-        """Remove ship from appropriate list"""
-        lists_to_check = [
-            self.message_ships, self.cargo_ships, self.payment_ships,
-            self.raiders, self.smugglers
-        ]
-        
-        for ship_list in lists_to_check:
-            if ship in ship_list:
-                ship_list.remove(ship)
+        """Remove ship from its group"""
+        self.forget_ship(ship)
+        for kind, group in self.ship_groups():
+            if kind == getattr(ship, '_ship_kind', None):
+                group.discard(ship)
                 break
         # Defer destruction to here to avoid accessing a destroyed NodePath mid-update
         try:
+            if hasattr(ship, 'release_visuals'):
+                ship.release_visuals()
             destroy(ship)
         except Exception:
             pass
@@ -7790,11 +10552,18 @@ class UnifiedTransportSystemManager:
             
     def create_pirate_base(self, planet):
         """Convert a planet to a pirate base"""
+        old_economy = getattr(planet, 'enhanced_economy', None)
+        if old_economy is not None:
+            sim_scheduler.cancel_owner(old_economy)
         planet.enhanced_economy = PirateBaseEconomy(planet.name, planet)
         planet.planet_type = "pirate_hideout"
         # Fallback to a valid Ursina color similar to dark red
         planet.color = color.red.tint(-.4)
         print(f"🏴‍☠️ {planet.name} has become a pirate base!")
+        try:
+            simulation_lod.invalidate()
+        except Exception:
+            pass
         return True
 
     def spawn_escorts_for_cargo(self, cargo_ship, faction_id: str, num_escorts: int = 2):
@@ -7813,7 +10582,7 @@ class UnifiedTransportSystemManager:
             for i in range(total):
                 offset = Vec3(random.uniform(-15, 15), 0, random.uniform(-15, 15))
                 pos = cargo_ship.position + offset if hasattr(cargo_ship, 'position') else Vec3(0, 0, 0)
-                escort = MilitaryShip(faction_id, MilitaryShipType.ESCORT, pos, patrol_radius=120)
+                escort = MilitaryShip.spawn(faction_id, MilitaryShipType.ESCORT, pos, patrol_radius=120)
                 escort.target_position = pos
                 escort.patrol_center = pos
                 military_manager.military_ships.append(escort)
@@ -7840,9 +10609,9 @@ class TransportContractRegistry:
             distance = (origin_planet.position - dest_planet.position).length()
             avg_speed = 8.0
             travel_time = max(60.0, distance / avg_speed)
-            return time.time() + travel_time
+            return sim_clock.now + travel_time
         except Exception:
-            return time.time() + 300.0
+            return sim_clock.now + 300.0
 
     def register_contract(self, origin_planet, dest_planet, commodity, quantity, unit_price, total_cost) -> str:
         cid = self._next_id()
@@ -7899,7 +10668,7 @@ class TransportContractRegistry:
             return
         # Mark as lost; knowledge propagates physically or by timeout message
         data['status'] = 'failed_cargo_lost'
-        data['lost_time'] = time.time()
+        data['lost_time'] = sim_clock.now
 
     def payment_delivered(self, contract_id: str):
         data = self._contracts.get(contract_id)
@@ -7935,8 +10704,7 @@ class TransportContractRegistry:
             # Physically inform destination that payment is lost
             try:
                 payload = {'kind': 'CONTRACT_NOTICE', 'contract_id': contract_id, 'notice': 'PAYMENT_LOST'}
-                msg = MessageShip(data['origin'], data['dest'], MessageType.NEWS_BULLETIN, payload)
-                unified_transport_system.message_ships.append(msg)
+                courier_dispatcher.send(data['origin'], data['dest'], MessageType.NEWS_BULLETIN, payload)
             except Exception:
                 pass
         except Exception:
@@ -7966,28 +10734,60 @@ class TransportContractRegistry:
             for cid, data in list(self._contracts.items()):
                 deadline = data.get('expected_arrival', 0) + data.get('arrival_grace', 180.0)
                 if data.get('status') == 'failed_cargo_lost' and not data.get('inquiry_sent'):
-                    if time.time() > deadline:
+                    if sim_clock.now > deadline:
                         try:
                             payload = {'kind': 'CONTRACT_NOTICE', 'contract_id': cid, 'notice': 'CARGO_LOST'}
-                            msg = MessageShip(data['dest'], data['origin'], MessageType.NEWS_BULLETIN, payload)
-                            unified_transport_system.message_ships.append(msg)
+                            courier_dispatcher.send(data['dest'], data['origin'], MessageType.NEWS_BULLETIN, payload)
                             data['inquiry_sent'] = True
                             self.mark_known(cid, 'dest')
                         except Exception:
                             pass
                 # Payment overdue: if payment_in_transit far beyond ETA, send notice to dest
                 if data.get('status') == 'payment_in_transit' and not data.get('inquiry_sent'):
-                    if time.time() > deadline + SETTINGS.get('payment_overdue_grace', 240.0):
+                    if sim_clock.now > deadline + SETTINGS.get('payment_overdue_grace', 240.0):
                         try:
                             payload = {'kind': 'CONTRACT_NOTICE', 'contract_id': cid, 'notice': 'PAYMENT_OVERDUE'}
-                            msg = MessageShip(data['origin'], data['dest'], MessageType.NEWS_BULLETIN, payload)
-                            unified_transport_system.message_ships.append(msg)
+                            courier_dispatcher.send(data['origin'], data['dest'], MessageType.NEWS_BULLETIN, payload)
                             data['inquiry_sent'] = True
                         except Exception:
                             pass
         except Exception:
             pass
 
+    CLOSED_STATUSES = ('completed', 'payment_lost_insured', 'payment_lost_uninsured')
+
+    def is_closed(self, data) -> bool:
+        status = data.get('status')
+        if status in self.CLOSED_STATUSES:
+            return True
+        # A lost cargo is settled once the buyer was refunded and the seller heard about it
+        return status == 'failed_cargo_lost' and data.get('inquiry_sent') and data.get('known_to_origin')
+
+    def archive_closed(self, keep_sec: float):
+        """Remove contracts that have been closed for `keep_sec`; returns them as plain records"""
+        now = sim_clock.now
+        archived = []
+        for cid, data in list(self._contracts.items()):
+            if not self.is_closed(data):
+                continue
+            closed_at = data.setdefault('closed_at', now)
+            if now - closed_at < keep_sec:
+                continue
+            del self._contracts[cid]
+            archived.append({
+                'id': cid,
+                'origin': getattr(data.get('origin'), 'name', None),
+                'dest': getattr(data.get('dest'), 'name', None),
+                'commodity': data.get('commodity'),
+                'quantity': data.get('quantity'),
+                'total_cost': data.get('total_cost'),
+                'status': data.get('status'),
+                'insurance_premium': data.get('insurance_premium'),
+                'insurance_payout': data.get('insurance_payout'),
+                'closed_at': closed_at,
+            })
+        return archived
+
     def get_local_contract_summaries(self, planet_name: str):
         """Return brief contract summaries visible to a given planet based on physical knowledge."""
         summaries = []
@@ -8085,74 +10885,267 @@ SETTINGS = {
         'update_interval_near': 0.0,
         'update_interval_far': 0.5,
         'update_interval_very_far': 2.0,
+        'two_tier': True,                 # Aggregate model for everything beyond detail_radius
+        'detail_radius': 2000.0,          # Full-fidelity bubble around the player
+        'detail_hysteresis': 200.0,       # Extra distance before something drops to the far tier
+        'refresh_interval_sec': 1.0,      # How often planets and ships change tier
+        'far_economy_interval_sec': 5.0,  # Each far economy gets one bulk update this often
+        'far_loss_per_trip': {'UNKNOWN': 0.02, 'LOW': 0.01, 'MEDIUM': 0.04, 'HIGH': 0.1, 'EXTREME': 0.2},
     },
     'ship_child_hide_distance': 900.0,
     'town_prop_hide_distance': 70.0,
+    'batched_kinematics': False,      # NumPy ship movement; moves every ship each tick, bypassing the lod update_interval_* throttle
+    'vectorized_economy': True,
+    'vectorized_economy_min_planets': 32,  # Below this the per-planet Python path is cheaper
+    'kinematics_flush_interval_sec': 1.0,
+    'sim_tick_sec': 1.0 / 30.0,
+    'sim_max_ticks_per_frame': None,  # None: enough ticks for SimClock.MAX_TIME_SCALE at 60 fps
+    'save_format': 'binary',         # 'binary' (.ilks section container) or 'json'
+    'save_keep_timestamped': 5,      # Fallback save_<timestamp> files kept by the catalog
+    'save_mode': 'journal',          # 'journal' (checkpoint + deltas) or 'full' (every save is a checkpoint)
+    'save_checkpoint_every': 10,     # Journal records before the next full checkpoint
+    'save_journal_max_ratio': 0.5,   # ...or once the journal exceeds this fraction of the checkpoint size
+    'planet_render_range': 3000.0,   # Planets farther than this from the player have no sphere Entity
+    'planet_render_max': 300,        # Cap on simultaneously materialized planet spheres
+    'courier_max_batch': 16,         # Letters per courier before it leaves early
+    'courier_batch_wait_sec': 10.0,  # Longest a letter waits for others on the same route
+    'courier_urgent_wait_sec': 1.0,  # ...or this long when the bag holds urgent mail
+    'courier_max_stops': 24,         # Destinations one courier visits before a second one is launched
+    'mailbox_capacity': 200,         # Letters kept per planet mailbox (oldest dropped first)
+    'news_capacity': 100,            # News items kept per planet
+    'mailbox_ttl_sec': 2592000,      # Letters expire after 30 days
+    'news_ttl_sec': 1209600,         # News expires after 14 days
+    'retention': {
+        'check_interval_sec': 30.0,           # How often closed records are swept out of memory
+        'archive_enabled': True,              # Append swept records to archive_path (else just drop them)
+        'archive_path': os.path.join('saves', 'archive.jsonl'),
+        'transport_contracts_keep_sec': 600.0,  # Closed cargo contracts stay visible locally this long
+        'completed_contracts_keep': 20,       # Finished dynamic contracts kept in memory (as saved)
+        'intel_max_age_sec': 86400.0,         # Pirate intel older than this is forgotten
+        'intel_max_items': 50,                # ...and each base keeps at most this many reports
+    },
+    'procurement_max_suppliers': 6,  # Nearest surplus planets a shortage request is mailed to (0 = all)
 }
+sim_clock.tick_seconds = SETTINGS['sim_tick_sec']
+sim_clock.max_ticks_per_frame = SETTINGS['sim_max_ticks_per_frame'] or sim_clock.ticks_for_max_scale()
+planet_renderer.render_range = SETTINGS['planet_render_range']
+planet_renderer.max_bodies = SETTINGS['planet_render_max']
+courier_dispatcher.max_batch = SETTINGS['courier_max_batch']
+courier_dispatcher.batch_wait = SETTINGS['courier_batch_wait_sec']
+courier_dispatcher.urgent_wait = SETTINGS['courier_urgent_wait_sec']
+courier_dispatcher.max_stops = SETTINGS['courier_max_stops']
+physical_communication.planetary_mailboxes.capacity = SETTINGS['mailbox_capacity']
+physical_communication.planetary_news.capacity = SETTINGS['news_capacity']
+physical_communication.planetary_mailboxes.ttl = SETTINGS['mailbox_ttl_sec']
+physical_communication.planetary_news.ttl = SETTINGS['news_ttl_sec']
+
+# ===== RETENTION / ARCHIVE =====
+
+def _approx_sizeof(obj, depth=3, _seen=None):
+    """Rough deep size in bytes: follows containers and instance dicts a few levels down"""
+    _seen = set() if _seen is None else _seen
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    size = sys.getsizeof(obj, 64)
+    if depth <= 0 or isinstance(obj, (str, bytes, int, float, bool, Enum)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += _approx_sizeof(k, depth - 1, _seen) + _approx_sizeof(v, depth - 1, _seen)
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        for item in obj:
+            size += _approx_sizeof(item, depth - 1, _seen)
+    elif hasattr(obj, '__dict__') and not isinstance(obj, (Planet, Entity)):
+        size += _approx_sizeof(vars(obj), depth - 1, _seen)
+    return size
+
+class RecordArchive:
+    """Append-only JSON-lines log of records that retention dropped from memory.
+
+    One line per record: {"store", "archived_at" (sim time), "record"}. The game
+    never reads it back; it keeps long-run history out of RAM for later analysis.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.enabled = True
+        self.archived = {}  # store -> records archived this session
+        self.bytes_written = 0
+
+    def write(self, store, records):
+        if not records:
+            return 0
+        self.archived[store] = self.archived.get(store, 0) + len(records)
+        if not self.enabled:
+            return len(records)
+        try:
+            lines = ''.join(json.dumps({'store': store, 'archived_at': sim_clock.now, 'record': r}, default=str) + '\n'
+                            for r in records)
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+            self.bytes_written += len(lines)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Archive write failed: {e}")
+        return len(records)
+
+class RetentionManager:
+    """Applies SETTINGS['retention'] to the stores that otherwise grow all session.
+
+    Every `check_interval_sec` of sim time closed transport contracts past their
+    grace period and finished dynamic contracts beyond the kept history are written
+    to the archive and dropped, and pirate intel caches are trimmed. Mail and news
+    are bounded by their ExpiringFeed capacity/TTL; `memory_report()` covers all.
+    """
+    def __init__(self, archive):
+        self.archive = archive
+        self.sweeps = 0
+        self._job = sim_scheduler.every(lambda: SETTINGS['retention']['check_interval_sec'], self.sweep,
+                                        name='retention', owner=self)
+
+    def _pirate_economies(self):
+        return [p.enhanced_economy for p in planets if isinstance(getattr(p, 'enhanced_economy', None), PirateBaseEconomy)]
+
+    def sweep(self):
+        policy = SETTINGS['retention']
+        self.archive.enabled = policy.get('archive_enabled', True)
+        self.archive.path = policy.get('archive_path', self.archive.path)
+        try:
+            self.archive.write('transport_contracts', contract_registry.archive_closed(policy['transport_contracts_keep_sec']))
+            self.archive.write('completed_contracts', dynamic_contracts.archive_completed(policy['completed_contracts_keep']))
+            for economy in self._pirate_economies():
+                economy.prune_intelligence(policy['intel_max_age_sec'], policy['intel_max_items'])
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Retention sweep failed: {e}")
+        self.sweeps += 1
+
+    def memory_report(self):
+        """store -> (items held, approximate bytes), sampling up to 20 items per store"""
+        def measure(items):
+            items = list(items)
+            if not items:
+                return (0, 0)
+            sample = items[:: max(1, len(items) // 20)][:20]
+            per_item = sum(_approx_sizeof(i) for i in sample) / len(sample)
+            return (len(items), int(per_item * len(items)))
+        intel = [i for e in self._pirate_economies() for i in e.intelligence_cache]
+        return {
+            'transport_contracts': measure(contract_registry._contracts.values()),
+            'completed_contracts': measure(dynamic_contracts.completed_contracts),
+            'intelligence_cache': measure(intel),
+            'planetary_news': measure(n for items in physical_communication.planetary_news.values() for n in items),
+            'planetary_mailboxes': measure(l for items in physical_communication.planetary_mailboxes.values() for l in items),
+            'rumors': measure(physical_communication.word_of_mouth_pool),
+        }
 
-# ===== GALAXY GRAPH / ROUTING =====
-planet_graph = {}
+    def stats(self):
+        return {'sweeps': self.sweeps, 'archived': dict(self.archive.archived),
+                'archive_bytes': self.archive.bytes_written}
 
-def _distance(a: 'Vec3', b: 'Vec3') -> float:
-    try:
-        return (a - b).length()
-    except Exception:
-        return 0.0
+retention_manager = RetentionManager(RecordArchive(SETTINGS['retention']['archive_path']))
 
-def rebuild_planet_graph(k_neighbors: int = 3):
-    global planet_graph
-    planet_graph = {}
-    try:
-        for p in planets:
-            planet_graph[p.name] = []
-        for p in planets:
-            # Find k nearest other planets
-            others = sorted(
-                [q for q in planets if q is not p],
-                key=lambda q: _distance(p.position, q.position)
-            )[:max(1, k_neighbors)]
-            for q in others:
-                w = _distance(p.position, q.position)
-                planet_graph[p.name].append((q.name, w))
-                # Ensure undirected edge
-                if q.name in planet_graph:
-                    if all(n != p.name for n, _ in planet_graph[q.name]):
-                        planet_graph[q.name].append((p.name, w))
-    except Exception:
-        planet_graph = {}
+# ===== ROUTING =====
 
-def find_route(origin_name: str, dest_name: str, avoid_blockades: bool = True):
-    # Dijkstra's algorithm over planet_graph
-    try:
-        import heapq
-        pq = []
-        heapq.heappush(pq, (0.0, origin_name, None))
+class RoutePlanner:
+    """Caches shortest-path trees per origin over planet_graph.
+
+    A tree is a full Dijkstra run from one origin, so every later query from
+    that origin is a path walk. Blockade changes only drop the trees they can
+    affect: a new blockade drops trees that reached the planet, a lifted one
+    drops trees that had to skip it. Adding or removing a planet drops everything.
+    """
+    def __init__(self):
+        self._trees = {}  # (origin, avoid_blockades) -> (dist, prev, skipped)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _blockaded(self):
+        try:
+            return {name for name in military_manager.blockade_zones
+                    if military_manager.is_planet_blockaded(name)}
+        except Exception:
+            return set()
+
+    def _build_tree(self, origin_name, avoid_blockades):
+        blockaded = self._blockaded() if avoid_blockades else set()
         dist = {origin_name: 0.0}
         prev = {}
+        skipped = set()
         visited = set()
+        pq = [(0.0, origin_name)]
         while pq:
-            d, u, _ = heapq.heappop(pq)
+            d, u = heapq.heappop(pq)
             if u in visited:
                 continue
             visited.add(u)
-            if u == dest_name:
-                break
-            for v, w in planet_graph.get(u, []):
-                if avoid_blockades and military_manager.is_planet_blockaded(v):
+            for v, w in planet_graph.get(u, {}).items():
+                if v in blockaded:
+                    skipped.add(v)
                     continue
                 nd = d + w
                 if v not in dist or nd < dist[v]:
                     dist[v] = nd
                     prev[v] = u
-                    heapq.heappush(pq, (nd, v, u))
-        if dest_name not in prev and origin_name != dest_name:
+                    heapq.heappush(pq, (nd, v))
+        return dist, prev, skipped
+
+    def tree(self, origin_name, avoid_blockades=True):
+        key = (origin_name, bool(avoid_blockades))
+        cached = self._trees.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        cached = self._build_tree(origin_name, avoid_blockades)
+        self._trees[key] = cached
+        return cached
+
+    def route(self, origin_name, dest_name, avoid_blockades=True):
+        """Planet names from origin to dest inclusive, or [] when unreachable"""
+        if origin_name == dest_name:
+            return [origin_name]
+        _, prev, _ = self.tree(origin_name, avoid_blockades)
+        if dest_name not in prev:
             return []
-        # Reconstruct path
         path = [dest_name]
-        while path[-1] != origin_name and path[-1] in prev:
+        while path[-1] != origin_name:
             path.append(prev[path[-1]])
         path.reverse()
         return path
+
+    def distance(self, origin_name, dest_name, avoid_blockades=True):
+        dist, _, _ = self.tree(origin_name, avoid_blockades)
+        return dist.get(dest_name)
+
+    def blockade_changed(self, planet_name, blockaded):
+        """Drop cached trees whose result depends on planet_name being passable"""
+        stale = []
+        for key, (dist, _, skipped) in self._trees.items():
+            if not key[1]:
+                continue  # Trees that ignore blockades never change
+            if (planet_name in dist) if blockaded else (planet_name in skipped):
+                stale.append(key)
+        for key in stale:
+            del self._trees[key]
+        self.invalidations += len(stale)
+
+    def invalidate_all(self):
+        self.invalidations += len(self._trees)
+        self._trees.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'trees': len(self._trees), 'hits': self.hits, 'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0}
+
+route_planner = RoutePlanner()
+
+def find_route(origin_name: str, dest_name: str, avoid_blockades: bool = True):
+    # Shortest path over planet_graph, served from route_planner's cache
+    try:
+        return route_planner.route(origin_name, dest_name, avoid_blockades)
     except Exception:
         return []
 
@@ -8334,6 +11327,7 @@ class Diagnostics:
         os.makedirs(self.log_dir, exist_ok=True)
         self.log_path = os.path.join(self.log_dir, file_name)
         self._fh = open(self.log_path, 'a', buffering=1)
+        self._write_lock = threading.Lock()  # The save worker logs from its own thread
         self._max_bytes = max_bytes
         self._backup_count = backup_count
         self._patterns = [
@@ -8374,8 +11368,9 @@ class Diagnostics:
             'extra': extra or {}
         }
         try:
-            self._fh.write(json.dumps(record) + "\n")
-            self._rotate_if_needed()
+            with self._write_lock:
+                self._fh.write(json.dumps(record) + "\n")
+                self._rotate_if_needed()
         except Exception:
             pass
 
@@ -8427,6 +11422,120 @@ try:
 except Exception:
     pass
 
+# ===== FRAME PROFILER =====
+
+class FrameProfiler:
+    """Rolling per-subsystem timings for the simulation tick and whole frame (enable with GAME_PROFILE=1).
+
+    Keeps the last `window` samples per subsystem and reports p50/p95/p99 in
+    milliseconds alongside entity counts. A summary is written through
+    `diagnostics.log_event('profile.frame', ...)` every `flush_interval` wall seconds.
+    When disabled, simulation_step never calls into the profiler.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 600, flush_interval: float = 10.0):
+        self.enabled = enabled
+        self.window = window
+        self.flush_interval = flush_interval
+        self.samples = {}
+        self.ticks = 0
+        self._next_flush = perf_counter() + flush_interval
+
+    def record(self, name: str, seconds: float):
+        series = self.samples.get(name)
+        if series is None:
+            series = self.samples[name] = deque(maxlen=self.window)
+        series.append(seconds * 1000.0)
+
+    def end_tick(self, seconds: float):
+        self.record('tick', seconds)
+        self.ticks += 1
+        if perf_counter() >= self._next_flush:
+            self._next_flush = perf_counter() + self.flush_interval
+            self.flush()
+
+    @staticmethod
+    def _percentile(ordered, pct):
+        return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+    def percentiles(self):
+        """{name: {'p50', 'p95', 'p99', 'max', 'n'}} in milliseconds"""
+        stats = {}
+        for name, series in self.samples.items():
+            if not series:
+                continue
+            ordered = sorted(series)
+            stats[name] = {
+                'p50': round(self._percentile(ordered, 50), 3),
+                'p95': round(self._percentile(ordered, 95), 3),
+                'p99': round(self._percentile(ordered, 99), 3),
+                'max': round(ordered[-1], 3),
+                'n': len(ordered),
+            }
+        return stats
+
+    def entity_counts(self):
+        counts = {}
+        sources = [
+            ('planets', lambda: len(planets)),
+            ('military_ships', lambda: len(military_manager.military_ships)),
+            ('weather_events', lambda: len(weather_system.active_weather)),
+            ('contracts', lambda: len(dynamic_contracts.available_contracts) + len(dynamic_contracts.active_contracts)),
+            ('scheduled_jobs', lambda: len(sim_scheduler)),
+            ('pooled_entities', lambda: entity_pool.free_count()),
+            ('planet_bodies', lambda: len(planet_renderer)),
+            ('far_ships', lambda: len(simulation_lod.transits)),
+        ]
+        for name, count in sources:
+            try:
+                counts[name] = count()
+            except Exception:
+                pass
+        try:
+            for kind, ships in unified_transport_system.ship_groups():
+                counts[f'{kind}_ships'] = len(ships)
+        except Exception:
+            pass
+        return counts
+
+    def report(self):
+        report = {'ticks': self.ticks, 'sim_time_scale': sim_clock.time_scale,
+                  'subsystems': self.percentiles(), 'entities': self.entity_counts()}
+        try:
+            report['routes'] = route_planner.stats()
+            report['lod'] = simulation_lod.stats()
+            report['couriers'] = courier_dispatcher.stats()
+            report['suppliers'] = supplier_index.stats()
+            report['retention'] = retention_manager.stats()
+            report['scheduler_failures'] = {'sim': sim_scheduler.failures, 'frame': frame_scheduler.failures}
+        except Exception:
+            pass
+        return report
+
+    def flush(self):
+        try:
+            diagnostics.log_event('profile.frame', 'INFO', 'subsystem timings (ms)', self.report())
+        except Exception:
+            pass
+        try:
+            if diagnostics_ui.active:
+                diagnostics_ui.refresh()
+        except Exception:
+            pass
+
+    def summary_lines(self, limit: int = 12):
+        stats = self.percentiles()
+        ranked = sorted(stats.items(), key=lambda kv: kv[1]['p95'], reverse=True)
+        lines = [f"{'subsystem':<18} p50    p95    p99 (ms)"]
+        for name, st in ranked[:limit]:
+            lines.append(f"{name:<18} {st['p50']:<6.2f} {st['p95']:<6.2f} {st['p99']:.2f}")
+        counts = self.entity_counts()
+        if counts:
+            lines.append(', '.join(f"{k}={v}" for k, v in counts.items()))
+        return lines
+
+frame_profiler = FrameProfiler(enabled=os.environ.get('GAME_PROFILE', '0') == '1')
+
 class DiagnosticsUI:
     def __init__(self):
         self.active = False
@@ -8447,8 +11556,22 @@ class DiagnosticsUI:
         # Show top counters sorted by count
         items = sorted(diagnostics.counters.items(), key=lambda kv: kv[1], reverse=True)
         lines = []
-        for name, count in items[:20]:
+        limit = 8 if frame_profiler.enabled else 20
+        for name, count in items[:limit]:
             lines.append(f"{name}: {count}")
+        if frame_profiler.enabled:
+            lines.append('')
+            lines.extend(frame_profiler.summary_lines())
+        try:
+            lines.append('')
+            lines.append('Memory (items, approx KB):')
+            for store, (count, size) in retention_manager.memory_report().items():
+                lines.append(f"  {store}: {count} ({size / 1024:.0f} KB)")
+            archived = retention_manager.archive.archived
+            if archived:
+                lines.append('  archived: ' + ', '.join(f"{k} {v}" for k, v in archived.items()))
+        except Exception:
+            pass
         self.body.text = "\n".join(lines) if lines else "No diagnostics yet."
 
 def _toggle_uuid_label(entity, visible: bool):
@@ -8560,7 +11683,7 @@ class TradingUI:
             annotate_ui_tree(self.panel)
         # Enable refuel panel if station is present
         try:
-            planet_obj = next((p for p in planets if getattr(p, 'name', None) == planet_name), None)
+            planet_obj = world_registry.planet(planet_name)
             has_station = bool(planet_obj and getattr(planet_obj, 'has_fuel_station', False))
             self._toggle_refuel(has_station)
         except Exception:
@@ -8588,7 +11711,7 @@ class TradingUI:
         # Update refuel info
         try:
             if self.refuel_panel.enabled and self.current_planet:
-                planet_obj = next((p for p in planets if getattr(p, 'name', None) == self.current_planet), None)
+                planet_obj = world_registry.planet(self.current_planet)
                 if planet_obj:
                     unit = getattr(planet_obj, 'fuel_price', 5)
                     missing = max(0.0, ship_systems.fuel_system.max_fuel - ship_systems.fuel_system.current_fuel)
@@ -8599,10 +11722,10 @@ class TradingUI:
         
         # Update local knowledge: recent news and visible contracts
         try:
-            knowledge = physical_communication.get_planet_knowledge(self.current_planet)
+            knowledge = physical_communication.get_planet_knowledge(self.current_planet, limit=2)
             news_lines = []
-            for news in knowledge.get('news', [])[-2:]:
-                age_h = (time.time() - news.timestamp) / 3600
+            for news in knowledge.get('news', []):
+                age_h = (sim_clock.now - news.timestamp) / 3600
                 badge = '✔️' if news.reliability >= 0.9 else ('~' if news.reliability >= 0.6 else '❓')
                 news_lines.append(f"{badge} {news.headline} ({news.reliability:.0%}, {age_h:.1f}h)")
             contracts = contract_registry.get_local_contract_summaries(self.current_planet)
@@ -8668,7 +11791,7 @@ class TradingUI:
         try:
             if not self.current_planet:
                 return
-            planet_obj = next((p for p in planets if getattr(p, 'name', None) == self.current_planet), None)
+            planet_obj = world_registry.planet(self.current_planet)
             if not planet_obj or not getattr(planet_obj, 'has_fuel_station', False):
                 return
             unit_price = getattr(planet_obj, 'fuel_price', 5)
@@ -8690,7 +11813,7 @@ class TradingUI:
         try:
             if not self.current_planet:
                 return
-            planet_obj = next((p for p in planets if getattr(p, 'name', None) == self.current_planet), None)
+            planet_obj = world_registry.planet(self.current_planet)
             if not planet_obj or not getattr(planet_obj, 'has_fuel_station', False):
                 return
             unit_price = getattr(planet_obj, 'fuel_price', 5)
@@ -9309,7 +12432,7 @@ class MissionUI:
         # Build content from dynamic contracts
         self._available_index_to_id.clear()
         lines = ["AVAILABLE CONTRACTS:\n"]
-        now = time.time()
+        now = sim_clock.now
         # Knowledge-gated available contracts: only show if current planet likely knows the destination
         gated_available = []
         try:
@@ -9322,8 +12445,7 @@ class MissionUI:
                 if current_planet_name == dest:
                     gated_available.append(c)
                     continue
-                knowledge = physical_communication.get_planet_knowledge(current_planet_name)
-                knows = any((dest in n.details) or (dest in n.headline) for n in knowledge.get('news', []))
+                knows = physical_communication.knows_about(current_planet_name, ('planet', dest))
                 if knows:
                     gated_available.append(c)
         except Exception:
@@ -9377,8 +12499,7 @@ class MissionUI:
                     dest = contract.metadata.get('dest') if (contract and contract.metadata) else None
                     current_planet_name = getattr(scene_manager.current_planet, 'name', None)
                     if dest and current_planet_name and current_planet_name != dest:
-                        knowledge = physical_communication.get_planet_knowledge(current_planet_name)
-                        knows = any((dest in n.details) or (dest in n.headline) for n in knowledge.get('news', []))
+                        knows = physical_communication.knows_about(current_planet_name, ('planet', dest))
                         if not knows:
                             print(f"ℹ️ Destination {dest} is unknown here. Visit planets to learn more or wait for news.")
                             try:
@@ -9525,29 +12646,433 @@ class TipsHUD:
 tips_hud = TipsHUD()
 
 # Frame rate limiting and smoothing variables
+def _step_enhanced_features():
+    # Update enhanced Pirates! features
+    enhanced_features.update(sim_clock.dt, player.position, sim_clock.now)
+    # Decay faction heat slowly
+    try:
+        faction_system.decay_heat(sim_clock.dt)
+    except Exception:
+        pass
+
+# ===== SIMULATION LOD =====
+
+class FarTransit:
+    """A transport ship's remaining lane, followed analytically while it is far from the player"""
+    __slots__ = ('ship', 'points', 'lengths', 'speed', 'started', 'job')
+
+    def __init__(self, ship, points, speed, started):
+        self.ship = ship
+        self.points = points
+        self.lengths = [(b - a).length() for a, b in zip(points, points[1:])]
+        self.speed = max(0.1, float(speed))
+        self.started = started
+        self.job = None
+
+    @property
+    def duration(self):
+        return sum(self.lengths) / self.speed
+
+    def locate(self, now):
+        """(position, index of the next lane point) after flying until `now`"""
+        travelled = max(0.0, now - self.started) * self.speed
+        for i, length in enumerate(self.lengths):
+            if travelled < length:
+                a, b = self.points[i], self.points[i + 1]
+                return a + (b - a) * (travelled / length), i + 1
+            travelled -= length
+        return self.points[-1], len(self.points) - 1
+
+    def apply(self, now):
+        """Write the analytic position and remaining waypoints back onto the ship"""
+        position, nxt = self.locate(now)
+        self.ship.position = position
+        if hasattr(self.ship, 'waypoints'):
+            self.ship.waypoints = list(self.points[nxt:-1])
+
+class SimulationLOD:
+    """Two-tier world simulation: full fidelity near the player, aggregate model elsewhere.
+
+    The anchor is the player in space (or the planet they are on). Economies of planets
+    within `detail_radius` run every tick as before. The rest are split into round-robin
+    buckets; each tick one bucket advances by the time it is owed, so a far economy does
+    one bulk production/manufacturing update every `far_economy_interval_sec`.
+
+    Message, cargo and payment ships beyond the radius stop per-tick movement and become
+    FarTransits along their remaining lane; arrival fires from sim_scheduler and cargo
+    can be lost to pirates with a per-trip probability from the destination's threat
+    level. Anything that comes back within range is promoted at the exact position and
+    route point the analytic model has reached, so the handover is not visible.
+    """
+    DORMANT_KINDS = ('message', 'cargo', 'payment')
+
+    def __init__(self):
+        self.anchor = None
+        self._near = {}      # planet name -> economy at full fidelity
+        self._buckets = []   # [{planet name: economy}] stepped round-robin
+        self._bucket_of = {} # planet name -> bucket index
+        self._engines = {}   # bucket index -> VectorEconomyEngine
+        self._next_bucket = 0
+        self._stale = True
+        self.transits = {}   # id(ship) -> FarTransit
+        self.promotions = 0
+        self.demotions = 0
+        self.far_losses = 0
+        self._job = sim_scheduler.every(lambda: SETTINGS['lod'].get('refresh_interval_sec', 1.0), self.refresh,
+                                        jitter=0, first_delay=0, name='simulation_lod', owner=self)
+
+    def invalidate(self):
+        """Re-partition every economy on the next tick (planets or economies were replaced)"""
+        self._stale = True
+
+    def reset(self):
+        for transit in self.transits.values():
+            if transit.job is not None:
+                transit.job.cancelled = True
+        self.transits.clear()
+        self.invalidate()
+
+    def _update_anchor(self):
+        try:
+            if scene_manager.current_state == GameState.SPACE and scene_manager.space_controller:
+                self.anchor = Vec3(*ShipKinematics._xyz(scene_manager.space_controller.position))
+            elif getattr(scene_manager.current_planet, 'position', None) is not None:
+                self.anchor = scene_manager.current_planet.position
+        except Exception:
+            pass
+
+    def _near_planets(self, radius):
+        """name -> planet within radius of the anchor (every planet before an anchor is known)"""
+        if self.anchor is None:
+            return {p.name: p for p in planets}
+        return {p.name: p for p in galaxy_graph.within(self.anchor, radius)}
+
+    def _bucket_count(self):
+        interval = SETTINGS['lod'].get('far_economy_interval_sec', 5.0)
+        return max(1, int(round(interval / max(1e-6, sim_clock.tick_seconds))))
+
+    def _make_far(self, name, economy, since=None):
+        economy._lod_last = sim_clock.now if since is None else since
+        index = (self._next_bucket + len(self._bucket_of)) % len(self._buckets)
+        self._buckets[index][name] = economy
+        self._bucket_of[name] = index
+
+    def _make_near(self, name, economy):
+        index = self._bucket_of.pop(name, None)
+        if index is not None:
+            self._buckets[index].pop(name, None)
+            # Catch up on the time this economy spent in the aggregate model
+            owed = sim_clock.now - getattr(economy, '_lod_last', sim_clock.now)
+            if owed > 0:
+                economy.step_production(owed)
+                economy.update_logistics(owed)
+            economy._lod_last = sim_clock.now
+            self.promotions += 1
+        self._near[name] = economy
+
+    def _repartition(self):
+        near_names = self._near_planets(SETTINGS['lod'].get('detail_radius', 2000.0))
+        for name, economy in self._near.items():
+            economy._lod_last = sim_clock.now
+        self._near = {}
+        self._buckets = [{} for _ in range(self._bucket_count())]
+        self._bucket_of = {}
+        self._engines = {}
+        for p in planets:
+            economy = getattr(p, 'enhanced_economy', None)
+            if economy is None:
+                continue
+            if p.name in near_names:
+                self._near[p.name] = economy
+            else:
+                self._make_far(p.name, economy, since=getattr(economy, '_lod_last', None))
+        self._stale = False
+
+    def refresh(self):
+        """Move planets and ships between tiers around the current anchor"""
+        self._update_anchor()
+        if self._stale or not self._buckets:
+            self._repartition()
+        else:
+            radius = SETTINGS['lod'].get('detail_radius', 2000.0)
+            margin = SETTINGS['lod'].get('detail_hysteresis', 200.0)
+            inner = self._near_planets(radius)
+            outer = self._near_planets(radius + margin)
+            for name, planet in inner.items():
+                economy = getattr(planet, 'enhanced_economy', None)
+                if name not in self._near and economy is not None:
+                    self._make_near(name, economy)
+            for name in [n for n in self._near if n not in outer]:
+                economy = self._near.pop(name)
+                self._make_far(name, economy)
+                self.demotions += 1
+        self._refresh_ships()
+
+    def near_economies(self):
+        if self._stale:
+            self._repartition()
+        return list(self._near.values())
+
+    def step_far_economies(self):
+        """Advance one round-robin bucket of far economies by the time each is owed"""
+        if not self._buckets:
+            return
+        index = self._next_bucket % len(self._buckets)
+        self._next_bucket = index + 1
+        bucket = list(self._buckets[index].values())
+        if not bucket:
+            return
+        now = sim_clock.now
+        owed = [now - getattr(e, '_lod_last', now) for e in bucket]
+        if (np is not None and SETTINGS.get('vectorized_economy', True)
+                and len(bucket) >= SETTINGS.get('vectorized_economy_min_planets', 32)):
+            engine = self._engines.get(index)
+            if engine is None:
+                engine = self._engines[index] = VectorEconomyEngine()
+            engine.step(bucket, owed)
+        else:
+            for economy, dt in zip(bucket, owed):
+                if dt > 0:
+                    economy.step_production(dt)
+        for economy, dt in zip(bucket, owed):
+            if dt > 0:
+                economy.update_logistics(dt)
+            economy._lod_last = now
+
+    # -- ships --
+
+    def _refresh_ships(self):
+        if self.anchor is None:
+            return
+        radius = SETTINGS['lod'].get('detail_radius', 2000.0)
+        far = radius + SETTINGS['lod'].get('detail_hysteresis', 200.0)
+        now = sim_clock.now
+        for transit in list(self.transits.values()):
+            position, _ = transit.locate(now)
+            if (position - self.anchor).length() < radius:
+                self.promote(transit.ship)
+        manager = unified_transport_system
+        for kind, ships in manager.ship_groups():
+            if kind not in self.DORMANT_KINDS:
+                continue
+            for ship in ships:
+                if id(ship) in self.transits or not self._can_demote(ship):
+                    continue
+                if manager.kinematics is not None:
+                    manager.kinematics.push(ship)
+                if (ship.position - self.anchor).length() > far:
+                    self.demote(ship)
+
+    @staticmethod
+    def _can_demote(ship):
+        return (not getattr(ship, 'delivered', False) and not getattr(ship, 'retreating', False)
+                and not getattr(ship, '_boarding_window_open', False)
+                and hasattr(getattr(ship, 'destination', None), 'position'))
+
+    def demote(self, ship):
+        """Take a ship off per-tick simulation and fly it analytically"""
+        manager = unified_transport_system
+        if manager.kinematics is not None:
+            manager.kinematics.push(ship)
+        manager.forget_ship(ship)
+        points = [ship.position] + list(getattr(ship, 'waypoints', None) or []) + [ship.destination.position]
+        transit = FarTransit(ship, points, getattr(ship, 'speed', 10.0), sim_clock.now)
+        delay, callback = transit.duration, self._arrive
+        if isinstance(ship, CargoShip):
+            lost_at = self._roll_loss(ship, transit)
+            if lost_at is not None:
+                delay, callback = lost_at, self._lose
+        transit.job = sim_scheduler.after(delay, lambda: callback(transit), name='far_transit', owner=self)
+        self.transits[id(ship)] = transit
+        ship._far_transit = transit
+        ship.enabled = False
+        self.demotions += 1
+
+    def promote(self, ship):
+        """Return a ship to per-tick simulation where its transit has taken it"""
+        transit = self.transits.pop(id(ship), None)
+        if transit is None:
+            return
+        if transit.job is not None:
+            transit.job.cancelled = True
+        transit.apply(sim_clock.now)
+        ship._far_transit = None
+        ship.enabled = True
+        unified_transport_system.refresh_route(ship)
+        self.promotions += 1
+
+    def _roll_loss(self, ship, transit):
+        """Sim seconds until the cargo is lost to pirates, or None if it gets through"""
+        try:
+            threat = physical_communication.estimate_planet_threat(ship.destination.name)
+        except Exception:
+            threat = 'UNKNOWN'
+        rate = SETTINGS['lod'].get('far_loss_per_trip', {}).get(threat, 0.0)
+        try:
+            trip = max(1.0, (ship.origin.position - ship.destination.position).length())
+            rate *= min(1.0, sum(transit.lengths) / trip)
+        except Exception:
+            pass
+        if random.random() >= rate:
+            return None
+        return transit.duration * random.uniform(0.2, 0.9)
+
+    def _finish(self, transit):
+        ship = transit.ship
+        if self.transits.get(id(ship)) is not transit:
+            return None
+        del self.transits[id(ship)]
+        ship._far_transit = None
+        if not any(ship in ships for _, ships in unified_transport_system.ship_groups()):
+            return None  # Removed elsewhere (reload, destroyed) while in transit
+        transit.apply(sim_clock.now)
+        return ship
+
+    def _arrive(self, transit):
+        ship = self._finish(transit)
+        if ship is None:
+            return
+        ship.position = ship.destination.position
+        ship.on_arrival()
+        if getattr(ship, 'delivered', False):
+            unified_transport_system.remove_ship(ship)
+        else:
+            ship.enabled = True  # Courier with more stops: next refresh decides its tier
+
+    def _lose(self, transit):
+        ship = self._finish(transit)
+        if ship is None:
+            return
+        self.far_losses += 1
+        print(f"💀 Cargo to {getattr(ship.destination, 'name', 'Unknown')} lost to pirates in deep space: {ship.get_cargo_description()}")
+        try:
+            if getattr(ship.destination, 'enhanced_economy', None):
+                ship.destination.enhanced_economy.record_pirate_attack()
+            if hasattr(ship, 'contract_id'):
+                contract_registry.cargo_lost(ship.contract_id)
+        except Exception:
+            pass
+        unified_transport_system.remove_ship(ship)
+
+    def sync_ships(self):
+        """Write analytic positions onto dormant ships (for saves) without promoting them"""
+        now = sim_clock.now
+        for transit in self.transits.values():
+            transit.apply(now)
+
+    def stats(self):
+        return {'near_planets': len(self._near), 'far_planets': len(self._bucket_of),
+                'far_ships': len(self.transits), 'promotions': self.promotions,
+                'demotions': self.demotions, 'far_losses': self.far_losses}
+
+simulation_lod = SimulationLOD()
+
+def _step_planet_economies():
+    if SETTINGS['lod'].get('two_tier', True):
+        economies = simulation_lod.near_economies()
+        simulation_lod.step_far_economies()
+    else:
+        economies = [p.enhanced_economy for p in planets if getattr(p, 'enhanced_economy', None)]
+    if (economy_engine is not None and SETTINGS.get('vectorized_economy', True)
+            and len(economies) >= SETTINGS.get('vectorized_economy_min_planets', 32)):
+        # Production for every planet in one array pass, then per-planet logistics
+        economy_engine.step(economies, sim_clock.dt)
+        step_name = 'update_logistics'
+    else:
+        step_name = 'update'
+    if not frame_profiler.enabled:
+        for economy in economies:
+            getattr(economy, step_name)()
+        return
+    # One sample per planet so the percentiles show the cost of a single economy
+    for economy in economies:
+        started = perf_counter()
+        getattr(economy, step_name)()
+        frame_profiler.record('planet_economy', perf_counter() - started)
+
+def _step_contract_registry():
+    # Update contract registry for physical knowledge/inquiry
+    try:
+        contract_registry.update()
+    except Exception:
+        pass
+
+# Ordered (name, callable) pairs run once per fixed tick; names are used for profiling
+SIMULATION_SUBSYSTEMS = [
+    ('time', lambda: time_system.update()),
+    ('scheduler', lambda: sim_scheduler.run_due()),
+    ('communication', lambda: physical_communication.update()),
+    ('enhanced_features', _step_enhanced_features),
+    ('transport', lambda: unified_transport_system.update()),
+    ('economies', _step_planet_economies),
+    ('weather', lambda: weather_system.update()),
+    ('military', lambda: military_manager.update()),
+    ('dynamic_contracts', lambda: dynamic_contracts.update()),
+    ('contract_registry', _step_contract_registry),
+]
+
+def simulation_step(timings=None):
+    """Advance every simulation subsystem by one fixed tick of sim_clock.
+
+    If `timings` is a dict, wall seconds spent in each subsystem are added to it.
+    With GAME_PROFILE=1 each call is also fed to frame_profiler.
+    """
+    profiling = frame_profiler.enabled
+    if timings is None and not profiling:
+        for _, step in SIMULATION_SUBSYSTEMS:
+            step()
+        return
+    tick_started = perf_counter()
+    for name, step in SIMULATION_SUBSYSTEMS:
+        started = perf_counter()
+        step()
+        elapsed = perf_counter() - started
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + elapsed
+        if profiling:
+            frame_profiler.record(name, elapsed)
+    if profiling:
+        frame_profiler.end_tick(perf_counter() - tick_started)
+
+def sanitize_world():
+    """World sanitization: enforce invariants (no negative stockpiles/credits)"""
+    for p in planets:
+        econ = getattr(p, 'enhanced_economy', None)
+        if econ:
+            for k in list(econ.stockpiles.keys()):
+                if econ.stockpiles[k] < 0:
+                    econ.stockpiles[k] = 0
+            if econ.credits < 0:
+                econ.credits = 0
+
+# Wall-clock housekeeping, driven once per frame from update(); intervals follow SETTINGS
+frame_scheduler.every(lambda: SETTINGS.get('sanitize_interval_sec', 30), sanitize_world,
+                      jitter=0, first_delay=SETTINGS.get('sanitize_interval_sec', 30), name='sanitize')
+# Periodic autosave every 2 minutes
+frame_scheduler.every(lambda: SETTINGS.get('autosave_interval_sec', 120), lambda: save_game(),
+                      jitter=0, first_delay=SETTINGS.get('autosave_interval_sec', 120), name='autosave')
+
 _last_update_time = 0
 _target_fps = 60
 _frame_time = 1.0 / _target_fps
 
-def update():
+def _update_frame():
+    """One engine frame; returns False when the frame limiter skipped it"""
     global nearby_planet, _last_update_time
     
     # Frame rate limiting to reduce flickering
     current_time = time.time()
     if current_time - _last_update_time < _frame_time:
-        return
+        return False
+    # Real time since the last processed frame (skipped frames included), capped so a
+    # long stall (debugger, window drag) does not dump minutes into the sim accumulator
+    frame_elapsed = min(current_time - _last_update_time, 0.25) if _last_update_time else _frame_time
     _last_update_time = current_time
     
     if not paused and not ui_manager.any_active():
         if scene_manager.current_state == GameState.SPACE:
             # Check if player is near any planet (anti-flicker via hysteresis)
-            nearest_planet = None
-            nearest_dist = float('inf')
-            for planet in planets:
-                d = (planet.position - player.position).length()
-                if d < nearest_dist:
-                    nearest_dist = d
-                    nearest_planet = planet
+            nearest_planet, nearest_dist = nearest_planet_to(player.position)
 
             # Evaluate show/hide using thresholds
             if landing_prompt_active:
@@ -9624,68 +13149,29 @@ def update():
                         scene_manager.interact_prompt.text = f"Press E for {nearest_kind}"
                         scene_manager.interact_prompt.enabled = True
                     
-    # Update time system
-    time_system.update()
-    
-    # Update physical communication system
-    physical_communication.update()
-    
-    # Update enhanced Pirates! features
-    enhanced_features.update(time.dt, player.position, time.time())
-    # Decay faction heat slowly
-    try:
-        faction_system.decay_heat(time.dt)
-    except Exception:
-        pass
-    # World sanitization: enforce invariants periodically
-    try:
-        if not hasattr(update, '_last_sanitize'):
-            update._last_sanitize = time.time()
-        if time.time() - update._last_sanitize > SETTINGS.get('sanitize_interval_sec', 30):
-            # No negative stockpiles/credits
-            for p in planets:
-                econ = getattr(p, 'enhanced_economy', None)
-                if econ:
-                    for k in list(econ.stockpiles.keys()):
-                        if econ.stockpiles[k] < 0:
-                            econ.stockpiles[k] = 0
-                    if econ.credits < 0:
-                        econ.credits = 0
-            update._last_sanitize = time.time()
-    except Exception:
-        pass
+    # Advance the simulation in fixed ticks; wall time only feeds the accumulator
+    for _ in range(sim_clock.advance(frame_elapsed)):
+        sim_clock.begin_tick()
+        simulation_step()
+    sim_clock.end_frame()
+    # Wall-clock jobs (world sanitization, autosave)
+    frame_scheduler.run_due()
     
-    # Update unified transport system
-    unified_transport_system.update()
-    
-    # Update planet economies
-    for planet in planets:
-        if hasattr(planet, 'enhanced_economy') and planet.enhanced_economy:
-            planet.enhanced_economy.update()
-            
-    # Update new persistent systems
-    weather_system.update()
-    military_manager.update()
-    dynamic_contracts.update()
-    # Update contract registry for physical knowledge/inquiry
-    try:
-        contract_registry.update()
-    except Exception:
-        pass
     # Tips HUD update
     try:
         tips_hud.update()
     except Exception:
         pass
-    # Periodic autosave every 2 minutes
-    try:
-        if not hasattr(update, '_last_autosave'):
-            update._last_autosave = time.time()
-        if time.time() - update._last_autosave > SETTINGS.get('autosave_interval_sec', 120):
-            save_game()
-            update._last_autosave = time.time()
-    except Exception:
-        pass
+    return True
+
+def update():
+    if not frame_profiler.enabled:
+        _update_frame()
+        return
+    # Whole-frame cost (sim ticks plus UI, prompts, scenes and frame_scheduler jobs)
+    started = perf_counter()
+    if _update_frame():
+        frame_profiler.record('frame', perf_counter() - started)
 
 # Function to handle landing
 def land_on_planet():
@@ -9863,6 +13349,10 @@ def input(key):
         pause_panel.enabled = paused
         save_button.enabled = paused
         load_button.enabled = paused
+        if paused:
+            summary = describe_latest_save()
+            load_button.text = f'Load Game ({summary})' if summary else 'Load Game'
+
         quit_button.enabled = paused
         # Enable/disable settings controls together with pause panel
         try:
@@ -9899,6 +13389,14 @@ def input(key):
         time_system.set_day_length(300)
         print(f"⏱️ Reset time speed to {time_system.get_speed_label()}")
         return
+    elif key == ',':
+        sim_clock.set_time_scale(sim_clock.time_scale / 2.0)
+        print(f"⏱️ Simulation rate: {sim_clock.get_scale_label()}")
+        return
+    elif key == '.':
+        sim_clock.set_time_scale(max(1.0, sim_clock.time_scale * 2.0))
+        print(f"⏱️ Simulation rate: {sim_clock.get_scale_label()}")
+        return
     
     if key == 'e' and not paused:
         # Context-sensitive interact
@@ -10011,11 +13509,11 @@ def input(key):
                     num_escorts = 3
                 for _ in range(num_escorts):
                     pos = player.position + Vec3(random.uniform(-20, 20), 0, random.uniform(-20, 20))
-                    escort = MilitaryShip(faction_id, MilitaryShipType.ESCORT, pos, patrol_radius=150)
+                    escort = MilitaryShip.spawn(faction_id, MilitaryShipType.ESCORT, pos, patrol_radius=150)
                     escort.follow_player = True
                     escort.patrol_center = pos
                     # Auto-expire after some time
-                    escort._despawn_time = time.time() + 180  # 3 minutes
+                    escort._despawn_time = sim_clock.now + 180  # 3 minutes
                     military_manager.military_ships.append(escort)
             except Exception:
                 pass
@@ -10132,7 +13630,7 @@ def input(key):
         # Show active contracts
         print("\n📋 ACTIVE CONTRACTS:")
         for i, contract in enumerate(dynamic_contracts.active_contracts):
-            elapsed_time = time.time() - contract.start_time
+            elapsed_time = sim_clock.now - contract.start_time
             remaining_time = contract.time_limit - elapsed_time
             print(f"{i+1}. {contract.title}")
             print(f"   Status: {contract.status.value}")
@@ -10426,5 +13924,6 @@ try:
 except Exception as e:
     print(f"⚠️ Some rendering optimizations failed: {e}")
 
-# Run the game
-app.run() 
\ No newline at end of file
+# Run the game (importing the module, e.g. from the headless world runner, only builds the world)
+if __name__ == '__main__':
+    app.run()
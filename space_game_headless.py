@@ -11,6 +11,7 @@ import logging
 import traceback
 import time
 import signal
+import contextlib
 
 # Setup logging
 verbose = os.environ.get('GAME_VERBOSE', '0') == '1'
@@ -171,6 +172,145 @@ class HeadlessGameRunner:
             print(f"\n💥 ECONOMIC SIMULATION CRASHED: {e}")
             return 1
     
+    def run_world_simulation(self, days=1, tick_seconds=0.2, quiet=True):
+        """Build the real space_game world without Ursina and fast-forward it"""
+        logger.info(f"Starting {days}-day full world simulation (tick {tick_seconds}s)...")
+        
+        try:
+            # The real game module switches to mock engine components in headless mode
+            os.environ['GAME_HEADLESS_MODE'] = '1'
+            build_started = time.perf_counter()
+            with open(os.devnull, 'w') as sink, (contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext()):
+                import space_game as world
+            build_seconds = time.perf_counter() - build_started
+            
+            clock = world.sim_clock
+            clock.tick_seconds = float(tick_seconds)
+            start_day = world.time_system.game_day
+            target_day = start_day + days
+            timings = {}
+            ticks = 0
+            
+            print(f"\n🌌 WORLD SIMULATION - {days} DAYS")
+            print("=" * 50)
+            print(f"World built in {build_seconds:.2f}s: {len(world.planets)} planets, "
+                  f"{len(world.military_manager.military_ships)} military ships")
+            
+            self.running = True
+            started = time.perf_counter()
+            sim_started = clock.now
+            last_day = start_day
+            # Game chatter (ship launches, deliveries) is discarded unless quiet is off
+            with open(os.devnull, 'w') as sink, (contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext()):
+                while self.running and world.time_system.game_day < target_day:
+                    clock.begin_tick()
+                    world.simulation_step(timings)
+                    ticks += 1
+                    if world.time_system.game_day != last_day:
+                        last_day = world.time_system.game_day
+                        logger.info(f"Day {last_day - start_day}/{days} reached after "
+                                    f"{time.perf_counter() - started:.1f}s")
+            clock.end_frame()
+            wall_seconds = time.perf_counter() - started
+            
+            sim_days = world.time_system.game_day - start_day
+            sim_seconds = clock.now - sim_started
+            transport = world.unified_transport_system
+            
+            print("\n📊 SIMULATION RESULTS:")
+            print("-" * 30)
+            print(f"Simulated days: {sim_days} ({sim_seconds:.0f}s sim time, {ticks} ticks)")
+            print(f"Wall time: {wall_seconds:.2f}s")
+            if wall_seconds > 0:
+                print(f"Speed: {sim_days / wall_seconds:.3f} sim-days/sec "
+                      f"(x{sim_seconds / wall_seconds:.1f} real time)")
+            peak = self._peak_memory_mb()
+            if peak is not None:
+                print(f"Peak memory: {peak:.1f} MB")
+            print(f"Ships in flight: {len(transport.cargo_ships)} cargo, {len(transport.message_ships)} message, "
+                  f"{len(transport.payment_ships)} payment, {len(transport.raiders)} raiders")
+            
+            total = sum(timings.values()) or 1.0
+            print("\n⏱️ TIME PER SUBSYSTEM:")
+            for name, seconds in sorted(timings.items(), key=lambda kv: kv[1], reverse=True):
+                per_tick_ms = seconds / ticks * 1000.0 if ticks else 0.0
+                print(f"  {name:<18} {seconds:8.2f}s  {seconds / total * 100:5.1f}%  {per_tick_ms:.3f} ms/tick")
+            
+            # Rolling percentiles over the last window of ticks when GAME_PROFILE=1
+            if world.frame_profiler.enabled:
+                print("\n📈 SUBSYSTEM PERCENTILES (recent ticks):")
+                for line in world.frame_profiler.summary_lines(limit=len(timings) + 2):
+                    print(f"  {line}")
+                world.frame_profiler.flush()
+            
+            logger.info(f"World simulation completed: {sim_days} days in {wall_seconds:.2f}s")
+            return 0
+            
+        except Exception as e:
+            logger.error(f"Error during world simulation: {e}")
+            logger.error(traceback.format_exc())
+            print(f"\n💥 WORLD SIMULATION CRASHED: {e}")
+            return 1
+    
+    def run_graph_check(self, count=3000):
+        """Build a galaxy graph planet by planet and check it matches a bulk rebuild"""
+        logger.info(f"Starting galaxy graph check with {count} planets...")
+        
+        try:
+            os.environ['GAME_HEADLESS_MODE'] = '1'
+            with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+                import space_game as world
+            import random
+            from types import SimpleNamespace
+            
+            rng = random.Random(1)
+            radius = 500.0 * max(1.0, count / 15.0) ** 0.5
+            points = [SimpleNamespace(name=f"P{i}", position=world.Vec3(rng.uniform(-radius, radius),
+                                                                        rng.uniform(-500, 500),
+                                                                        rng.uniform(-radius, radius)))
+                      for i in range(count)]
+            
+            print(f"\n🕸️ GALAXY GRAPH CHECK - {count} PLANETS")
+            print("=" * 50)
+            started = time.perf_counter()
+            bulk = world.GalaxyGraph()
+            bulk.rebuild(points)
+            rebuild_seconds = time.perf_counter() - started
+            
+            # Incremental: insert every planet, then drop a tenth and put them back
+            started = time.perf_counter()
+            incremental = world.GalaxyGraph()
+            for point in points:
+                incremental.add(point)
+            for point in points[::10]:
+                incremental.remove(point)
+            for point in points[::10]:
+                incremental.add(point)
+            add_seconds = time.perf_counter() - started
+            
+            matches = incremental.adjacency == bulk.adjacency
+            print(f"rebuild(): {rebuild_seconds:.2f}s")
+            print(f"add()/remove(): {add_seconds:.2f}s for {count + 2 * len(points[::10])} operations")
+            print(f"Adjacency matches: {'yes' if matches else 'NO'}")
+            logger.info(f"Galaxy graph check completed in {rebuild_seconds + add_seconds:.2f}s")
+            return 0 if matches else 1
+            
+        except Exception as e:
+            logger.error(f"Error during galaxy graph check: {e}")
+            logger.error(traceback.format_exc())
+            print(f"\n💥 GALAXY GRAPH CHECK CRASHED: {e}")
+            return 1
+    
+    def _peak_memory_mb(self):
+        """Peak resident memory of this process in MB (None where unsupported)"""
+        try:
+            import resource
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ru_maxrss is bytes on macOS, kilobytes elsewhere
+            return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+        except Exception:
+            return None
+    
     def run_interactive_mode(self):
         """Run interactive headless mode"""
         logger.info("Starting interactive headless mode...")
@@ -199,6 +339,24 @@ class HeadlessGameRunner:
                         except ValueError:
                             print("Invalid number of days, using default (30)")
                     self.run_economic_simulation(days)
+                elif command.startswith('world'):
+                    parts = command.split()
+                    days = 1
+                    if len(parts) > 1:
+                        try:
+                            days = int(parts[1])
+                        except ValueError:
+                            print("Invalid number of days, using default (1)")
+                    self.run_world_simulation(days)
+                elif command.startswith('graph'):
+                    parts = command.split()
+                    count = 3000
+                    if len(parts) > 1:
+                        try:
+                            count = int(parts[1])
+                        except ValueError:
+                            print("Invalid planet count, using default (3000)")
+                    self.run_graph_check(count)
                 elif command == 'status':
                     self.show_system_status()
                 else:
@@ -223,6 +381,8 @@ class HeadlessGameRunner:
         print("  help          - Show this help message")
         print("  test          - Run stability tests")
         print("  sim [days]    - Run economic simulation (default 30 days)")
+        print("  world [days]  - Fast-forward the full game world (default 1 day)")
+        print("  graph [count] - Check incremental galaxy graph against a bulk rebuild")
         print("  status        - Show system status")
         print("  quit / exit   - Exit the program")
     
@@ -255,11 +415,30 @@ def main():
                 except ValueError:
                     print("Invalid number of days, using default (30)")
             return runner.run_economic_simulation(days)
+        elif sys.argv[1] == 'world':
+            days = 1
+            tick_seconds = 0.2
+            try:
+                if len(sys.argv) > 2:
+                    days = int(sys.argv[2])
+                if len(sys.argv) > 3:
+                    tick_seconds = float(sys.argv[3])
+            except ValueError:
+                print("Invalid arguments, using defaults (1 day, 0.2s tick)")
+            return runner.run_world_simulation(days, tick_seconds)
+        elif sys.argv[1] == 'graph':
+            count = 3000
+            if len(sys.argv) > 2:
+                try:
+                    count = int(sys.argv[2])
+                except ValueError:
+                    print("Invalid planet count, using default (3000)")
+            return runner.run_graph_check(count)
         elif sys.argv[1] == 'interactive':
             return runner.run_interactive_mode()
         else:
             print(f"Unknown command: {sys.argv[1]}")
-            print("Available commands: test, sim [days], interactive")
+            print("Available commands: test, sim [days], world [days] [tick_seconds], graph [count], interactive")
             return 1
     else:
         # Default to interactive mode